@@ -15,15 +15,46 @@ Callsign: KO4TUV (configured for this station)
 """
 
 import logging
-import re
+import math
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 from .cat import FT991A, Mode
 
+# No TNC (hardware, direwolf or sound card AFSK) driver is implemented yet, so packets can't go out
+TNC_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Characters allowed in the base callsign (APRS is 7-bit ASCII)
+_CALLSIGN_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+
+def _valid_callsign(callsign: str) -> bool:
+    """Check an upper-case callsign with optional SSID 1-15 (e.g. KO4TUV, G0ABC-1)"""
+    base, dash, ssid = callsign.partition("-")
+    if not 1 <= len(base) <= 6 or not _CALLSIGN_CHARS.issuperset(base):
+        return False
+    if dash:
+        # AX.25 SSIDs are 4 bits; -0 is written as no SSID
+        return ssid.isascii() and ssid.isdigit() and ssid[0] != "0" and int(ssid) <= 15
+    return True
+
+
+def _deg_to_aprs(x: float) -> Tuple[int, float]:
+    """Split |x| decimal degrees into whole degrees and minutes (one modf call)"""
+    frac, whole = math.modf(abs(x))
+    return int(whole), frac * 60
+
 
 class APRSPacketType(Enum):
     """APRS packet types based on data type identifier"""
@@ -172,7 +203,7 @@ class APRSClient:
         self.emergency_kit = EmergencyKit()
 
         # Validate callsign format
-        if not re.match(r"^[A-Z0-9]{1,6}(-[1-9][0-9]?)?$", self.callsign):
+        if not _valid_callsign(self.callsign):
             raise ValueError(f"Invalid callsign format: {self.callsign}")
 
     def setup_aprs(self) -> bool:
@@ -236,30 +267,77 @@ class APRSClient:
         """
         try:
             # Convert decimal degrees to APRS format (DDMM.MM)
-            lat_deg = int(abs(lat))
-            lat_min = (abs(lat) - lat_deg) * 60
+            lat_deg, lat_min = _deg_to_aprs(lat)
             lat_ns = "N" if lat >= 0 else "S"
-            lat_str = f"{lat_deg:02d}{lat_min:05.2f}{lat_ns}"
 
-            lon_deg = int(abs(lon))
-            lon_min = (abs(lon) - lon_deg) * 60
+            lon_deg, lon_min = _deg_to_aprs(lon)
             lon_ew = "E" if lon >= 0 else "W"
-            lon_str = f"{lon_deg:03d}{lon_min:05.2f}{lon_ew}"
-
-            # Build position string
-            position = f"{lat_str}{symbol_table}{lon_str}{symbol_code}"
 
-            # Build complete packet
-            path = "APRS,WIDE1-1,WIDE2-1"  # Standard APRS path
-            packet = f"{callsign}>{path}:!{position}{comment}"
+            # Build complete packet over the standard APRS path in one pass
+            packet = (
+                f"{callsign}>APRS,WIDE1-1,WIDE2-1:!"
+                f"{lat_deg:02d}{lat_min:05.2f}{lat_ns}{symbol_table}{lon_deg:03d}{lon_min:05.2f}{lon_ew}{symbol_code}"
+                f"{comment}"
+            )
 
-            logger.debug(f"Encoded position packet: {packet}")
+            logger.debug("Encoded position packet: %s", packet)
             return packet
 
         except Exception as e:
             logger.error(f"Failed to encode position: {e}")
             raise ValueError(f"Position encoding failed: {e}")
 
+    def encode_aprs_positions(
+        self,
+        callsigns: Sequence[str],
+        lats: Sequence[float],
+        lons: Sequence[float],
+        comments: Sequence[str],
+        symbol_table: str = "/",
+        symbol_code: str = ">",
+    ) -> List[str]:
+        """
+        Encode a batch of APRS position packets.
+
+        Same packets as encode_aprs_position(), but the degree/minute split is
+        done for the whole batch at once (vectorized when NumPy is installed).
+
+        Args:
+            callsigns: Station callsign per packet
+            lats: Latitudes in decimal degrees (array-like)
+            lons: Longitudes in decimal degrees (array-like)
+            comments: Comment text per packet
+            symbol_table: Symbol table for every packet
+            symbol_code: Symbol code for every packet
+
+        Returns:
+            List[str]: One APRS packet string per input row
+        """
+        if NUMPY_AVAILABLE:
+            lats = np.asarray(lats, dtype=np.float64)
+            lons = np.asarray(lons, dtype=np.float64)
+            abs_lat, abs_lon = np.abs(lats), np.abs(lons)
+            lat_deg, lon_deg = abs_lat.astype(np.int32), abs_lon.astype(np.int32)
+            lat_min, lon_min = (abs_lat - lat_deg) * 60, (abs_lon - lon_deg) * 60
+            lat_ns = np.where(lats >= 0, "N", "S").tolist()
+            lon_ew = np.where(lons >= 0, "E", "W").tolist()
+            lat_deg, lat_min = lat_deg.tolist(), lat_min.tolist()
+            lon_deg, lon_min = lon_deg.tolist(), lon_min.tolist()
+        else:
+            lat_deg, lat_min = zip(*map(_deg_to_aprs, lats)) if lats else ((), ())
+            lat_ns = ["N" if lat >= 0 else "S" for lat in lats]
+            lon_deg, lon_min = zip(*map(_deg_to_aprs, lons)) if lons else ((), ())
+            lon_ew = ["E" if lon >= 0 else "W" for lon in lons]
+
+        return [
+            f"{callsign}>APRS,WIDE1-1,WIDE2-1:!"
+            f"{la_d:02d}{la_m:05.2f}{ns}{symbol_table}{lo_d:03d}{lo_m:05.2f}{ew}{symbol_code}"
+            f"{comment}"
+            for callsign, la_d, la_m, ns, lo_d, lo_m, ew, comment in zip(
+                callsigns, lat_deg, lat_min, lat_ns, lon_deg, lon_min, lon_ew, comments
+            )
+        ]
+
     def encode_aprs_message(self, source: str, dest: str, message: str, message_id: Optional[str] = None) -> str:
         """
         Encode APRS message packet.
@@ -277,20 +355,12 @@ class APRSClient:
             KO4TUV>APRS,WIDE1-1:N0CALL   :Hello from OpenClaw{001
         """
         try:
-            # Pad destination to 9 characters
-            dest_padded = f"{dest:<9}"[:9]
-
-            # Build message string
+            # Destination padded/truncated to 9 characters; messages typically use a shorter path
+            packet = f"{source}>APRS,WIDE1-1::{dest:<9.9}:{message}"
             if message_id:
-                msg_str = f"{dest_padded}:{message}{{{message_id}"
-            else:
-                msg_str = f"{dest_padded}:{message}"
+                packet += f"{{{message_id}"
 
-            # Build complete packet
-            path = "APRS,WIDE1-1"  # Messages typically use shorter path
-            packet = f"{source}>{path}::{msg_str}"
-
-            logger.debug(f"Encoded message packet: {packet}")
+            logger.debug("Encoded message packet: %s", packet)
             return packet
 
         except Exception as e:
@@ -314,32 +384,40 @@ class APRSClient:
         - Status updates
         """
         try:
-            # Basic packet format: CALL>DEST,PATH:DATA
-            if ":" not in raw_packet:
-                logger.warning(f"Invalid packet format (no data separator): {raw_packet}")
+            if not raw_packet:
                 return None
 
-            header, data = raw_packet.split(":", 1)
+            # Basic packet format: CALL>DEST,PATH:DATA - locate the separators, slice each field once
+            colon = raw_packet.find(":")
+            if colon < 0:
+                logger.warning("Invalid packet format (no data separator): %s", raw_packet)
+                return None
 
             # Parse header: SOURCE>DEST,PATH1,PATH2...
-            if ">" not in header:
-                logger.warning(f"Invalid header format: {header}")
+            gt = raw_packet.find(">", 0, colon)
+            if gt < 0:
+                logger.warning("Invalid header format: %s", raw_packet[:colon])
                 return None
 
-            source_call, dest_path = header.split(">", 1)
-            path_parts = dest_path.split(",")
-            destination = path_parts[0]
-            path = path_parts[1:] if len(path_parts) > 1 else []
+            source_call = raw_packet[:gt]
+            comma = raw_packet.find(",", gt, colon)
+            if comma < 0:
+                destination = raw_packet[gt + 1 : colon]
+                path = []
+            else:
+                destination = raw_packet[gt + 1 : comma]
+                path = raw_packet[comma + 1 : colon].split(",")
 
             # Validate we have actual content
             if not source_call or not destination:
-                logger.warning(f"Missing source or destination: {header}")
+                logger.warning("Missing source or destination: %s", raw_packet[:colon])
                 return None
 
             # Determine packet type from first character of data
-            if not data:
+            if colon + 1 == len(raw_packet):
                 logger.warning("Empty data field")
                 return None
+            data = raw_packet[colon + 1 :]
 
             packet_type = data[0]
             parsed_data = {}
@@ -499,17 +577,19 @@ class APRSClient:
             logger.error("⚠️  Use --confirm flag to acknowledge legal compliance")
             return False
 
-        logger.warning("🚨 TRANSMITTING ON AMATEUR RADIO FREQUENCIES")
-        logger.warning("⚠️  Licensed operator must be physically present")
-        logger.warning(f"📡 Packet: {packet}")
-
-        try:
+        if not TNC_AVAILABLE:
             # Note: Actual transmission would require additional hardware/software
             # for packet encoding (TNC, sound card interface, etc.)
             logger.error("❌ TRANSMISSION HARDWARE NOT IMPLEMENTED")
             logger.error("📋 Packet ready for external TNC/sound card interface")
             logger.error(f"📦 Encoded packet: {packet}")
+            return False
+
+        logger.warning("🚨 TRANSMITTING ON AMATEUR RADIO FREQUENCIES")
+        logger.warning("⚠️  Licensed operator must be physically present")
+        logger.warning(f"📡 Packet: {packet}")
 
+        try:
             # TODO: Implement actual packet transmission via:
             # - Hardware TNC (Terminal Node Controller)
             # - Software TNC (direwolf, etc.)
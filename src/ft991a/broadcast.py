@@ -21,10 +21,13 @@ Hardware Setup:
 
 import logging
 import os
+import re
 import subprocess
 import tempfile
+import threading
 import time
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
@@ -50,6 +53,70 @@ from .cat import FT991A
 
 logger = logging.getLogger(__name__)
 
+# Device names of the PCM2903B CODEC that feeds the radio's data port
+_PREFERRED_DEVICE = re.compile(r"PCM2903|USB\s+Audio\s+CODEC", re.IGNORECASE).search
+
+# Broadcast text is synthesized a sentence at a time so playback can start before the whole message is rendered
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+# Audio device enumeration cache (a PortAudio scan can take hundreds of ms)
+DEVICE_CACHE_TTL = 5.0  # seconds
+_device_cache = {"ts": 0.0, "data": None}
+
+
+def _query_devices():
+    """Return sd.query_devices(), reusing the last enumeration for DEVICE_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if _device_cache["data"] is None or now - _device_cache["ts"] >= DEVICE_CACHE_TTL:
+        _device_cache.update(data=sd.query_devices(), ts=now)
+    return _device_cache["data"]
+
+
+def _split_sentences(text: str) -> list:
+    """Split text on sentence-ending punctuation, dropping empty pieces."""
+    return [sentence for sentence in (part.strip() for part in _SENTENCE_BREAK.split(text)) if sentence]
+
+
+def _run_inline(fn, *args) -> Future:
+    """Call fn now and return its outcome as a finished Future (the synchronous counterpart of executor.submit)."""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def invalidate_device_cache():
+    """Forget the cached device list (call after audio hardware is plugged or unplugged)."""
+    _device_cache.update(data=None, ts=0.0)
+
+
+# pyttsx3 engine shared by every Broadcaster (pyttsx3.init() spins up the speech driver, 100-500 ms).
+# The engine is not thread-safe, so _tts_lock also serializes each save_to_file/runAndWait cycle.
+_tts_singleton = None
+_tts_lock = threading.Lock()
+
+
+def _get_tts_engine():
+    """Return the shared pyttsx3 engine, initializing and configuring it on first use."""
+    global _tts_singleton
+    with _tts_lock:
+        if _tts_singleton is None:
+            engine = pyttsx3.init()
+            # Configure for clear speech
+            engine.setProperty("rate", 150)  # Slightly slower for clarity
+            engine.setProperty("volume", 0.9)
+            _tts_singleton = engine
+        return _tts_singleton
+
+
+def reset_tts_engine():
+    """Drop the shared TTS engine so the next Broadcaster initializes a fresh one."""
+    global _tts_singleton
+    with _tts_lock:
+        _tts_singleton = None
+
 
 class BroadcastError(Exception):
     """Base exception for broadcast operations."""
@@ -114,17 +181,23 @@ class Broadcaster:
             return
 
         try:
-            devices = sd.query_devices()
-
-            # Look for PCM2903B device
-            for idx, device in enumerate(devices):
-                if (self.device_name and self.device_name.lower() in device["name"].lower()) or (
-                    "PCM2903" in device["name"] or "USB Audio CODEC" in device["name"]
-                ):
-                    if device["max_output_channels"] > 0:  # Can output audio
-                        self._audio_device_id = idx
-                        logger.info(f"Found audio device: {device['name']} (ID: {idx})")
-                        return
+            devices = _query_devices()
+
+            # Look for the requested device or the PCM2903B, whichever output-capable device comes first
+            wanted = self.device_name.lower() if self.device_name else None
+            idx = next(
+                (
+                    idx
+                    for idx, device in enumerate(devices)
+                    if ((wanted and wanted in device["name"].lower()) or _PREFERRED_DEVICE(device["name"]))
+                    and device["max_output_channels"] > 0  # Can output audio
+                ),
+                None,
+            )
+            if idx is not None:
+                self._audio_device_id = idx
+                logger.info(f"Found audio device: {devices[idx]['name']} (ID: {idx})")
+                return
 
             # Fallback to default output device
             default_device = sd.query_devices(kind="output")
@@ -139,10 +212,7 @@ class Broadcaster:
         """Initialize the TTS engine."""
         if TTS_ENGINE == "pyttsx3" and pyttsx3:
             try:
-                self._tts_engine = pyttsx3.init()
-                # Configure for clear speech
-                self._tts_engine.setProperty("rate", 150)  # Slightly slower for clarity
-                self._tts_engine.setProperty("volume", 0.9)
+                self._tts_engine = _get_tts_engine()
                 logger.info("TTS initialized: pyttsx3")
             except Exception as e:
                 logger.error(f"Failed to initialize pyttsx3: {e}")
@@ -174,9 +244,10 @@ class Broadcaster:
 
         try:
             if self._tts_engine and TTS_ENGINE == "pyttsx3":
-                # Use pyttsx3 engine
-                self._tts_engine.save_to_file(text, wav_path)
-                self._tts_engine.runAndWait()
+                # Use pyttsx3 engine; one synthesis at a time, since the engine is shared and its run loop is not reentrant
+                with _tts_lock:
+                    self._tts_engine.save_to_file(text, wav_path)
+                    self._tts_engine.runAndWait()
 
             else:
                 # Fallback to espeak system command
@@ -235,25 +306,24 @@ class Broadcaster:
             # Read WAV file
             with wave.open(str(wav_path), "rb") as wf:
                 sample_rate = wf.getframerate()
+                channels = wf.getnchannels()
                 frames = wf.readframes(wf.getnframes())
 
-                # Convert to numpy array
-                if wf.getsampwidth() == 2:  # 16-bit
-                    audio_data = np.frombuffer(frames, dtype=np.int16)
-                else:
+                if wf.getsampwidth() != 2:  # 16-bit only
                     raise AudioDeviceError("Unsupported sample width")
+                if channels not in (1, 2):
+                    raise AudioDeviceError("Unsupported channel count")
 
-                # Convert to float32 for sounddevice
-                audio_data = audio_data.astype(np.float32) / 32768.0
+            # Convert to float32 for sounddevice: one copy out of the frame bytes, scaled in place
+            audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+            audio_data *= 1.0 / 32768.0
 
-                # Handle mono/stereo
-                if wf.getnchannels() == 1:
-                    # Mono - duplicate to stereo for PCM2903B
-                    audio_data = np.column_stack((audio_data, audio_data))
-                elif wf.getnchannels() == 2:
-                    audio_data = audio_data.reshape((-1, 2))
-                else:
-                    raise AudioDeviceError("Unsupported channel count")
+            # Handle mono/stereo
+            if channels == 1:
+                # Mono - present as stereo for PCM2903B as a read-only view, without duplicating samples
+                audio_data = np.broadcast_to(audio_data[:, None], (len(audio_data), 2))
+            else:
+                audio_data = audio_data.reshape((-1, 2))
 
             # Play audio to the specified device
             logger.info(f"Playing audio to device {self._audio_device_id}: {wav_path.name}")
@@ -270,6 +340,10 @@ class Broadcaster:
         """
         Complete TTS-to-radio broadcast pipeline.
 
+        Text is synthesized sentence by sentence. With espeak the next sentence
+        is rendered in the background while the current one plays; pyttsx3
+        drives its speech driver on the calling thread, so it renders in turn.
+
         SAFETY: This function can result in RF transmission. The confirm flag
         is mandatory to acknowledge that a licensed operator is present.
 
@@ -297,22 +371,39 @@ class Broadcaster:
         logger.warning("🚨 Licensed operator KO4TUV must be physically present")
         logger.warning("🚨 Operator is responsible for proper identification and compliance")
 
-        try:
-            # Step 1: Convert text to audio
-            logger.info("Converting text to speech...")
-            wav_path = self.text_to_audio(text, voice)
-
-            # Step 2: Route audio to radio
-            logger.info("Routing audio to radio...")
-            self.play_to_radio(wav_path)
+        # Empty text still goes through text_to_audio() so it fails with the usual TTSError
+        sentences = _split_sentences(text) or [text]
+        pending = None
 
-            # Cleanup
-            os.unlink(wav_path)
+        try:
+            # Synthesize sentence N+1 on a worker while sentence N plays (espeak subprocesses only; the
+            # pyttsx3 engine must not be driven from a worker thread, so it renders N+1 after N has played)
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts") as synth:
+                pipelined = not (self._tts_engine and TTS_ENGINE == "pyttsx3")
+                submit = synth.submit if pipelined else _run_inline
+                logger.info("Converting text to speech...")
+                pending = submit(self.text_to_audio, sentences[0], voice)
+
+                for following in sentences[1:] + [None]:
+                    wav_path = pending.result()
+                    pending = submit(self.text_to_audio, following, voice) if following and pipelined else None
+
+                    logger.info("Routing audio to radio...")
+                    try:
+                        self.play_to_radio(wav_path)
+                    finally:
+                        os.unlink(wav_path)
+
+                    if following and not pipelined:
+                        pending = submit(self.text_to_audio, following, voice)
 
             logger.info("✅ Broadcast completed successfully")
             return True
 
         except Exception as e:
+            # A sentence synthesized ahead of a failed playback is never played
+            if pending is not None and pending.done() and pending.exception() is None:
+                os.unlink(pending.result())
             logger.error(f"❌ Broadcast failed: {e}")
             raise BroadcastError(f"Broadcast failed: {e}")
 
@@ -352,18 +443,17 @@ class Broadcaster:
         try:
             logger.info(f"Recording from radio for {duration_seconds} seconds...")
 
-            # Record audio
+            # Record audio (stereo from PCM2903B) into a buffer owned by this call, freed once the WAV is written
             recording = sd.rec(
-                int(duration_seconds * self.sample_rate),
                 samplerate=self.sample_rate,
-                channels=2,  # Stereo from PCM2903B
                 device=self._audio_device_id,
-                dtype=np.float32,
+                out=np.empty((int(duration_seconds * self.sample_rate), 2), dtype=np.float32),
             )
             sd.wait()  # Wait for recording to complete
 
-            # Convert to 16-bit integers for WAV
-            recording_int16 = (recording * 32767).astype(np.int16)
+            # Convert to 16-bit integers for WAV in one pass, without a float64 intermediate
+            recording_int16 = np.empty(recording.shape, dtype=np.int16)
+            np.multiply(recording, 32767, out=recording_int16, casting="unsafe")
 
             # Write WAV file
             with wave.open(output_path, "wb") as wf:
@@ -392,7 +482,7 @@ class Broadcaster:
             return {"error": "Audio libraries not available"}
 
         try:
-            devices = sd.query_devices()
+            devices = _query_devices()
             result = {"current_device": self._audio_device_id, "devices": []}
 
             for idx, device in enumerate(devices):
@@ -414,13 +504,16 @@ class Broadcaster:
 
 def cleanup_temp_files():
     """Clean up temporary audio files older than 1 hour."""
-    temp_dir = Path(tempfile.gettempdir())
     cutoff_time = time.time() - 3600  # 1 hour ago
 
-    for wav_file in temp_dir.glob("tmp*.wav"):
-        try:
-            if wav_file.stat().st_mtime < cutoff_time:
-                wav_file.unlink()
-                logger.debug(f"Cleaned up old temp file: {wav_file}")
-        except Exception as e:
-            logger.debug(f"Could not clean up {wav_file}: {e}")
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            # Only our own NamedTemporaryFile outputs (tmp*.wav)
+            if not (entry.name.startswith("tmp") and entry.name.endswith(".wav")):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    logger.debug("Cleaned up old temp file: %s", entry.path)
+            except OSError as e:
+                logger.debug("Could not clean up %s: %s", entry.path, e)
@@ -13,15 +13,15 @@ import logging
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Union
 
 import serial
 
 logger = logging.getLogger(__name__)
 
 
-class Mode(Enum):
-    """Operating modes (MD command parameter)"""
+class Mode(str, Enum):
+    """Operating modes (MD command parameter); members compare equal to their CAT code"""
 
     LSB = "1"
     USB = "2"
@@ -39,8 +39,8 @@ class Mode(Enum):
     C4FM = "E"
 
 
-class Band(Enum):
-    """Common amateur bands with typical frequencies (Hz)"""
+class Band(int, Enum):
+    """Common amateur bands with typical frequencies (Hz); members compare equal to their frequency"""
 
     HF_160M = 1_800_000
     HF_80M = 3_500_000
@@ -57,7 +57,7 @@ class Band(Enum):
     UHF_70CM = 420_000_000
 
 
-@dataclass
+@dataclass(slots=True)
 class RadioStatus:
     """Current radio state"""
 
@@ -71,6 +71,55 @@ class RadioStatus:
     swr: float
 
 
+# ── CAT Answer Parsing ─────────────────────────────────────────
+
+
+def _int_answer(resp: str, prefix: str) -> int:
+    """Integer payload of a '<prefix>nnn;' answer, 0 if malformed."""
+    if resp.startswith(prefix) and resp.endswith(";"):
+        try:
+            return int(resp[len(prefix) : -1])
+        except ValueError:
+            return 0
+    return 0
+
+
+# Longest message a CW keyer text memory (KM) holds
+CW_MESSAGE_MAX_CHARS = 50
+
+# KY selectors that play text keyer memories 1-5 (KY1-KY5 play the recorded message keyer memories)
+_TEXT_KEYER_PLAY = "6789A"
+
+# MD0 code -> Mode name
+_MODE_NAMES = {mode.value: mode.name for mode in Mode}
+
+
+def _mode_answer(resp: str) -> str:
+    """Mode name from an 'MD0x;' answer."""
+    if resp.startswith("MD0") and resp.endswith(";"):
+        code = resp[3:-1]
+        return _MODE_NAMES.get(code) or f"UNKNOWN({code})"
+    return "UNKNOWN"
+
+
+def _tx_answer(resp: str) -> bool:
+    """Transmit state from a 'TXn;' answer."""
+    if resp.startswith("TX") and resp.endswith(";"):
+        return resp[2:-1] != "0"
+    return False
+
+
+def _squelch_answer(resp: str) -> bool:
+    """Squelch state from an 'IF...;' answer."""
+    if len(resp) >= 28:
+        # Byte 23 is squelch status: 0=closed, 1=open
+        try:
+            return resp[23] == "1"
+        except (IndexError, ValueError):
+            return False
+    return False
+
+
 class FT991A:
     """
     Yaesu FT-991A CAT control interface.
@@ -93,6 +142,28 @@ class FT991A:
         radio.disconnect()
     """
 
+    # Fixed CAT commands, encoded once instead of on every call
+    _CMD = {
+        "get_freq_a": b"FA;",
+        "get_freq_b": b"FB;",
+        "get_mode": b"MD0;",
+        "ptt_on": b"TX1;",
+        "ptt_off": b"TX0;",
+        "get_tx": b"TX;",
+        "get_smeter": b"SM0;",
+        "get_power_meter": b"RM1;",
+        "get_swr": b"RM2;",
+        "get_power": b"PC;",
+        "swap_vfo": b"SV;",
+        "vfo_a_to_b": b"AB;",
+        "get_info": b"IF;",
+        "get_id": b"ID;",
+        "tuner_off": b"AC000;",
+        "tuner_on": b"AC001;",
+        "tuner_start": b"AC002;",
+    }
+    _MODE_CMD = {mode: f"MD0{mode.value};".encode("ascii") for mode in Mode}
+
     def __init__(self, port: str = "/dev/ttyUSB0", baudrate: int = 38400, timeout: float = 1.0):
         self.port = port
         self.baudrate = baudrate
@@ -136,8 +207,8 @@ class FT991A:
 
     # ── Low-level CAT I/O ──────────────────────────────────────
 
-    def _send(self, command: str) -> str:
-        """Send a CAT command and return the response."""
+    def _send(self, command: Union[str, bytes]) -> str:
+        """Send a CAT command and return the response (bytes commands are sent as-is, terminator included)."""
         if not self.serial or not self.serial.is_open:
             raise ConnectionError("Not connected to radio")
 
@@ -146,34 +217,67 @@ class FT991A:
         if elapsed < self._min_cmd_interval:
             time.sleep(self._min_cmd_interval - elapsed)
 
-        # Ensure command ends with terminator
-        if not command.endswith(";"):
-            command += ";"
+        if isinstance(command, str):
+            # Ensure command ends with terminator
+            if not command.endswith(";"):
+                command += ";"
+            command = command.encode("ascii")
 
-        logger.debug(f"TX: {command}")
-        self.serial.write(command.encode("ascii"))
-        self.serial.flush()
+        logger.debug("TX: %s", command)
+        # No flush(): tcdrain() would block until the bytes left the UART, and the reply read below waits anyway
+        self.serial.write(command)
         self._last_cmd_time = time.time()
 
-        # Read response (terminated by ';')
-        response = b""
-        while True:
-            byte = self.serial.read(1)
-            if not byte:
-                break  # Timeout
-            response += byte
-            if byte == b";":
-                break
+        response = self._receive(1)
+        # Anything past the terminator is a stray late answer, not part of this response
+        response = response[: response.find(b";") + 1] or response
 
         decoded = response.decode("ascii", errors="replace")
-        logger.debug(f"RX: {decoded}")
+        logger.debug("RX: %s", decoded)
         return decoded
 
-    def _set(self, command: str):
+    def _receive(self, count: int) -> bytearray:
+        """Read until `count` ';'-terminated answers have arrived or the port times out."""
+        # Take whatever has arrived per call, not one byte at a time
+        response = bytearray()
+        while response.count(b";") < count:
+            chunk = self.serial.read(self.serial.in_waiting or 1)
+            if not chunk:
+                break  # Timeout
+            response += chunk
+        return response
+
+    def _send_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several read commands in one write and return their answers in order.
+
+        The radio answers each command in turn, so one round trip replaces
+        len(commands) of them. Answers that never arrive come back as "".
+        """
+        if not self.serial or not self.serial.is_open:
+            raise ConnectionError("Not connected to radio")
+
+        # Rate limiting
+        elapsed = time.time() - self._last_cmd_time
+        if elapsed < self._min_cmd_interval:
+            time.sleep(self._min_cmd_interval - elapsed)
+
+        command = "".join(cmd if cmd.endswith(";") else cmd + ";" for cmd in commands)
+        logger.debug("TX: %s", command)
+        self.serial.write(command.encode("ascii"))
+        self._last_cmd_time = time.time()
+
+        decoded = self._receive(len(commands)).decode("ascii", errors="replace")
+        logger.debug("RX: %s", decoded)
+        # The piece after the last ';' is empty or a truncated answer - drop it
+        answers = [answer + ";" for answer in decoded.split(";")[:-1]][: len(commands)]
+        return answers + [""] * (len(commands) - len(answers))
+
+    def _set(self, command: Union[str, bytes]):
         """Send a set command (no response expected)."""
         self._send(command)
 
-    def _read(self, command: str) -> str:
+    def _read(self, command: Union[str, bytes]) -> str:
         """Send a read command and return the answer."""
         return self._send(command)
 
@@ -181,27 +285,16 @@ class FT991A:
 
     def get_frequency_a(self) -> int:
         """Get VFO-A frequency in Hz."""
-        resp = self._read("FA;")
-        if resp.startswith("FA") and resp.endswith(";"):
-            try:
-                return int(resp[2:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_freq_a"]), "FA")
 
     def set_frequency_a(self, freq_hz: int):
         """Set VFO-A frequency in Hz. Range: 30 kHz - 470 MHz."""
-        self._set(f"FA{freq_hz:09d};")
+        # Formatted straight to bytes: the tuning hot path (scans) skips the str encode
+        self._set(b"FA%09d;" % freq_hz)
 
     def get_frequency_b(self) -> int:
         """Get VFO-B frequency in Hz."""
-        resp = self._read("FB;")
-        if resp.startswith("FB") and resp.endswith(";"):
-            try:
-                return int(resp[2:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_freq_b"]), "FB")
 
     def set_frequency_b(self, freq_hz: int):
         """Set VFO-B frequency in Hz."""
@@ -211,80 +304,62 @@ class FT991A:
 
     def get_mode(self) -> str:
         """Get current operating mode."""
-        resp = self._read("MD0;")
-        if resp.startswith("MD0") and resp.endswith(";"):
-            code = resp[3:-1]
-            for mode in Mode:
-                if mode.value == code:
-                    return mode.name
-            return f"UNKNOWN({code})"
-        return "UNKNOWN"
+        return _mode_answer(self._read(self._CMD["get_mode"]))
 
     def set_mode(self, mode: Mode):
         """Set operating mode."""
-        self._set(f"MD0{mode.value};")
+        self._set(self._MODE_CMD[mode])
 
     # ── Transmit Control ───────────────────────────────────────
 
     def ptt_on(self):
         """Key the transmitter (PTT on). CAUTION: Transmits RF!"""
         logger.warning("PTT ON — transmitting!")
-        self._set("TX1;")
+        self._set(self._CMD["ptt_on"])
 
     def ptt_off(self):
         """Unkey the transmitter (PTT off)."""
-        self._set("TX0;")
+        self._set(self._CMD["ptt_off"])
 
     def is_transmitting(self) -> bool:
         """Check if radio is currently transmitting."""
-        resp = self._read("TX;")
-        if resp.startswith("TX") and resp.endswith(";"):
-            return resp[2:-1] != "0"
-        return False
+        return _tx_answer(self._read(self._CMD["get_tx"]))
 
     # ── Meter Reading ──────────────────────────────────────────
 
     def get_s_meter(self) -> int:
         """Read S-meter value (0-255)."""
-        resp = self._read("SM0;")
-        if resp.startswith("SM0") and resp.endswith(";"):
-            try:
-                return int(resp[3:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_smeter"]), "SM0")
+
+    def tune_and_read_s_meter(self, freq_hz: int) -> int:
+        """Set VFO-A and read the S-meter (0-255) in one CAT exchange."""
+        # FA sets are silent, so SM0's answer is the only reply - and the write doesn't wait out the timeout
+        return _int_answer(self._read(f"FA{freq_hz:09d};SM0;"), "SM0")
+
+    def read_s_meter_and_tune(self, next_freq_hz: Optional[int] = None) -> int:
+        """
+        Read the S-meter (0-255), then retune VFO-A to next_freq_hz, in one CAT exchange.
+
+        The radio answers SM0 before it executes the FA, so the reading is for
+        the frequency it has been dwelling on; scans use this to step to the
+        next channel without a separate (silent, timeout-bound) set.
+        """
+        command = b"SM0;" if next_freq_hz is None else b"SM0;FA%09d;" % next_freq_hz
+        return _int_answer(self._read(command), "SM0")
 
     def get_power_meter(self) -> int:
         """Read power output meter (0-255)."""
-        resp = self._read("RM1;")
-        if resp.startswith("RM1") and resp.endswith(";"):
-            try:
-                return int(resp[3:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_power_meter"]), "RM1")
 
     def get_swr_meter(self) -> int:
         """Read SWR meter (0-255)."""
-        resp = self._read("RM2;")
-        if resp.startswith("RM2") and resp.endswith(";"):
-            try:
-                return int(resp[3:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_swr"]), "RM2")
 
     # ── Power & RF ─────────────────────────────────────────────
 
     def get_power_level(self) -> int:
         """Get RF power output setting (0-100 watts)."""
-        resp = self._read("PC;")
-        if resp.startswith("PC") and resp.endswith(";"):
-            try:
-                return int(resp[2:-1])
-            except ValueError:
-                return 0
-        return 0
+        return _int_answer(self._read(self._CMD["get_power"]), "PC")
 
     def set_power_level(self, watts: int):
         """Set RF power output (5-100 watts HF, 5-50 watts VHF/UHF)."""
@@ -295,11 +370,11 @@ class FT991A:
 
     def swap_vfo(self):
         """Swap VFO-A and VFO-B."""
-        self._set("SV;")
+        self._set(self._CMD["swap_vfo"])
 
     def vfo_a_to_b(self):
         """Copy VFO-A to VFO-B."""
-        self._set("AB;")
+        self._set(self._CMD["vfo_a_to_b"])
 
     # ── Band Selection ────────────────────────────────────────
 
@@ -312,48 +387,62 @@ class FT991A:
     def get_squelch_status(self) -> bool:
         """Check if squelch is open (signal present)."""
         # Use IF command to check receiver status
-        resp = self._read("IF;")
-        if len(resp) >= 28:
-            # Byte 23 is squelch status: 0=closed, 1=open
-            try:
-                return resp[23] == "1"
-            except (IndexError, ValueError):
-                return False
-        return False
+        return _squelch_answer(self._read(self._CMD["get_info"]))
 
     # ── Information ───────────────────────────────────────────
 
     def get_info(self) -> str:
         """Get full IF (Information) response — comprehensive radio state."""
-        return self._read("IF;")
+        return self._read(self._CMD["get_info"])
 
     def get_id(self) -> str:
         """Get radio model identification."""
-        resp = self._read("ID;")
+        resp = self._read(self._CMD["get_id"])
         return resp
 
     # ── Antenna Tuner ─────────────────────────────────────────
 
     def tuner_on(self):
         """Turn antenna tuner ON."""
-        self._send("AC001;")
+        self._send(self._CMD["tuner_on"])
         logger.info("Antenna tuner ON")
 
     def tuner_off(self):
         """Turn antenna tuner OFF."""
-        self._send("AC000;")
+        self._send(self._CMD["tuner_off"])
         logger.info("Antenna tuner OFF")
 
     def tuner_start(self):
         """Start antenna auto-tune (tuner must be ON first)."""
-        self._send("AC001;")  # ensure tuner is on
-        self._send("AC002;")  # start tuning
+        self._send(self._CMD["tuner_on"])  # ensure tuner is on
+        self._send(self._CMD["tuner_start"])  # start tuning
         logger.info("Antenna auto-tune started")
 
     def tuner_status(self) -> str:
         """Get tuner status. Note: FT-991A AC command is write-only, no query support."""
         return "unknown"
 
+    # ── CW Keyer ──────────────────────────────────────────────
+
+    def set_key_speed(self, wpm: int):
+        """Set the internal CW keyer speed (4-60 WPM)."""
+        wpm = max(4, min(60, wpm))
+        self._set(f"KS{wpm:03d};")
+
+    def send_cw_message(self, text: str, channel: int = 1):
+        """
+        Send text through the radio's internal CW keyer. CAUTION: Transmits RF!
+
+        The text is loaded into text keyer memory `channel` (KM) and played
+        back (KY) in the same write.
+        """
+        if len(text) > CW_MESSAGE_MAX_CHARS:
+            raise ValueError(f"CW keyer messages are limited to {CW_MESSAGE_MAX_CHARS} characters")
+        if not 1 <= channel <= 5:
+            raise ValueError("Text keyer memory channel must be 1-5")
+        logger.warning("CW message via internal keyer — transmitting!")
+        self._set(f"KM{channel}{text};KY{_TEXT_KEYER_PLAY[channel - 1]};")
+
     # ── Convenience ───────────────────────────────────────────
 
     def tune_ft8(self, band_mhz: float = 14.074):
@@ -375,15 +464,19 @@ class FT991A:
 
     def get_status(self) -> RadioStatus:
         """Get comprehensive radio status."""
+        # One write/read exchange for all eight queries instead of eight round trips
+        fa, fb, md, tx, info, sm, pc, swr = self._send_batch(
+            ["FA;", "FB;", "MD0;", "TX;", "IF;", "SM0;", "PC;", "RM2;"]
+        )
         return RadioStatus(
-            frequency_a=self.get_frequency_a(),
-            frequency_b=self.get_frequency_b(),
-            mode=self.get_mode(),
-            tx_active=self.is_transmitting(),
-            squelch_open=self.get_squelch_status(),
-            s_meter=self.get_s_meter(),
-            power_output=self.get_power_level(),
-            swr=self.get_swr_meter(),
+            frequency_a=_int_answer(fa, "FA"),
+            frequency_b=_int_answer(fb, "FB"),
+            mode=_mode_answer(md),
+            tx_active=_tx_answer(tx),
+            squelch_open=_squelch_answer(info),
+            s_meter=_int_answer(sm, "SM0"),
+            power_output=_int_answer(pc, "PC"),
+            swr=_int_answer(swr, "RM2"),
         )
 
     # ── Context Manager ───────────────────────────────────────
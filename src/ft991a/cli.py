@@ -63,6 +63,7 @@ def web_server_main():
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--radio-port", default="/dev/ttyUSB0", help="Radio serial port")
     parser.add_argument("--radio-baud", type=int, default=38400, help="Radio baud rate")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Status poll interval in seconds")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
 
     args = parser.parse_args()
@@ -74,6 +75,7 @@ def web_server_main():
     # Pass CLI args to web module config
     radio_config["port"] = args.radio_port
     radio_config["baudrate"] = args.radio_baud
+    radio_config["poll_interval"] = args.poll_interval
 
     print(f"Starting FT-991A Web GUI on http://{args.host}:{args.port}")
     print(f"Radio: {args.radio_port} @ {args.radio_baud} baud")
@@ -16,9 +16,9 @@ Hardware Requirements:
 """
 
 import logging
+import os
 import re
 import subprocess
-from configparser import ConfigParser
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -26,6 +26,66 @@ from .cat import FT991A, Mode
 
 logger = logging.getLogger(__name__)
 
+# " 1 [CODEC          ]: USB-Audio - USB Audio CODEC" in /proc/asound/cards
+_ASOUND_CARD = re.compile(r"\s*(\d+)\s+\[([^\]]+)\]\s*:\s*(.+)")
+
+# "card 1: CODEC [USB Audio CODEC], device 0: USB Audio [USB Audio]" from arecord -l
+_ARECORD_CARD = re.compile(r"card\s+(\d+):\s+(\w+)\s+\[([^\]]+)\].*device\s+(\d+)")
+
+# WSJT-X.ini for the FT-991A; written in one piece by DigitalModes.create_wsjtx_config()
+_WSJTX_TEMPLATE = """\
+[Configuration]
+MyCall={call}
+MyGrid={grid}
+SoundInName={audio_in}
+SoundOutName={audio_out}
+AudioInputDevice={audio_in}
+AudioOutputDevice={audio_out}
+CATPortName={port}
+CATSerialRate={baud}
+CATDataBits=8
+CATStopBits=2
+CATParity=None
+CATHandshake=None
+CATPolling=true
+CATPTTEnabled=true
+CATRTSEnabled=false
+CATDTREnabled=false
+RigName=Yaesu FT-991A
+PTTport={port}
+PTTMethod=0
+TxMode=1
+Data=1
+TxPower=25
+TuneSteps=5
+DecodeHighlighting=true
+IncludeBlankLine=false
+DeepSearchEnabled=true
+LogQSOEnabled=true
+AutoLogEnabled=false
+EnableVHFContesting=false
+UseUTC=true
+"""
+
+
+# Marks an audio device lookup that has not run yet (None is a valid "not found" result)
+_UNSET = object()
+
+
+def _read_asound_cards() -> str:
+    """Return /proc/asound/cards with raw os reads (no stat/Path), or "" when ALSA isn't present."""
+    try:
+        fd = os.open("/proc/asound/cards", os.O_RDONLY)
+    except OSError:
+        return ""
+    try:
+        chunks = []
+        while chunk := os.read(fd, 4096):
+            chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8", "replace")
+    finally:
+        os.close(fd)
+
 
 class DigitalModes:
     """
@@ -97,6 +157,7 @@ class DigitalModes:
         self.radio = radio
         if not radio.serial or not radio.serial.is_open:
             raise ValueError("Radio must be connected before initializing digital modes")
+        self._audio_device_cache = _UNSET
 
     def setup_ft8(self, frequency: Optional[int] = None, band: Optional[str] = None) -> bool:
         """
@@ -119,11 +180,8 @@ class DigitalModes:
 
         try:
             # Determine frequency
-            if frequency:
-                target_freq = frequency
-            elif band and band in self.FT8_FREQUENCIES:
-                target_freq = self.FT8_FREQUENCIES[band]
-            else:
+            target_freq = frequency or self.FT8_FREQUENCIES.get(band)
+            if not target_freq:
                 target_freq = self.FT8_FREQUENCIES["20m"]  # Default to 20m
                 logger.info("No frequency/band specified, defaulting to 20m FT8")
 
@@ -171,11 +229,8 @@ class DigitalModes:
 
         try:
             # Determine frequency
-            if frequency:
-                target_freq = frequency
-            elif band and band in self.FT4_FREQUENCIES:
-                target_freq = self.FT4_FREQUENCIES[band]
-            else:
+            target_freq = frequency or self.FT4_FREQUENCIES.get(band)
+            if not target_freq:
                 target_freq = self.FT4_FREQUENCIES["20m"]  # Default to 20m
                 logger.info("No frequency/band specified, defaulting to 20m FT4")
 
@@ -221,11 +276,8 @@ class DigitalModes:
 
         try:
             # Determine frequency
-            if frequency:
-                target_freq = frequency
-            elif band and band in self.JS8_FREQUENCIES:
-                target_freq = self.JS8_FREQUENCIES[band]
-            else:
+            target_freq = frequency or self.JS8_FREQUENCIES.get(band)
+            if not target_freq:
                 target_freq = self.JS8_FREQUENCIES["20m"]  # Default to 20m
                 logger.info("No frequency/band specified, defaulting to 20m JS8Call")
 
@@ -253,40 +305,55 @@ class DigitalModes:
             logger.error(f"JS8Call setup failed: {e}")
             return False
 
-    def get_audio_device(self) -> Optional[Dict[str, str]]:
+    def get_audio_device(self, refresh: bool = False) -> Optional[Dict[str, str]]:
         """
         Detect PCM2903B USB audio CODEC on the system.
 
         The PCM2903B shows up as a USB audio device in ALSA.
         Common names: "USB Audio CODEC", "C-Media USB Audio Device"
 
+        Detection may spawn arecord/pactl, so the result is cached on the
+        instance; pass refresh=True (or call invalidate_audio_device()) after
+        plugging or unplugging the CODEC.
+
+        Args:
+            refresh: Ignore the cached result and probe again
+
         Returns:
             dict: Audio device info with 'card', 'device', 'name' keys, or None
         """
+        if refresh or self._audio_device_cache is _UNSET:
+            self._audio_device_cache = self._detect_audio_device()
+        return self._audio_device_cache
+
+    def invalidate_audio_device(self):
+        """Forget the cached audio device so the next lookup probes again."""
+        self._audio_device_cache = _UNSET
+
+    def _detect_audio_device(self) -> Optional[Dict[str, str]]:
+        """Probe /proc/asound, arecord and PulseAudio for the USB audio CODEC."""
         try:
             # Method 1: Check /proc/asound/cards for USB audio devices
-            cards_file = Path("/proc/asound/cards")
-            if cards_file.exists():
-                content = cards_file.read_text()
-
-                # Look for USB audio devices (PCM2903B typically shows as "USB Audio CODEC")
-                for line in content.split("\n"):
-                    if "USB" in line and ("Audio" in line or "CODEC" in line):
-                        # Parse card number and name
-                        match = re.match(r"\s*(\d+)\s+\[([^\]]+)\]\s*:\s*(.+)", line)
-                        if match:
-                            card_num, card_id, card_name = match.groups()
-
-                            # Check if this looks like PCM2903B
-                            if any(keyword in card_name.upper() for keyword in ["USB AUDIO", "PCM2903", "C-MEDIA"]):
-                                logger.info(f"Found USB audio device: {card_name} (card {card_num})")
-                                return {
-                                    "card": card_num,
-                                    "device": "0",  # Usually device 0
-                                    "name": card_name.strip(),
-                                    "alsa_name": f"plughw:{card_num},0",
-                                    "pulse_name": f"alsa_input.usb-*_{card_id}*",
-                                }
+            content = _read_asound_cards()
+
+            # Look for USB audio devices (PCM2903B typically shows as "USB Audio CODEC")
+            for line in content.split("\n"):
+                if "USB" in line and ("Audio" in line or "CODEC" in line):
+                    # Parse card number and name
+                    match = _ASOUND_CARD.match(line)
+                    if match:
+                        card_num, card_id, card_name = match.groups()
+
+                        # Check if this looks like PCM2903B
+                        if any(keyword in card_name.upper() for keyword in ["USB AUDIO", "PCM2903", "C-MEDIA"]):
+                            logger.info(f"Found USB audio device: {card_name} (card {card_num})")
+                            return {
+                                "card": card_num,
+                                "device": "0",  # Usually device 0
+                                "name": card_name.strip(),
+                                "alsa_name": f"plughw:{card_num},0",
+                                "pulse_name": f"alsa_input.usb-*_{card_id}*",
+                            }
 
             # Method 2: Use arecord to list capture devices
             try:
@@ -295,7 +362,7 @@ class DigitalModes:
                     for line in result.stdout.split("\n"):
                         if "USB" in line and ("Audio" in line or "CODEC" in line):
                             # Parse: card 1: CODEC [USB Audio CODEC], device 0: USB Audio [USB Audio]
-                            match = re.search(r"card\s+(\d+):\s+(\w+)\s+\[([^\]]+)\].*device\s+(\d+)", line)
+                            match = _ARECORD_CARD.search(line)
                             if match:
                                 card_num, card_id, card_name, device_num = match.groups()
                                 logger.info(f"Found audio device via arecord: {card_name} (card {card_num})")
@@ -365,48 +432,14 @@ class DigitalModes:
                 audio_input = audio_device["alsa_name"]
                 audio_output = audio_device["alsa_name"]
 
-            # WSJT-X configuration template
-            config = ConfigParser()
-            config.optionxform = str  # Preserve case for keys
-
-            # Main configuration section
-            config["Configuration"] = {
-                # Station info
-                "MyCall": callsign.upper(),
-                "MyGrid": grid_square.upper(),
-                # Audio settings
-                "SoundInName": audio_input,
-                "SoundOutName": audio_output,
-                "AudioInputDevice": audio_input,
-                "AudioOutputDevice": audio_output,
-                # CAT settings for FT-991A
-                "CATPortName": self.radio.port,
-                "CATSerialRate": str(self.radio.baudrate),
-                "CATDataBits": "8",
-                "CATStopBits": "2",
-                "CATParity": "None",
-                "CATHandshake": "None",
-                "CATPolling": "true",
-                "CATPTTEnabled": "true",
-                "CATRTSEnabled": "false",
-                "CATDTREnabled": "false",
-                "RigName": "Yaesu FT-991A",
-                "PTTport": self.radio.port,
-                "PTTMethod": "0",  # CAT
-                # Digital mode settings
-                "TxMode": "1",  # USB
-                "Data": "1",  # Data mode
-                "TxPower": "25",
-                "TuneSteps": "5",
-                # Other settings
-                "DecodeHighlighting": "true",
-                "IncludeBlankLine": "false",
-                "DeepSearchEnabled": "true",
-                "LogQSOEnabled": "true",
-                "AutoLogEnabled": "false",
-                "EnableVHFContesting": "false",
-                "UseUTC": "true",
-            }
+            config = _WSJTX_TEMPLATE.format(
+                call=callsign.upper(),
+                grid=grid_square.upper(),
+                audio_in=audio_input,
+                audio_out=audio_output,
+                port=self.radio.port,
+                baud=self.radio.baudrate,
+            )
 
             # Write to temporary file (user should copy to proper location)
             config_dir = Path.home() / ".config" / "WSJT-X"
@@ -414,7 +447,7 @@ class DigitalModes:
             config_file = config_dir / "WSJT-X.ini"
 
             with open(config_file, "w") as f:
-                config.write(f)
+                f.write(config)
 
             logger.info(f"WSJT-X config created: {config_file}")
             logger.info(f"Callsign: {callsign}, Grid: {grid_square}")
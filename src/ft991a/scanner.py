@@ -20,14 +20,29 @@ Usage:
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Tuple
 
 from .cat import FT991A, Mode
 
 logger = logging.getLogger(__name__)
 
+# Sort key for activity results; attrgetter runs in C, and bands are swept in order so the sort is a linear pass
+_by_frequency = attrgetter("frequency_hz")
 
-@dataclass
+# Terminal columns for a scan result bar, and every bar at each fill level
+_BAR_WIDTH = 40
+_BARS = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+# S-unit labels, indexed by _s_meter_to_units(); shared by every ActivityResult instead of formatted per result
+_S_LABELS = tuple(f"S{units}" for units in range(10))
+
+# S-units for every raw S-meter reading the radio can return (0-255); 28 raw counts per unit, capped at S9
+_S_UNITS = bytes(min(9, raw // 28) for raw in range(256))
+
+
+@dataclass(slots=True, frozen=True)
 class ScanResult:
     """Single frequency scan result"""
 
@@ -36,7 +51,7 @@ class ScanResult:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActivityResult:
     """Active frequency detection result"""
 
@@ -46,6 +61,12 @@ class ActivityResult:
     s_level_text: str
 
 
+@lru_cache(maxsize=4096)
+def _activity_row(result: ActivityResult) -> str:
+    """One line of format_activity_results(); cached since a monitor redraws the same signals repeatedly."""
+    return f"{result.frequency_mhz:8.3f} MHz - {result.s_level_text:4} ({result.s_meter:3})"
+
+
 class BandScanner:
     """
     Band scanning capability for FT-991A.
@@ -70,7 +91,7 @@ class BandScanner:
     """
 
     # HF amateur band voice segments (Hz)
-    HF_VOICE_BANDS = [
+    HF_VOICE_BANDS = (
         (1_800_000, 2_000_000),  # 160m
         (3_500_000, 4_000_000),  # 80m
         (5_330_000, 5_404_000),  # 60m
@@ -81,7 +102,8 @@ class BandScanner:
         (21_000_000, 21_450_000),  # 15m
         (24_890_000, 24_990_000),  # 12m
         (28_000_000, 29_700_000),  # 10m
-    ]
+    )
+    HF_BAND_NAMES = ("160m", "80m", "60m", "40m", "30m", "20m", "17m", "15m", "12m", "10m")
 
     def __init__(self, radio: FT991A):
         """Initialize scanner with radio instance."""
@@ -100,14 +122,15 @@ class BandScanner:
         if self._original_frequency:
             self.radio.set_frequency_a(self._original_frequency)
         if self._original_mode:
-            # Convert mode string back to Mode enum
-            for mode in Mode:
-                if mode.name == self._original_mode:
-                    self.radio.set_mode(mode)
-                    break
+            # Convert mode name back to Mode enum; unknown names leave the mode alone
+            mode = Mode.__members__.get(self._original_mode)
+            if mode is not None:
+                self.radio.set_mode(mode)
         logger.debug(f"Restored radio state: {self._original_frequency} Hz, {self._original_mode}")
 
-    def scan_band(self, start_hz: int, end_hz: int, step_hz: int, dwell_ms: int = 150) -> List[Tuple[int, int]]:
+    def scan_band(
+        self, start_hz: int, end_hz: int, step_hz: int, dwell_ms: int = 150, restore_state: bool = True
+    ) -> List[Tuple[int, int]]:
         """
         Scan a frequency band and return S-meter readings.
 
@@ -116,39 +139,50 @@ class BandScanner:
             end_hz: Ending frequency in Hz
             step_hz: Step size in Hz
             dwell_ms: Dwell time per frequency in milliseconds
+            restore_state: Save the VFO/mode first and put them back afterwards;
+                multi-band sweeps pass False and restore once at the end
 
         Returns:
             List of (frequency_hz, s_meter) tuples
+
+        Raises:
+            ValueError: If step_hz is not positive
         """
+        if step_hz <= 0:
+            raise ValueError("step_hz must be positive")
+
         logger.info(f"Scanning {start_hz:,} - {end_hz:,} Hz (step: {step_hz:,} Hz, dwell: {dwell_ms}ms)")
 
-        self._save_radio_state()
+        if restore_state:
+            self._save_radio_state()
         results = []
         dwell_sec = dwell_ms / 1000.0
 
+        frequencies = range(start_hz, end_hz + 1, step_hz)
+
         try:
-            current_freq = start_hz
-            while current_freq <= end_hz:
-                # Tune to frequency
-                self.radio.set_frequency_a(current_freq)
+            if frequencies:
+                # Tune to the first frequency; the S-meter query gives the silent FA set an answer to wait on
+                self.radio.tune_and_read_s_meter(frequencies[0])
 
+            for index, current_freq in enumerate(frequencies):
                 # Wait for settling
                 time.sleep(dwell_sec)
 
-                # Read S-meter
-                s_meter = self.radio.get_s_meter()
+                # Read S-meter and step to the next frequency in the same exchange
+                next_freq = frequencies[index + 1] if index + 1 < len(frequencies) else None
+                s_meter = self.radio.read_s_meter_and_tune(next_freq)
                 results.append((current_freq, s_meter))
 
                 logger.debug(f"{current_freq:,} Hz: S{self._s_meter_to_units(s_meter)}")
 
-                current_freq += step_hz
-
         except KeyboardInterrupt:
             logger.info("Scan interrupted by user")
         except Exception as e:
             logger.error(f"Scan error: {e}")
         finally:
-            self._restore_radio_state()
+            if restore_state:
+                self._restore_radio_state()
 
         logger.info(f"Scan complete: {len(results)} frequencies")
         return results
@@ -170,24 +204,20 @@ class BandScanner:
 
         active_frequencies = []
 
-        for start_hz, end_hz in self.HF_VOICE_BANDS:
-            # Quick scan with larger steps for activity detection
-            step_hz = min(25000, (end_hz - start_hz) // 20)  # 20 points per band max
-
-            scan_results = self.scan_band(start_hz, end_hz, step_hz, dwell_ms=100)
+        # One save/restore around the whole sweep instead of retuning home between bands
+        self._save_radio_state()
+        try:
+            for start_hz, end_hz in self.HF_VOICE_BANDS:
+                # Quick scan with larger steps for activity detection
+                step_hz = min(25000, (end_hz - start_hz) // 20)  # 20 points per band max
 
-            for freq_hz, s_meter in scan_results:
-                if s_meter >= threshold:
-                    result = ActivityResult(
-                        frequency_hz=freq_hz,
-                        s_meter=s_meter,
-                        frequency_mhz=freq_hz / 1e6,
-                        s_level_text=f"S{self._s_meter_to_units(s_meter)}",
-                    )
-                    active_frequencies.append(result)
+                scan_results = self.scan_band(start_hz, end_hz, step_hz, dwell_ms=100, restore_state=False)
+                active_frequencies.extend(self._activity_above(scan_results, threshold))
+        finally:
+            self._restore_radio_state()
 
         # Sort by frequency
-        active_frequencies.sort(key=lambda x: x.frequency_hz)
+        active_frequencies.sort(key=_by_frequency)
 
         logger.info(f"Found {len(active_frequencies)} active frequencies")
         return active_frequencies
@@ -221,37 +251,75 @@ class BandScanner:
         Returns:
             List of ActivityResult objects for all detected signals
         """
-        logger.info("Starting full HF band sweep (160m-10m)")
+        step_hz = 10000  # Medium 10 kHz steps for comprehensive coverage
+        dwell_ms = 150
+        total_steps = self._total_scan_steps(step_hz)
+        logger.info(
+            f"Starting full HF band sweep (160m-10m): {total_steps} steps, ~{total_steps * dwell_ms / 1000:.0f}s"
+        )
 
         all_activity = []
 
-        for i, (start_hz, end_hz) in enumerate(self.HF_VOICE_BANDS):
-            band_name = ["160m", "80m", "60m", "40m", "30m", "20m", "17m", "15m", "12m", "10m"][i]
-            logger.info(f"Scanning {band_name} band: {start_hz/1e6:.3f} - {end_hz/1e6:.3f} MHz")
-
-            # Medium step size for comprehensive coverage
-            step_hz = 10000  # 10 kHz steps
+        # One save/restore around the whole sweep instead of retuning home between bands
+        self._save_radio_state()
+        try:
+            for band_name, (start_hz, end_hz) in zip(self.HF_BAND_NAMES, self.HF_VOICE_BANDS):
+                logger.info(f"Scanning {band_name} band: {start_hz/1e6:.3f} - {end_hz/1e6:.3f} MHz")
 
-            scan_results = self.scan_band(start_hz, end_hz, step_hz, dwell_ms=150)
+                scan_results = self.scan_band(start_hz, end_hz, step_hz, dwell_ms=dwell_ms, restore_state=False)
 
-            # Add all results above noise floor
-            noise_threshold = 10  # Low threshold to catch weak signals
-            for freq_hz, s_meter in scan_results:
-                if s_meter >= noise_threshold:
-                    result = ActivityResult(
-                        frequency_hz=freq_hz,
-                        s_meter=s_meter,
-                        frequency_mhz=freq_hz / 1e6,
-                        s_level_text=f"S{self._s_meter_to_units(s_meter)}",
-                    )
-                    all_activity.append(result)
+                # Add all results above noise floor
+                noise_threshold = 10  # Low threshold to catch weak signals
+                all_activity.extend(self._activity_above(scan_results, noise_threshold))
+        finally:
+            self._restore_radio_state()
 
         # Sort by frequency
-        all_activity.sort(key=lambda x: x.frequency_hz)
+        all_activity.sort(key=_by_frequency)
 
         logger.info(f"HF sweep complete: {len(all_activity)} signals detected")
         return all_activity
 
+    def plan_hf_sweep(self, step_hz: int = 10000, dwell_ms: int = 150) -> Dict[str, Tuple[int, float]]:
+        """
+        Dry-run an HF sweep: steps and estimated seconds per band, without touching the radio.
+
+        The estimate counts dwell time only; each step also costs one CAT exchange.
+
+        Args:
+            step_hz: Step size in Hz
+            dwell_ms: Dwell time per frequency in milliseconds
+
+        Returns:
+            Dict of band name -> (steps, estimated_seconds)
+        """
+        if step_hz <= 0:
+            raise ValueError("step_hz must be positive")
+
+        plan = {}
+        for band_name, (start_hz, end_hz) in zip(self.HF_BAND_NAMES, self.HF_VOICE_BANDS):
+            steps = len(range(start_hz, end_hz + 1, step_hz))
+            plan[band_name] = (steps, steps * dwell_ms / 1000)
+        return plan
+
+    def _total_scan_steps(self, step_hz: int) -> int:
+        """Number of frequencies a sweep of every HF_VOICE_BANDS segment visits at step_hz."""
+        return sum(len(range(start_hz, end_hz + 1, step_hz)) for start_hz, end_hz in self.HF_VOICE_BANDS)
+
+    def _activity_above(self, scan_results: List[Tuple[int, int]], threshold: int) -> List[ActivityResult]:
+        """Build ActivityResults for the readings at or above threshold, in one pass."""
+        s_meter_to_units = self._s_meter_to_units
+        return [
+            ActivityResult(
+                frequency_hz=freq_hz,
+                s_meter=s_meter,
+                frequency_mhz=freq_hz / 1e6,
+                s_level_text=_S_LABELS[s_meter_to_units(s_meter)],
+            )
+            for freq_hz, s_meter in scan_results
+            if s_meter >= threshold
+        ]
+
     def format_scan_results(self, results: List[Tuple[int, int]], title: str = "Band Scan Results") -> str:
         """
         Format scan results as ASCII bar chart for terminal display.
@@ -269,20 +337,13 @@ class BandScanner:
         lines = [f"{title}", "=" * len(title), ""]
 
         # Find max S-meter value for scaling
-        max_s = max(s for _, s in results) if results else 1
-        bar_width = 40  # Terminal columns for bar
+        max_s = max(s for _, s in results)
+        scale_by = max_s if max_s > 0 else 1
+        s_meter_to_units = self._s_meter_to_units
 
         for freq_hz, s_meter in results:
-            freq_mhz = freq_hz / 1e6
-            s_units = self._s_meter_to_units(s_meter)
-
-            # Create bar
-            bar_length = int((s_meter / max_s) * bar_width) if max_s > 0 else 0
-            bar = "█" * bar_length + "░" * (bar_width - bar_length)
-
-            # Format line
-            line = f"{freq_mhz:8.3f} MHz │{bar}│ S{s_units:2} ({s_meter:3})"
-            lines.append(line)
+            bar = _BARS[s_meter * _BAR_WIDTH // scale_by]
+            lines.append(f"{freq_hz / 1e6:8.3f} MHz │{bar}│ S{s_meter_to_units(s_meter):2} ({s_meter:3})")
 
         # Add legend
         lines.extend(
@@ -307,9 +368,7 @@ class BandScanner:
 
         lines = [f"{title}", "=" * len(title), ""]
 
-        for result in results:
-            line = f"{result.frequency_mhz:8.3f} MHz - {result.s_level_text:4} ({result.s_meter:3})"
-            lines.append(line)
+        lines.extend(map(_activity_row, results))
 
         lines.extend(["", f"Total: {len(results)} active frequencies"])
 
@@ -322,11 +381,7 @@ class BandScanner:
         Approximate conversion based on typical FT-991A behavior.
         Each S-unit represents ~6dB, with S9 at about 50µV.
         """
-        if s_meter_raw <= 0:
-            return 0
-        elif s_meter_raw >= 255:
-            return 9
-        else:
-            # Linear approximation: 0-255 raw maps to 0-9 S-units
-            # Use 28 as threshold to get cleaner math (28*9 = 252, close to 255)
-            return min(9, s_meter_raw // 28)
+        if 0 <= s_meter_raw <= 255:
+            # Linear approximation: 0-255 raw maps to 0-9 S-units, precomputed in _S_UNITS
+            return _S_UNITS[s_meter_raw]
+        return 0 if s_meter_raw < 0 else 9
@@ -6,24 +6,28 @@ FastAPI + WebSocket server for real-time control of Yaesu FT-991A ham radio.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import struct
 import subprocess
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import httpx
 
 import serial.tools.list_ports
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from serial import SerialException
 
 from .cat import FT991A, Band, Mode
 
@@ -46,6 +50,93 @@ except ImportError:
     SOAPY_SDR_AVAILABLE = False
     logger.warning("SoapySDR not available - SDR functionality disabled")
 
+# Prefer scipy's multithreaded FFT for the SDR panadapter - fall back to numpy
+try:
+    import scipy.fft as scipy_fft
+
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
+
+
+def _fft(iq):
+    """Forward FFT of one IQ frame (the input buffer may be clobbered)."""
+    if SCIPY_FFT_AVAILABLE:
+        return scipy_fft.fft(iq, overwrite_x=True, workers=-1)
+    return np.fft.fft(iq)
+
+
+# Optional in-process ALSA capture for /ws/audio - falls back to an arecord subprocess
+try:
+    import alsaaudio
+
+    ALSAAUDIO_AVAILABLE = True
+except ImportError:
+    ALSAAUDIO_AVAILABLE = False
+
+
+# Binary /ws/sdr spectrum frames: header (center Hz, bandwidth Hz, bin count, unix time)
+# followed by one uint8 per bin, dB = count * SDR_DB_PER_COUNT + SDR_DB_OFFSET
+SDR_FRAME_HEADER = struct.Struct("<IIId")
+SDR_DB_PER_COUNT = 0.5
+SDR_DB_OFFSET = -100.0  # covers -100 .. +27.5 dB
+
+# Prefer orjson for WebSocket payloads - fall back to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(obj) -> str:
+    """Serialize a WebSocket payload to compact JSON text."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads_json(data):
+    """Parse a JSON WebSocket message (str or bytes); raises json.JSONDecodeError on bad input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def send_json(websocket: WebSocket, obj) -> None:
+    """Send a JSON text frame to a single WebSocket client."""
+    await websocket.send_text(dumps_json(obj))
+
+
+def dumps_json_bytes(obj) -> bytes:
+    """Serialize a WebSocket payload to compact UTF-8 JSON, skipping the str round trip."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Optional binary encodings for /ws, negotiated via Sec-WebSocket-Protocol
+# ("json" is the same JSON as the text frames, sent as bytes so it isn't re-encoded per send)
+BINARY_ENCODERS = {"json": dumps_json_bytes}
+# Matching decoders for binary frames a client sends in its negotiated encoding
+BINARY_DECODERS = {"json": loads_json}
+try:
+    import msgpack
+
+    BINARY_ENCODERS["msgpack"] = msgpack.packb
+    BINARY_DECODERS["msgpack"] = msgpack.unpackb
+except ImportError:
+    pass
+try:
+    import cbor2
+
+    BINARY_ENCODERS["cbor"] = cbor2.dumps
+    BINARY_DECODERS["cbor"] = cbor2.loads
+except ImportError:
+    pass
+
+
 # ── Data Models ──────────────────────────────────────────────
 
 
@@ -90,6 +181,7 @@ class ScanRequest(BaseModel):
     end_freq: int  # End frequency in Hz
     step: int  # Step size in Hz
     threshold: int  # S-meter threshold (0-255)
+    settle_ms: int = 200  # Longest wait for the S-meter to settle after each retune
 
 
 class MemoryRecallRequest(BaseModel):
@@ -118,11 +210,49 @@ app = FastAPI(title="FT-991A Web GUI", version="0.2.0")
 radio: Optional[FT991A] = None
 radio_connected = False
 tx_lockout = False  # Safety: prevents accidental PTT
-websocket_clients: Set[WebSocket] = set()
 
 # Scanner state
 scan_active = False
 scan_task: Optional[asyncio.Task] = None
+SCAN_BATCH_SIZE = 16  # Max progress points per scan_progress_batch frame
+SCAN_BATCH_INTERVAL = 0.25  # Max seconds between scan_progress_batch frames
+SCAN_STEP_PACING = 0.05  # CAT idle time left between steps for other callers
+SCAN_SETTLE_POLL = 0.04  # S-meter sampling interval while waiting for the receiver to settle
+SCAN_SETTLE_TOLERANCE = 2  # Consecutive S-meter readings this close count as settled
+SCAN_MAX_POINTS = 100_000  # Reject scans that would tie up the CAT link for days
+
+# Max frames buffered per /ws client before the oldest are dropped
+OUTBOUND_QUEUE_SIZE = 64
+AUDIO_QUEUE_SIZE = 8  # ~340 ms of PCM per /ws/audio client
+AUDIO_PERIOD_FRAMES = 2048  # ALSA period: 4096 bytes, ~42 ms at 48 kHz mono S16_LE
+AUDIO_POLL_INTERVAL = 0.02  # seconds to wait when the ALSA period isn't ready yet
+
+# Constant control frames, serialized once
+PONG_JSON = dumps_json({"type": "pong"})
+AUDIO_INFO_JSON = dumps_json(
+    {
+        "type": "audio_info",
+        "format": "S16_LE",
+        "sample_rate": 48000,
+        "channels": 1,
+        "chunk_size": AUDIO_PERIOD_FRAMES * 2,
+    }
+)
+
+# MR commands written per batch when listing memory channels (keeps the radio's input buffer shallow)
+MEMORY_BATCH_SIZE = 16
+
+# Memory read/recall/write commands for channels 0-99, encoded once (index by channel number)
+MR_CMDS = tuple(f"MR{ch:03d};".encode() for ch in range(100))
+MC_CMDS = tuple(f"MC{ch:03d};".encode() for ch in range(100))
+MW_CMDS = tuple(f"MW{ch:03d};".encode() for ch in range(100))
+
+# `arecord -l` card/device header and its "Subdevices: n/m" line
+_CARD_RE = re.compile(r"^card (\d+): (\S+) \[([^\]]+)\], device (\d+): ")
+_SUBDEV_RE = re.compile(r"^\s*Subdevices:\s*(\d+)/(\d+)")
+
+# /ws topics a client can subscribe to (all by default); connection events go to everyone
+WS_TOPICS = frozenset({"status", "scan"})
 
 # Monitor state
 monitor_active = False
@@ -132,131 +262,305 @@ monitor_start_time: Optional[datetime] = None
 monitor_clip_count = 0
 
 # Configuration
-radio_config = {"port": "/dev/ttyUSB0", "baudrate": 38400, "auto_reconnect": True}
+radio_config = {"port": "/dev/ttyUSB0", "baudrate": 38400, "auto_reconnect": True, "poll_interval": 0.5}
+
+# Status monitor wake-up (set when a /ws client connects)
+status_wakeup = asyncio.Event()
+MONITOR_IDLE_WAIT = 1.0  # seconds between idle checks when no clients are connected
+STATUS_HEARTBEAT = 5.0  # resend an unchanged status frame at least this often
+
+# The one thread that talks to the CAT link: calls run strictly in order, and a cancelled
+# awaiter can't let the next call start while its serial exchange is still in flight
+cat_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ft991a-cat")
+
+# Errors a CAT transaction can raise when the serial link misbehaves
+CAT_ERRORS = (SerialException, ConnectionError, TimeoutError)
+
+# Last serialized status frame from monitor_radio
+# ("ts" = last confirmed current, "sent" = last broadcast)
+_last_status = {"message": None, "text": None, "ts": 0.0, "sent": 0.0}
+
+# Last known VFO state, written through by get_status() polls and our own setters so the
+# memory endpoints don't need a full status read (front-panel changes age out after the TTL)
+VFO_CACHE_TTL = 2.0  # seconds
+_vfo_cache = {"a": None, "b": None, "mode": None, "ts": 0.0}
+
+# Setup wizard serial port cache (enumeration can be slow)
+PORTS_CACHE_TTL = 3.0  # seconds
+_ports_cache = {"ts": 0.0, "data": None}
+
+# Setup wizard test connections, keyed by (port, baudrate) -> (radio, last used)
+TEST_CONN_TTL = 5.0  # seconds
+_test_conn_cache: Dict[Tuple[str, int], Tuple[FT991A, float]] = {}
+_test_conn_reaper: Optional[asyncio.Task] = None
+
+# Silicon Labs USB vendor ID (CP2105 dual UART inside the FT-991A)
+CP210X_VID = 0x10C4
 
 # ── WebSocket Manager ────────────────────────────────────────
 
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # Per-client bounded outbound queue drained by its own sender task
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        # Negotiated binary subprotocol per client (None = JSON text frames)
+        self._encodings: Dict[WebSocket, Optional[str]] = {}
+        # Topics each client receives
+        self._topics: Dict[WebSocket, Set[str]] = {}
 
     async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        websocket_clients.add(websocket)
+        offered = websocket.headers.get("sec-websocket-protocol", "")
+        encoding = next((p.strip() for p in offered.split(",") if p.strip() in BINARY_ENCODERS), None)
+        await websocket.accept(subprotocol=encoding)
+        self.active_connections.add(websocket)
+        self._encodings[websocket] = encoding
+        self._topics[websocket] = set(WS_TOPICS)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        websocket_clients.discard(websocket)
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        self._encodings.pop(websocket, None)
+        self._topics.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender and sender is not asyncio.current_task():
+            sender.cancel()
+
+    def subscribe(self, websocket: WebSocket, topics):
+        """Limit a client to the given topics (unknown names are ignored)."""
+        if websocket in self._topics:
+            self._topics[websocket] = set(topics) & WS_TOPICS
+
+    def has_subscribers(self, topic: str) -> bool:
+        """True if any connected client receives the topic."""
+        return any(topic in topics for topics in self._topics.values())
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's queue so a slow client only delays itself."""
+        try:
+            while True:
+                # Send everything already queued before waiting again
+                frames = [await queue.get()]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                for frame in frames:
+                    if isinstance(frame, bytes):
+                        await websocket.send_bytes(frame)
+                    else:
+                        await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"WebSocket send failed: {e}")
+            self.disconnect(websocket)
+
+    def _enqueue(self, websocket: WebSocket, frame):
+        """Queue a frame for one client, dropping its oldest frame when full."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    def send(self, websocket: WebSocket, message: dict, text: Optional[str] = None):
+        """Queue a message for one client in its negotiated encoding."""
+        encoding = self._encodings.get(websocket)
+        if encoding:
+            self._enqueue(websocket, BINARY_ENCODERS[encoding](message))
+        else:
+            self._enqueue(websocket, text if text is not None else dumps_json(message))
+
+    async def receive(self, websocket: WebSocket):
+        """Wait for the client's next message: text frames are JSON, binary frames use its negotiated encoding.
+
+        Raises WebSocketDisconnect when the client goes away and ValueError on a frame that doesn't decode.
+        """
+        frame = await websocket.receive()
+        if frame["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(frame.get("code", 1000), frame.get("reason"))
+        if frame.get("bytes") is None:
+            return loads_json(frame["text"])
+        try:
+            return BINARY_DECODERS[self._encodings.get(websocket) or "json"](frame["bytes"])
+        except Exception as e:  # msgpack and cbor2 each raise their own decode errors
+            raise ValueError(f"Undecodable binary frame: {e}") from e
 
-    async def broadcast(self, message: dict):
+    async def broadcast(self, message: dict, text: Optional[str] = None, topic: Optional[str] = None):
+        """Queue a message for topic subscribers (everyone if topic is None), encoded once per subprotocol."""
         if not self.active_connections:
             return
 
-        dead_connections = []
+        frames: Dict[Optional[str], object] = {}
+        if text is not None:
+            frames[None] = text
         for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception as e:
-                logger.warning(f"WebSocket send failed: {e}")
-                dead_connections.append(connection)
+            if topic is not None and topic not in self._topics.get(connection, ()):
+                continue
+            encoding = self._encodings.get(connection)
+            if encoding not in frames:
+                frames[encoding] = BINARY_ENCODERS[encoding](message) if encoding else dumps_json(message)
+            self._enqueue(connection, frames[encoding])
 
-        # Clean up dead connections
-        for conn in dead_connections:
-            self.disconnect(conn)
+
+async def _enumerate_alsa_devices() -> List[str]:
+    """List capture PCMs for the radio's USB CODEC from one `arecord -L`, best first."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "arecord", "-L", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=3)
+    except (OSError, asyncio.TimeoutError):
+        return []
+
+    # PCM names start at column 0, their descriptions follow indented
+    pcms: List[Tuple[str, str]] = []
+    for line in stdout.decode(errors="replace").splitlines():
+        if line and not line[0].isspace():
+            pcms.append((line.strip(), ""))
+        elif pcms:
+            pcms[-1] = (pcms[-1][0], pcms[-1][1] + " " + line.strip())
+
+    codec = [name for name, desc in pcms if "CARD=CODEC" in name or "USB Audio CODEC" in desc or "PCM2903B" in desc]
+    # Raw hardware first, then the plug (format-converting) variants
+    return [n for n in codec if n.startswith("hw:")] + [n for n in codec if n.startswith("plughw:")]
 
 
 class AudioConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.audio_process = None  # asyncio.subprocess.Process
+        self.pcm = None  # alsaaudio.PCM when capturing in-process
         self.streaming_task: Optional[asyncio.Task] = None
+        self._device: Optional[str] = None  # capture device that worked this session
+        # Per-client PCM queue drained by its own writer task
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIO_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._client_writer(websocket, queue))
 
         # Start audio streaming if this is the first client
         if len(self.active_connections) == 1:
             await self.start_audio_stream()
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
 
         # Stop audio streaming if no more clients
         if len(self.active_connections) == 0:
             asyncio.ensure_future(self.stop_audio_stream())
 
-    async def broadcast_audio(self, data: bytes):
-        if not self.active_connections:
-            return
-
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_bytes(data)
-            except Exception as e:
-                logger.warning(f"Audio WebSocket send failed: {e}")
-                dead_connections.append(connection)
+    async def _client_writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued PCM to one client so a slow link never stalls the capture pipe."""
+        try:
+            while True:
+                await websocket.send_bytes(await queue.get())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Audio WebSocket send failed: {e}")
+            self.disconnect(websocket)
 
-        for conn in dead_connections:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+    async def broadcast_audio(self, data: bytes):
+        # Real-time audio: a client that falls behind loses its oldest chunk
+        for queue in self._queues.values():
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
 
     async def start_audio_stream(self):
         """Start audio capture from PCM2903B CODEC using async subprocess"""
-        if self.audio_process or self.streaming_task:
+        if self.audio_process or self.pcm or self.streaming_task:
             return
 
         try:
-            # Try audio devices in order
-            audio_devices = [
-                "hw:CARD=CODEC",
-                "hw:CARD=CODEC,DEV=0",
-                "plughw:CARD=CODEC,DEV=0",
-                "hw:2,0",
-                "hw:1,0",
-            ]
-
-            device_found = None
-            for device in audio_devices:
-                try:
-                    test = await asyncio.create_subprocess_exec(
-                        "arecord",
-                        "-D",
-                        device,
-                        "-f",
-                        "S16_LE",
-                        "-r",
-                        "48000",
-                        "-c",
-                        "1",
-                        "-t",
-                        "raw",
-                        "-d",
-                        "1",
-                        stdout=asyncio.subprocess.DEVNULL,
-                        stderr=asyncio.subprocess.DEVNULL,
-                    )
-                    await asyncio.wait_for(test.wait(), timeout=3)
-                    if test.returncode == 0:
-                        device_found = device
-                        logger.info(f"Audio device found: {device}")
-                        break
-                except (asyncio.TimeoutError, Exception):
+            # Reuse this session's device, else pick the CODEC from one enumeration
+            device_found = self._device
+            if not device_found:
+                candidates = await _enumerate_alsa_devices()
+                if candidates:
+                    device_found = candidates[0]
+                    logger.info(f"Audio device found: {device_found}")
+
+            # Enumeration found nothing - probe likely devices in order
+            if not device_found:
+                audio_devices = [
+                    "hw:CARD=CODEC",
+                    "hw:CARD=CODEC,DEV=0",
+                    "plughw:CARD=CODEC,DEV=0",
+                    "hw:2,0",
+                    "hw:1,0",
+                ]
+
+                for device in audio_devices:
                     try:
-                        test.kill()
-                    except:
-                        pass
-                    continue
+                        test = await asyncio.create_subprocess_exec(
+                            "arecord",
+                            "-D",
+                            device,
+                            "-f",
+                            "S16_LE",
+                            "-r",
+                            "48000",
+                            "-c",
+                            "1",
+                            "-t",
+                            "raw",
+                            "-d",
+                            "1",
+                            stdout=asyncio.subprocess.DEVNULL,
+                            stderr=asyncio.subprocess.DEVNULL,
+                        )
+                        await asyncio.wait_for(test.wait(), timeout=3)
+                        if test.returncode == 0:
+                            device_found = device
+                            logger.info(f"Audio device found: {device}")
+                            break
+                    except (asyncio.TimeoutError, Exception):
+                        try:
+                            test.kill()
+                        except:
+                            pass
+                        continue
 
             if not device_found:
                 logger.error("No compatible audio capture device found")
                 return
 
+            # Capture in-process when pyalsaaudio is installed - no subprocess or pipe copy
+            if ALSAAUDIO_AVAILABLE:
+                try:
+                    self.pcm = alsaaudio.PCM(
+                        alsaaudio.PCM_CAPTURE,
+                        alsaaudio.PCM_NONBLOCK,
+                        rate=48000,
+                        channels=1,
+                        format=alsaaudio.PCM_FORMAT_S16_LE,
+                        periodsize=AUDIO_PERIOD_FRAMES,
+                        device=device_found,
+                    )
+                    self._device = device_found
+                    self.streaming_task = asyncio.create_task(self._stream_alsa())
+                    logger.info(f"Audio streaming started (ALSA): {device_found}")
+                    return
+                except alsaaudio.ALSAAudioError as e:
+                    logger.warning(f"ALSA capture failed on {device_found}, falling back to arecord: {e}")
+                    self.pcm = None
+
             # Start async audio capture
             self.audio_process = await asyncio.create_subprocess_exec(
                 "arecord",
@@ -274,6 +578,7 @@ class AudioConnectionManager:
                 stderr=asyncio.subprocess.DEVNULL,
             )
 
+            self._device = device_found
             self.streaming_task = asyncio.create_task(self._stream_audio())
             logger.info(f"Audio streaming started: {device_found}")
 
@@ -285,11 +590,21 @@ class AudioConnectionManager:
         """Non-blocking audio streaming to WebSocket clients"""
         chunk_size = 4096  # ~42ms at 48kHz mono 16-bit
 
+        received = False
+
         try:
             while self.audio_process and self.audio_process.returncode is None:
-                data = await self.audio_process.stdout.read(chunk_size)
-                if not data:
+                # Whole chunks only - one allocation per chunk, shared by every client queue
+                try:
+                    data = await self.audio_process.stdout.readexactly(chunk_size)
+                except asyncio.IncompleteReadError as e:
+                    if e.partial:
+                        await self.broadcast_audio(e.partial)
+                    elif not received:
+                        # arecord produced nothing - re-pick the device next time
+                        self._device = None
                     break
+                received = True
                 await self.broadcast_audio(data)
         except asyncio.CancelledError:
             pass
@@ -298,12 +613,41 @@ class AudioConnectionManager:
         finally:
             await self.stop_audio_stream()
 
+    async def _stream_alsa(self):
+        """Stream PCM periods read in-process from a non-blocking ALSA handle"""
+        received = False
+
+        try:
+            while self.pcm:
+                length, data = self.pcm.read()
+                if length > 0:
+                    received = True
+                    await self.broadcast_audio(data)
+                else:
+                    # No full period yet (or an overrun was just recovered)
+                    await asyncio.sleep(AUDIO_POLL_INTERVAL)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Audio streaming error: {e}")
+            if not received:
+                self._device = None
+        finally:
+            await self.stop_audio_stream()
+
     async def stop_audio_stream(self):
         """Stop audio capture and streaming"""
         if self.streaming_task and not self.streaming_task.done():
             self.streaming_task.cancel()
         self.streaming_task = None
 
+        if self.pcm:
+            try:
+                self.pcm.close()
+            except Exception:
+                pass
+            self.pcm = None
+
         if self.audio_process:
             try:
                 self.audio_process.terminate()
@@ -320,44 +664,83 @@ class AudioConnectionManager:
 
 class SDRConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.sdr_device = None
         self.streaming_task: Optional[asyncio.Task] = None
         self.bandwidth = 2000000  # Default 2 MHz
         self.fft_size = 1024  # Default FFT size
         self.frame_rate = 10  # Target ~10 fps
+        # Per-stream buffers, allocated once in start_sdr_stream
+        self._iq_buf = None
+        self._mag_buf = None
+        self._quant_buf = None
+        self._frame_buf = None
+        self._hello_json: Optional[str] = None  # cached /ws/sdr greeting, cleared when settings change
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        # The panadapter follows VFO-A from monitor_radio's polls
+        status_wakeup.set()
 
         # Start SDR streaming if this is the first client
         if len(self.active_connections) == 1:
             await self.start_sdr_stream()
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
         # Stop SDR streaming if no more clients
         if len(self.active_connections) == 0:
             asyncio.ensure_future(self.stop_sdr_stream())
 
     async def broadcast_sdr_data(self, data: dict):
+        await self._broadcast(dumps_json(data))
+
+    async def broadcast_sdr_binary(self, data: bytes):
+        await self._broadcast(data)
+
+    async def _broadcast(self, payload):
+        """Send one text or binary frame to every client concurrently."""
         if not self.active_connections:
             return
 
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(data))
-            except Exception as e:
-                logger.warning(f"SDR WebSocket send failed: {e}")
-                dead_connections.append(connection)
+        connections = list(self.active_connections)
+        if isinstance(payload, bytes):
+            sends = (conn.send_bytes(payload) for conn in connections)
+        else:
+            sends = (conn.send_text(payload) for conn in connections)
+        results = await asyncio.gather(*sends, return_exceptions=True)
+
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"SDR WebSocket send failed: {result}")
+                self.active_connections.discard(conn)
 
-        for conn in dead_connections:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+    def sdr_info(self) -> dict:
+        """Stream parameters, including how to decode the binary spectrum frames."""
+        return {
+            "type": "sdr_info",
+            "bandwidth": self.bandwidth,
+            "fft_size": self.fft_size,
+            "sample_rate": self.bandwidth,
+            "db_per_count": SDR_DB_PER_COUNT,
+            "db_offset": SDR_DB_OFFSET,
+        }
+
+    def hello_json(self) -> str:
+        """Serialized sdr_info greeting for new /ws/sdr clients."""
+        if self._hello_json is None:
+            self._hello_json = dumps_json(
+                {
+                    **self.sdr_info(),
+                    "driver": "sdrplay",
+                    "device": "RSP2pro",
+                    "serial": "1717050C11",
+                    "available": SOAPY_SDR_AVAILABLE,
+                }
+            )
+        return self._hello_json
 
     async def start_sdr_stream(self):
         """Start SDR streaming from RSP2pro using SoapySDR"""
@@ -385,6 +768,7 @@ class SDRConnectionManager:
             self.sdr_device.setAntenna(SoapySDR.SOAPY_SDR_RX, 0, "RX")
 
             # Setup stream
+            self._alloc_fft_buffers()
             rx_stream = self.sdr_device.setupStream(SoapySDR.SOAPY_SDR_RX, SoapySDR.SOAPY_SDR_CF32)
             self.sdr_device.activateStream(rx_stream)
 
@@ -394,46 +778,66 @@ class SDRConnectionManager:
             logger.info(f"SDR streaming started: {self.bandwidth/1e6:.1f} MHz bandwidth")
 
             # Notify clients
-            await self.broadcast_sdr_data(
-                {
-                    "type": "sdr_info",
-                    "bandwidth": self.bandwidth,
-                    "fft_size": self.fft_size,
-                    "sample_rate": self.bandwidth,
-                    "center_freq": 14074000,
-                }
-            )
+            await self.broadcast_sdr_data({**self.sdr_info(), "center_freq": 14074000})
 
         except Exception as e:
             logger.error(f"Failed to start SDR stream: {e}")
             await self.stop_sdr_stream()
             await self.broadcast_sdr_data({"type": "sdr_error", "message": f"SDR initialization failed: {str(e)}"})
 
+    def _alloc_fft_buffers(self):
+        """Allocate the IQ, magnitude and outgoing-frame buffers for the current FFT size."""
+        self._iq_buf = np.empty(self.fft_size, np.complex64)
+        self._mag_buf = np.empty(self.fft_size, np.float32)
+        # The quantized spectrum is written straight into the frame, right after its header
+        self._frame_buf = bytearray(SDR_FRAME_HEADER.size + self.fft_size)
+        self._quant_buf = np.frombuffer(self._frame_buf, np.uint8, offset=SDR_FRAME_HEADER.size)
+        # Build the FFT plan/twiddles for this size now rather than on the first streamed frame
+        _fft(np.zeros(self.fft_size, np.complex64))
+
     async def _stream_sdr_data(self, rx_stream):
         """Stream IQ data and perform FFT analysis"""
         buffer_size = self.fft_size
+        iq, mag, quant, frame = self._iq_buf, self._mag_buf, self._quant_buf, self._frame_buf
+        shift = buffer_size // 2
 
         try:
+            filled = 0
+            period = 1.0 / self.frame_rate
+            next_deadline = time.monotonic() + period
             while self.sdr_device:
-                # Read IQ samples
-                buffer = np.array([0] * buffer_size, np.complex64)
-                sr = self.sdr_device.readStream(rx_stream, [buffer], buffer_size)
+                # Read IQ samples straight into the stream's buffer, keeping short reads
+                sr = self.sdr_device.readStream(rx_stream, [iq[filled:]], buffer_size - filled)
 
-                if sr.ret != buffer_size:
+                if sr.ret < 0:
+                    # Timeout/overflow - the partial frame is no longer contiguous
+                    filled = 0
+                    continue
+                filled += sr.ret
+                if filled < buffer_size:
                     continue
+                filled = 0
 
-                # Perform FFT
-                fft_data = np.fft.fftshift(np.fft.fft(buffer))
-                power_spectrum = 20 * np.log10(np.abs(fft_data) + 1e-10)  # Convert to dB
+                # Perform FFT and convert to dB in place - an out= ufunc chain with no
+                # temporaries (numexpr was several times slower at these FFT sizes)
+                np.abs(_fft(iq), out=mag)
+                mag += 1e-10
+                np.log10(mag, out=mag)
+                mag *= 20.0
 
-                # Get current radio frequency for centering
-                center_freq = 14074000  # Default
-                if radio_connected and radio:
-                    try:
-                        status = radio.get_status()
-                        center_freq = status.frequency_a
-                    except:
-                        pass
+                # Quantize dB to uint8 counts
+                mag -= SDR_DB_OFFSET
+                mag *= 1.0 / SDR_DB_PER_COUNT
+                mag += 0.5
+                np.clip(mag, 0, 255, out=mag)
+
+                # fftshift while narrowing to uint8: swap halves straight into the output buffer
+                np.copyto(quant[:shift], mag[buffer_size - shift :], casting="unsafe")
+                np.copyto(quant[shift:], mag[: buffer_size - shift], casting="unsafe")
+
+                # Centre on VFO-A as last polled by monitor_radio - no CAT traffic per frame
+                last = _last_status["message"]
+                center_freq = last["data"]["frequency_a"] if radio_connected and last else 14074000
 
                 # Update SDR center frequency to match radio
                 try:
@@ -443,19 +847,20 @@ class SDRConnectionManager:
                 except:
                     pass
 
-                # Broadcast FFT data
-                await self.broadcast_sdr_data(
-                    {
-                        "type": "sdr_fft",
-                        "bins": power_spectrum.tolist(),
-                        "center_freq": center_freq,
-                        "bandwidth": self.bandwidth,
-                        "timestamp": time.time(),
-                    }
-                )
-
-                # Control frame rate
-                await asyncio.sleep(1.0 / self.frame_rate)
+                # Broadcast FFT data as one binary frame
+                SDR_FRAME_HEADER.pack_into(frame, 0, center_freq, self.bandwidth, buffer_size, time.time())
+                await self.broadcast_sdr_binary(bytes(frame))
+
+                # Pace frames against a fixed schedule so FFT/broadcast time isn't added on top
+                now = time.monotonic()
+                delay = next_deadline - now
+                if delay > 0:
+                    next_deadline += period
+                    await asyncio.sleep(delay)
+                else:
+                    # Running behind - restart the schedule rather than bursting to catch up
+                    next_deadline = now + period
+                    await asyncio.sleep(0)
 
         except asyncio.CancelledError:
             pass
@@ -496,6 +901,7 @@ class SDRConnectionManager:
             raise ValueError(f"Invalid bandwidth. Must be one of: {valid_bandwidths}")
 
         self.bandwidth = bandwidth_hz
+        self._hello_json = None
 
         # Restart stream with new bandwidth if active
         if self.sdr_device:
@@ -509,6 +915,12 @@ class SDRConnectionManager:
             raise ValueError(f"Invalid FFT size. Must be one of: {valid_sizes}")
 
         self.fft_size = fft_size
+        self._hello_json = None
+
+        # Restart stream so the buffers and FFT plan match the new size
+        if self.sdr_device:
+            await self.stop_sdr_stream()
+            await self.start_sdr_stream()
 
 
 manager = ConnectionManager()
@@ -518,13 +930,25 @@ sdr_manager = SDRConnectionManager()
 # ── Radio Control Functions ──────────────────────────────────
 
 
+def require_radio() -> FT991A:
+    """Endpoint dependency: the connected radio, or 503 if there isn't one."""
+    if not radio_connected or radio is None:
+        raise HTTPException(status_code=503, detail="Radio not connected")
+    return radio
+
+
+async def radio_call(func, *args):
+    """Run a blocking FT991A call on the CAT worker thread, one transaction at a time."""
+    return await asyncio.get_running_loop().run_in_executor(cat_executor, func, *args)
+
+
 async def connect_radio():
     """Connect to the radio and start monitoring."""
     global radio, radio_connected
 
     try:
         radio = FT991A(radio_config["port"], radio_config["baudrate"])
-        radio_connected = radio.connect()
+        radio_connected = await radio_call(radio.connect)
 
         if radio_connected:
             logger.info(f"Connected to FT-991A on {radio_config['port']}")
@@ -549,52 +973,105 @@ async def disconnect_radio():
     if radio:
         try:
             # Safety: ensure PTT is off
-            radio.ptt_off()
+            await radio_call(radio.ptt_off)
         except:
             pass
-        radio.disconnect()
+        await radio_call(radio.disconnect)
         radio = None
         radio_connected = False
         logger.info("Disconnected from radio")
         await manager.broadcast({"type": "connection", "status": "disconnected"})
 
 
+def _remember_vfo(**values):
+    """Write VFO state through to the cache (None forgets a value the radio changed on its own)."""
+    _vfo_cache.update(values, ts=time.monotonic())
+
+
+def _cached_vfo(key: str):
+    """Cached VFO value, or None when unknown or older than VFO_CACHE_TTL."""
+    if time.monotonic() - _vfo_cache["ts"] < VFO_CACHE_TTL:
+        return _vfo_cache[key]
+    return None
+
+
+def _status_payload(status) -> dict:
+    """Build the status dict shared by /api/status and the /ws status frames."""
+    _remember_vfo(a=status.frequency_a, b=status.frequency_b, mode=status.mode)
+    return {
+        "frequency_a": status.frequency_a,
+        "frequency_b": status.frequency_b,
+        "mode": status.mode,
+        "tx_active": status.tx_active,
+        "squelch_open": status.squelch_open,
+        "s_meter": status.s_meter,
+        "power_output": status.power_output,
+        "swr": status.swr,
+        "tx_lockout": tx_lockout,
+    }
+
+
+def _status_frame(payload: dict) -> Tuple[dict, str]:
+    """Build and serialize one status frame, caching it for new /ws clients."""
+    message = {"type": "status", "timestamp": datetime.now().isoformat(), "data": payload}
+    last, text = _last_status["message"], _last_status["text"]
+    if last is not None and text is not None and last["data"] == payload:
+        # Heartbeat of an unchanged status - only the timestamp differs from the cached encoding
+        text = text.replace(last["timestamp"], message["timestamp"], 1)
+    else:
+        text = dumps_json(message)
+    now = time.monotonic()
+    _last_status.update(message=message, text=text, ts=now, sent=now)
+    return message, text
+
+
 async def monitor_radio():
     """Background task to monitor radio status and broadcast updates."""
     global radio, radio_connected
 
     while radio_connected and radio:
         try:
+            # No status subscribers or panadapter - don't poll the CAT link until someone wants it
+            if not manager.has_subscribers("status") and not sdr_manager.active_connections:
+                status_wakeup.clear()
+                try:
+                    await asyncio.wait_for(status_wakeup.wait(), timeout=MONITOR_IDLE_WAIT)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
             # Get comprehensive status
-            status = radio.get_status()
+            status = await radio_call(radio.get_status)
+            payload = _status_payload(status)
+
+            last = _last_status["message"]
+            now = time.monotonic()
+            fresh = last is not None and now - _last_status["sent"] < STATUS_HEARTBEAT
+            if fresh and last["data"] == payload:
+                # Nothing changed - skip the broadcast, the cached frame is still current
+                _last_status["ts"] = now
+            elif fresh and {**last["data"], "s_meter": payload["s_meter"]} == payload:
+                # Only the S-meter moved - send just that and patch the cached frame
+                last["data"]["s_meter"] = payload["s_meter"]
+                _last_status.update(text=None, ts=now)
+                await manager.broadcast({"type": "s_meter", "s_meter": payload["s_meter"]}, topic="status")
+            else:
+                message, text = _status_frame(payload)
 
-            # Broadcast to all connected clients
-            await manager.broadcast(
-                {
-                    "type": "status",
-                    "timestamp": datetime.now().isoformat(),
-                    "data": {
-                        "frequency_a": status.frequency_a,
-                        "frequency_b": status.frequency_b,
-                        "mode": status.mode,
-                        "tx_active": status.tx_active,
-                        "squelch_open": status.squelch_open,
-                        "s_meter": status.s_meter,
-                        "power_output": status.power_output,
-                        "swr": status.swr,
-                        "tx_lockout": tx_lockout,
-                    },
-                }
-            )
+                # Broadcast to all connected clients
+                await manager.broadcast(message, text=text, topic="status")
 
-            # Sleep before next poll
-            await asyncio.sleep(0.5)  # 2 Hz update rate
+            # Sleep before next poll (default 0.5 s = 2 Hz update rate)
+            await asyncio.sleep(radio_config["poll_interval"])
 
-        except Exception as e:
-            logger.error(f"Monitor error: {e}")
+        except CAT_ERRORS as e:
+            logger.error(f"Monitor lost the radio: {e}")
             radio_connected = False
             await manager.broadcast({"type": "connection", "status": "lost", "message": str(e)})
             break
+        except Exception:
+            logger.exception("Unexpected monitor error")
+            await asyncio.sleep(radio_config["poll_interval"])
 
 
 # ── Static Files ─────────────────────────────────────────────
@@ -603,19 +1080,34 @@ async def monitor_radio():
 static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
 
-# Mount static files
+# Browser cache lifetime for index.html (conditional GETs revalidate via ETag)
+INDEX_MAX_AGE = 60
+
+# index.html is served from memory - read and hashed once at startup
+try:
+    INDEX_HTML: Optional[bytes] = (static_dir / "index.html").read_bytes()
+    INDEX_ETAG = f'"{hashlib.md5(INDEX_HTML).hexdigest()}"'
+except FileNotFoundError:
+    INDEX_HTML = None
+    INDEX_ETAG = ""
+
+# Mount static files (StaticFiles already answers If-None-Match with 304)
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 # ── Web Routes ───────────────────────────────────────────────
 
 
 @app.get("/", response_class=HTMLResponse)
-async def get_root():
+async def get_root(request: Request):
     """Serve the main HTML interface."""
-    try:
-        return FileResponse(str(static_dir / "index.html"))
-    except FileNotFoundError:
-        return HTMLResponse("""
+    if INDEX_HTML is not None:
+        # Conditional GET - the browser's copy is still current
+        if request.headers.get("if-none-match") == INDEX_ETAG:
+            return Response(status_code=304, headers={"ETag": INDEX_ETAG})
+        return HTMLResponse(
+            INDEX_HTML, headers={"ETag": INDEX_ETAG, "Cache-Control": f"public, max-age={INDEX_MAX_AGE}"}
+        )
+    return HTMLResponse("""
         <html>
         <body>
         <h1>FT-991A Web GUI</h1>
@@ -639,67 +1131,45 @@ async def api_version():
 
 
 @app.get("/api/status")
-async def api_status():
+async def api_status(rig: FT991A = Depends(require_radio)):
     """Get current radio status."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        status = radio.get_status()
-        return {
-            "connected": True,
-            "status": {
-                "frequency_a": status.frequency_a,
-                "frequency_b": status.frequency_b,
-                "mode": status.mode,
-                "tx_active": status.tx_active,
-                "squelch_open": status.squelch_open,
-                "s_meter": status.s_meter,
-                "power_output": status.power_output,
-                "swr": status.swr,
-                "tx_lockout": tx_lockout,
-            },
-        }
+        status = await radio_call(rig.get_status)
+        return {"connected": True, "status": _status_payload(status)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/frequency/a")
-async def set_frequency_a(req: FrequencyRequest):
+async def set_frequency_a(req: FrequencyRequest, rig: FT991A = Depends(require_radio)):
     """Set VFO-A frequency."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        radio.set_frequency_a(req.frequency)
+        await radio_call(rig.set_frequency_a, req.frequency)
+        _remember_vfo(a=req.frequency)
         return {"success": True, "frequency": req.frequency}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/frequency/b")
-async def set_frequency_b(req: FrequencyRequest):
+async def set_frequency_b(req: FrequencyRequest, rig: FT991A = Depends(require_radio)):
     """Set VFO-B frequency."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        radio.set_frequency_b(req.frequency)
+        await radio_call(rig.set_frequency_b, req.frequency)
+        _remember_vfo(b=req.frequency)
         return {"success": True, "frequency": req.frequency}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/mode")
-async def set_mode(req: ModeRequest):
+async def set_mode(req: ModeRequest, rig: FT991A = Depends(require_radio)):
     """Set operating mode."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
         # Convert mode name to enum
         mode = Mode[req.mode]
-        radio.set_mode(mode)
+        await radio_call(rig.set_mode, mode)
+        _remember_vfo(mode=mode.name)
         return {"success": True, "mode": req.mode}
     except KeyError:
         raise HTTPException(status_code=400, detail=f"Invalid mode: {req.mode}")
@@ -708,29 +1178,24 @@ async def set_mode(req: ModeRequest):
 
 
 @app.post("/api/power")
-async def set_power(req: PowerRequest):
+async def set_power(req: PowerRequest, rig: FT991A = Depends(require_radio)):
     """Set TX power level."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        radio.set_power_level(req.power)
+        await radio_call(rig.set_power_level, req.power)
         return {"success": True, "power": req.power}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/band")
-async def set_band(req: BandRequest):
+async def set_band(req: BandRequest, rig: FT991A = Depends(require_radio)):
     """Set band (changes frequency)."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
         # Convert band name to enum
         band_name = f"HF_{req.band}" if not req.band.startswith(("VHF_", "UHF_")) else req.band
         band = Band[band_name]
-        radio.set_band(band)
+        await radio_call(rig.set_band, band)
+        _remember_vfo(a=band.value)
         return {"success": True, "band": req.band, "frequency": band.value}
     except KeyError:
         raise HTTPException(status_code=400, detail=f"Invalid band: {req.band}")
@@ -739,22 +1204,19 @@ async def set_band(req: BandRequest):
 
 
 @app.post("/api/ptt")
-async def set_ptt(req: PTTRequest):
+async def set_ptt(req: PTTRequest, rig: FT991A = Depends(require_radio)):
     """Control PTT (Push-To-Talk)."""
     global tx_lockout
 
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     if tx_lockout:
         raise HTTPException(status_code=423, detail="TX lockout enabled")
 
     try:
         if req.enable:
-            radio.ptt_on()
+            await radio_call(rig.ptt_on)
             logger.warning("PTT ON via web interface")
         else:
-            radio.ptt_off()
+            await radio_call(rig.ptt_off)
             logger.info("PTT OFF via web interface")
 
         return {"success": True, "ptt": req.enable}
@@ -773,7 +1235,7 @@ async def toggle_tx_lockout():
     # If enabling lockout, ensure PTT is off
     if tx_lockout and radio_connected and radio:
         try:
-            radio.ptt_off()
+            await radio_call(radio.ptt_off)
         except:
             pass
 
@@ -804,39 +1266,27 @@ async def get_audio_devices():
         devices = []
         current_card = None
 
-        for line in result.stdout.split("\n"):
-            line = line.strip()
-            if line.startswith("card "):
-                # Parse card line: "card 1: Device [USB Audio CODEC], device 0: USB Audio [USB Audio]"
-                parts = line.split(":", 2)
-                if len(parts) >= 2:
-                    card_info = parts[0]  # "card 1"
-                    device_info = parts[1].strip()  # "Device [USB Audio CODEC]"
-
-                    card_num = card_info.split()[1]
-                    if "[" in device_info and "]" in device_info:
-                        device_name = device_info.split("[")[1].split("]")[0]
-                    else:
-                        device_name = device_info
-
-                    current_card = {"card_num": int(card_num), "name": device_name, "devices": []}
-
-            elif line.startswith("  Subdevices:") and current_card:
-                # Parse subdevice info
-                subdevice_count = line.split(":")[1].strip().split("/")[0]
-                current_card["subdevices"] = int(subdevice_count)
-
-                # Create device entry
-                device_entry = {
-                    "card": current_card["card_num"],
-                    "device": 0,  # Usually device 0 for audio
-                    "name": current_card["name"],
-                    "hw_name": f"hw:{current_card['card_num']},0",
-                    "card_name": f"hw:CARD={current_card['name'].replace(' ', '').replace('-', '')[:8]}",
-                    "is_usb_codec": "USB Audio CODEC" in current_card["name"] or "PCM2903B" in current_card["name"],
-                    "subdevices": current_card.get("subdevices", 1),
-                }
-                devices.append(device_entry)
+        for line in result.stdout.splitlines():
+            # "card 1: CODEC [USB Audio CODEC], device 0: USB Audio [USB Audio]"
+            match = _CARD_RE.match(line)
+            if match:
+                current_card = match
+                continue
+
+            match = _SUBDEV_RE.match(line)
+            if match and current_card:
+                card_num, _, name, device_num = current_card.groups()
+                devices.append(
+                    {
+                        "card": int(card_num),
+                        "device": int(device_num),
+                        "name": name,
+                        "hw_name": f"hw:{card_num},{device_num}",
+                        "card_name": f"hw:CARD={name.replace(' ', '').replace('-', '')[:8]}",
+                        "is_usb_codec": "USB Audio CODEC" in name or "PCM2903B" in name,
+                        "subdevices": int(match.group(1)),
+                    }
+                )
                 current_card = None
 
         # Also get PCM device list for additional info
@@ -850,74 +1300,62 @@ async def get_audio_devices():
 
 
 @app.post("/api/vfo/swap")
-async def swap_vfo():
+async def swap_vfo(rig: FT991A = Depends(require_radio)):
     """Swap VFO-A and VFO-B."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        radio.swap_vfo()
+        await radio_call(rig.swap_vfo)
+        _remember_vfo(a=_vfo_cache["b"], b=_vfo_cache["a"], mode=None)
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/vfo/a-to-b")
-async def vfo_a_to_b():
+async def vfo_a_to_b(rig: FT991A = Depends(require_radio)):
     """Copy VFO-A to VFO-B."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     try:
-        radio.vfo_a_to_b()
+        await radio_call(rig.vfo_a_to_b)
+        _remember_vfo(b=_vfo_cache["a"])
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/tuner/on")
-async def tuner_on():
+async def tuner_on(rig: FT991A = Depends(require_radio)):
     """Turn antenna tuner ON."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
     try:
-        radio.tuner_on()
+        await radio_call(rig.tuner_on)
         return {"success": True, "tuner": "on"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/tuner/off")
-async def tuner_off():
+async def tuner_off(rig: FT991A = Depends(require_radio)):
     """Turn antenna tuner OFF."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
     try:
-        radio.tuner_off()
+        await radio_call(rig.tuner_off)
         return {"success": True, "tuner": "off"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/tuner/start")
-async def tuner_start():
+async def tuner_start(rig: FT991A = Depends(require_radio)):
     """Start antenna auto-tune."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
     try:
-        radio.tuner_start()
+        await radio_call(rig.tuner_start)
         return {"success": True, "tuner": "tuning"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/tuner/status")
-async def tuner_status():
+async def tuner_status(rig: FT991A = Depends(require_radio)):
     """Get tuner status."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
     try:
-        status = radio.tuner_status()
+        status = await radio_call(rig.tuner_status)
         labels = {"0": "off", "1": "on", "2": "tuning"}
         return {"status": labels.get(status, "unknown"), "raw": status}
     except Exception as e:
@@ -951,84 +1389,96 @@ async def get_config():
 
 # ── Memory Management Endpoints ──────────────────────────────
 
+# MR response mode codes "001".."014", indexed by their numeric value
+MEMORY_MODES = (
+    "UNK",
+    "LSB",
+    "USB",
+    "CW",
+    "FM",
+    "AM",
+    "RTTY-LSB",
+    "CW-R",
+    "DATA-LSB",
+    "RTTY-USB",
+    "DATA-FM",
+    "FM-N",
+    "DATA-USB",
+    "AM-N",
+    "C4FM",
+)
 
-@app.get("/api/memory/list")
-async def get_memory_list():
-    """Scan and list all memory channels (MR001; through MR099;)."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
-    try:
-        logger.info("Starting memory channel scan (MR001-MR099)")
-        channels = {}
-
-        # Scan all 99 memory channels
-        for ch in range(1, 100):
-            channel_str = f"{ch:03d}"
-
-            try:
-                # Send MR command to read memory channel
-                mr_command = f"MR{channel_str};"
-                logger.debug(f"Sending CAT: {mr_command}")
 
-                # Use raw serial for memory commands
-                radio.serial.write(mr_command.encode())
-                response = radio.serial.readline().decode().strip()
+def _read_cat_responses(port, count: int) -> List[bytes]:
+    """Read up to `count` ';'-terminated CAT responses in bulk (fewer on timeout)."""
+    buf = bytearray()
+    seen = 0
+    while seen < count:
+        chunk = port.read(port.in_waiting or 1)
+        if not chunk:
+            break  # Timeout - the radio stopped answering
+        buf += chunk
+        seen += chunk.count(b";")
+    return bytes(buf).split(b";")[:seen]
+
+
+def _query_memory_channels():
+    """Yield (channel, raw MR response bytes) for channels 1-99, pipelining MEMORY_BATCH_SIZE commands per write."""
+    for start in range(1, 100, MEMORY_BATCH_SIZE):
+        batch = range(start, min(start + MEMORY_BATCH_SIZE, 100))
+        radio.serial.write(b"".join(MR_CMDS[ch] for ch in batch))
+        responses = _read_cat_responses(radio.serial, len(batch))
+        for ch, raw in zip(batch, responses):
+            yield ch, raw.strip()
+
+
+def _parse_memory_channel(ch: int, response: bytes) -> Optional[dict]:
+    """Channel entry for one MR response, or None for an empty channel."""
+    logger.debug("MR%03d response: %s", ch, response)
+
+    # Parse MR response format straight from the ASCII bytes. Per-row Python parsing is ~100 us
+    # for all 99 channels against ~1 s of 38400-baud transfer, and empty channels answer with a
+    # short "?;", so the rows aren't fixed-width for a NumPy reshape anyway.
+    # Replies come back in command order, so only the "MR" marker needs checking ("?;" = empty)
+    if not response.startswith(b"MR") or len(response) <= 10:
+        return None
+
+    # Format: MR001+14074000000100200000000000000000000000000;
+    #         MRccc+ffffffffmmm...other...
+    freq_str = response[6:17]  # 11 digit frequency in Hz
+    frequency = int(freq_str) if freq_str.isdigit() else 0
+    if frequency <= 0:
+        return None
+
+    # Mode (positions 17-19, 3 digits)
+    mode_code = response[17:20] if len(response) > 19 else b"000"
+    mode_num = int(mode_code) if mode_code.isdigit() else 0
+    return {
+        "channel": f"{ch:03d}",
+        "frequency": frequency,
+        "mode": MEMORY_MODES[mode_num] if mode_num < len(MEMORY_MODES) else "UNK",
+        "mode_code": mode_code.decode("ascii", errors="replace"),
+        "label": "",  # TODO: Implement MT command for labels
+        "ctcss": "OFF",  # TODO: Parse CTCSS from response
+        "is_current": False,  # Will be updated if needed
+    }
 
-                logger.debug(f"MR{channel_str} response: {response}")
 
-                # Parse MR response format
-                if response.startswith(f"MR{channel_str}") and len(response) > 10:
-                    # Parse memory data from response
-                    # Format: MR001+14074000000100200000000000000000000000000;
-                    #         MRccc+ffffffffmmm...other...
+def _read_memory_channels() -> dict:
+    """Read MR001-MR099 over the CAT link (blocking; run via radio_call)."""
+    return {
+        entry["channel"]: entry
+        for ch, response in _query_memory_channels()
+        if (entry := _parse_memory_channel(ch, response)) is not None
+    }
 
-                    try:
-                        # Extract frequency (positions 6-16, 11 digits)
-                        freq_str = response[6:17]  # 11 digit frequency in Hz
-                        frequency = int(freq_str) if freq_str.isdigit() else 0
-
-                        # Extract mode (position 17-19, 3 digits)
-                        mode_code = response[17:20] if len(response) > 19 else "000"
-                        mode_map = {
-                            "001": "LSB",
-                            "002": "USB",
-                            "003": "CW",
-                            "004": "FM",
-                            "005": "AM",
-                            "006": "RTTY-LSB",
-                            "007": "CW-R",
-                            "008": "DATA-LSB",
-                            "009": "RTTY-USB",
-                            "010": "DATA-FM",
-                            "011": "FM-N",
-                            "012": "DATA-USB",
-                            "013": "AM-N",
-                            "014": "C4FM",
-                        }
-                        mode = mode_map.get(mode_code, "UNK")
-
-                        # Store channel data if frequency is valid
-                        if frequency > 0:
-                            channels[channel_str] = {
-                                "channel": channel_str,
-                                "frequency": frequency,
-                                "mode": mode,
-                                "mode_code": mode_code,
-                                "raw_response": response,
-                                "label": "",  # TODO: Implement MT command for labels
-                                "ctcss": "OFF",  # TODO: Parse CTCSS from response
-                                "is_current": False,  # Will be updated if needed
-                            }
-                            logger.debug(f"Memory {channel_str}: {frequency} Hz, {mode}")
-
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to parse memory {channel_str} response: {e}")
-                        continue
 
-            except Exception as e:
-                logger.warning(f"Error reading memory {channel_str}: {e}")
-                continue
+@app.get("/api/memory/list", dependencies=[Depends(require_radio)])
+async def get_memory_list():
+    """Scan and list all memory channels (MR001; through MR099;)."""
+    try:
+        logger.info("Starting memory channel scan (MR001-MR099)")
+        channels = await radio_call(_read_memory_channels)
 
         logger.info(f"Memory scan completed: {len(channels)} programmed channels found")
 
@@ -1040,34 +1490,25 @@ async def get_memory_list():
 
 
 @app.post("/api/memory/recall")
-async def recall_memory_channel(req: MemoryRecallRequest):
+async def recall_memory_channel(req: MemoryRecallRequest, rig: FT991A = Depends(require_radio)):
     """Recall memory channel to VFO-A (MC command)."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     if req.channel < 1 or req.channel > 99:
         raise HTTPException(status_code=400, detail="Channel must be between 1 and 99")
 
     try:
         channel_str = f"{req.channel:03d}"
-        mc_command = f"MC{channel_str};"
+        mc_command = MC_CMDS[req.channel]
 
         logger.info(f"Recalling memory channel {channel_str}")
-        logger.debug(f"Sending CAT: {mc_command}")
+        logger.debug("Sending CAT: %s", mc_command)
 
         # Send MC command to recall memory
-        radio.serial.write(mc_command.encode())
+        await radio_call(rig.serial.write, mc_command)
+        _remember_vfo(a=None, mode=None)
 
-        # Give radio time to process
+        # Give radio time to process (the new VFO-A reaches clients via the status monitor)
         await asyncio.sleep(0.1)
 
-        # Verify by reading current frequency
-        try:
-            status = radio.get_status()
-            logger.info(f"Memory {channel_str} recalled - VFO-A: {status.frequency_a} Hz")
-        except:
-            pass
-
         return {"success": True, "channel": channel_str, "message": f"Memory channel {channel_str} recalled to VFO-A"}
 
     except Exception as e:
@@ -1076,30 +1517,26 @@ async def recall_memory_channel(req: MemoryRecallRequest):
 
 
 @app.post("/api/memory/store")
-async def store_to_memory_channel(req: MemoryStoreRequest):
+async def store_to_memory_channel(req: MemoryStoreRequest, rig: FT991A = Depends(require_radio)):
     """Store current VFO-A to memory channel (MW command)."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     if req.channel < 1 or req.channel > 99:
         raise HTTPException(status_code=400, detail="Channel must be between 1 and 99")
 
     try:
         channel_str = f"{req.channel:03d}"
 
-        # Get current VFO-A status first
-        status = radio.get_status()
-        current_freq = status.frequency_a
-        current_mode = status.mode
+        # Current VFO-A, from the write-through cache when it is fresh
+        current_freq = _cached_vfo("a") or await radio_call(rig.get_frequency_a)
+        current_mode = _cached_vfo("mode") or await radio_call(rig.get_mode)
 
         logger.info(f"Storing VFO-A to memory {channel_str}: {current_freq} Hz, {current_mode}")
 
         # Send MW command to store current VFO-A to memory
         # MW command format: MW{ccc}; - stores current VFO-A to channel ccc
-        mw_command = f"MW{channel_str};"
-        logger.debug(f"Sending CAT: {mw_command}")
+        mw_command = MW_CMDS[req.channel]
+        logger.debug("Sending CAT: %s", mw_command)
 
-        radio.serial.write(mw_command.encode())
+        await radio_call(rig.serial.write, mw_command)
 
         # Give radio time to process
         await asyncio.sleep(0.2)
@@ -1118,11 +1555,8 @@ async def store_to_memory_channel(req: MemoryStoreRequest):
 
 
 @app.post("/api/memory/clear")
-async def clear_memory_channel(req: MemoryClearRequest):
+async def clear_memory_channel(req: MemoryClearRequest, rig: FT991A = Depends(require_radio)):
     """Clear/delete a memory channel."""
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     if req.channel < 1 or req.channel > 99:
         raise HTTPException(status_code=400, detail="Channel must be between 1 and 99")
 
@@ -1137,20 +1571,19 @@ async def clear_memory_channel(req: MemoryClearRequest):
 
         # Method: Store a very low frequency (30 kHz) which effectively "clears" the channel
         # First set VFO to minimum frequency, then store, then restore VFO
-        original_status = radio.get_status()
-        original_freq = original_status.frequency_a
+        original_freq = _cached_vfo("a") or await radio_call(rig.get_frequency_a)
 
         # Set VFO-A to minimum frequency (30 kHz)
-        radio.set_frequency_a(30000)
+        await radio_call(rig.set_frequency_a, 30000)
         await asyncio.sleep(0.1)
 
         # Store this "empty" frequency to memory
-        mw_command = f"MW{channel_str};"
-        radio.serial.write(mw_command.encode())
+        await radio_call(rig.serial.write, MW_CMDS[req.channel])
         await asyncio.sleep(0.2)
 
         # Restore original VFO-A frequency
-        radio.set_frequency_a(original_freq)
+        await radio_call(rig.set_frequency_a, original_freq)
+        _remember_vfo(a=original_freq)
 
         logger.info(f"Memory channel {channel_str} cleared (set to 30 kHz)")
 
@@ -1164,14 +1597,11 @@ async def clear_memory_channel(req: MemoryClearRequest):
 # ── Scanner Endpoints ────────────────────────────────────────
 
 
-@app.post("/api/scan")
+@app.post("/api/scan", dependencies=[Depends(require_radio)])
 async def start_scan(req: ScanRequest):
     """Start frequency scanning."""
     global scan_active, scan_task
 
-    if not radio_connected or not radio:
-        raise HTTPException(status_code=503, detail="Radio not connected")
-
     if scan_active:
         raise HTTPException(status_code=409, detail="Scan already in progress")
 
@@ -1185,6 +1615,19 @@ async def start_scan(req: ScanRequest):
     if req.step < 100 or req.step > 1000000:
         raise HTTPException(status_code=400, detail="Step size must be between 100 Hz and 1 MHz")
 
+    if req.settle_ms < 20 or req.settle_ms > 1000:
+        raise HTTPException(status_code=400, detail="Settle time must be between 20 and 1000 ms")
+
+    estimated_points = (req.end_freq - req.start_freq) // req.step
+    if estimated_points > SCAN_MAX_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Scan would take {estimated_points:,} steps (max {SCAN_MAX_POINTS:,}); "
+                "narrow the range or increase the step"
+            ),
+        )
+
     try:
         scan_active = True
         scan_task = asyncio.create_task(scan_frequency_range(req))
@@ -1199,7 +1642,8 @@ async def start_scan(req: ScanRequest):
                 "end_freq": req.end_freq,
                 "step": req.step,
                 "threshold": req.threshold,
-                "estimated_points": int((req.end_freq - req.start_freq) / req.step),
+                "settle_ms": req.settle_ms,
+                "estimated_points": estimated_points,
             },
         }
 
@@ -1227,34 +1671,71 @@ async def stop_scan():
         scan_task = None
 
     # Broadcast scan stopped
-    await manager.broadcast({"type": "scan_complete", "message": "Scan stopped by user"})
+    await manager.broadcast({"type": "scan_complete", "message": "Scan stopped by user"}, topic="scan")
 
     logger.info("Scan stopped by user request")
     return {"success": True, "message": "Scan stopped"}
 
 
+async def _settled_s_meter(max_settle: float) -> int:
+    """Sample the S-meter until two consecutive readings agree, giving up after max_settle seconds."""
+    deadline = time.monotonic() + max_settle
+    await asyncio.sleep(min(SCAN_SETTLE_POLL, max_settle))
+    previous = await radio_call(radio.get_s_meter)
+    while time.monotonic() < deadline:
+        await asyncio.sleep(SCAN_SETTLE_POLL)
+        s_meter = await radio_call(radio.get_s_meter)
+        if abs(s_meter - previous) <= SCAN_SETTLE_TOLERANCE:
+            return s_meter
+        previous = s_meter
+    return previous
+
+
 async def scan_frequency_range(req: ScanRequest):
     """Background task to perform the frequency scan."""
     global scan_active
 
     try:
-        current_freq = req.start_freq
+        n_steps = (req.end_freq - req.start_freq) // req.step + 1
+        progress_scale = 100.0 / max(1, n_steps - 1)
         scan_count = 0
         active_count = 0
         start_time = time.time()
+        settle_time = req.settle_ms / 1000.0
 
-        while scan_active and current_freq <= req.end_freq:
-            try:
-                # Set radio frequency
-                radio.set_frequency_a(current_freq)
+        # Progress points are coalesced into batched frames
+        batch: List[dict] = []
+        last_flush = time.monotonic()
+
+        async def flush_batch():
+            nonlocal last_flush
+            if batch:
+                await manager.broadcast(
+                    {
+                        "type": "scan_progress_batch",
+                        "points": list(batch),
+                        "scan_count": scan_count,
+                        "active_count": active_count,
+                        "progress": index * progress_scale,
+                    },
+                    topic="scan",
+                )
+                batch.clear()
+            last_flush = time.monotonic()
 
-                # Wait for radio to settle (200ms as specified)
-                await asyncio.sleep(0.2)
+        # Tuning VFO-A doesn't change the mode, so read it once rather than per step
+        mode = await radio_call(radio.get_mode)
 
-                # Read S-meter
-                status = radio.get_status()
-                s_meter = status.s_meter
-                mode = status.mode
+        for index, current_freq in enumerate(range(req.start_freq, req.end_freq + 1, req.step)):
+            if not scan_active:
+                break
+            try:
+                # Retune - the S-meter query rides along so the silent FA set gets an answer to wait on
+                await radio_call(radio.tune_and_read_s_meter, current_freq)
+                _remember_vfo(a=current_freq)
+
+                # Read the S-meter as soon as it settles (settle_ms is now the upper bound)
+                s_meter = await _settled_s_meter(settle_time)
 
                 scan_count += 1
 
@@ -1263,34 +1744,22 @@ async def scan_frequency_range(req: ScanRequest):
                 if is_active:
                     active_count += 1
 
-                # Broadcast progress
-                await manager.broadcast(
-                    {
-                        "type": "scan_progress",
-                        "frequency": current_freq,
-                        "s_meter": s_meter,
-                        "mode": mode,
-                        "is_active": is_active,
-                        "scan_count": scan_count,
-                        "active_count": active_count,
-                        "progress": ((current_freq - req.start_freq) / (req.end_freq - req.start_freq)) * 100,
-                    }
-                )
+                # Queue progress, flushing every SCAN_BATCH_SIZE points or SCAN_BATCH_INTERVAL seconds
+                batch.append({"frequency": current_freq, "s_meter": s_meter, "mode": mode, "is_active": is_active})
+                if len(batch) >= SCAN_BATCH_SIZE or time.monotonic() - last_flush >= SCAN_BATCH_INTERVAL:
+                    await flush_batch()
 
-                # Move to next frequency
-                current_freq += req.step
+                # Leave the CAT link idle briefly so status polls can get in between steps
+                await asyncio.sleep(SCAN_STEP_PACING)
 
-                # Small delay to prevent overwhelming the radio
-                await asyncio.sleep(0.05)
-
-            except Exception as e:
-                logger.error(f"Error during scan at {current_freq} Hz: {e}")
+            except CAT_ERRORS as e:
+                logger.warning(f"CAT error during scan at {current_freq} Hz: {e}")
                 # Continue scan despite individual frequency errors
-                current_freq += req.step
                 continue
 
         # Scan completed successfully
         if scan_active:  # Only if not cancelled
+            await flush_batch()
             elapsed_time = time.time() - start_time
 
             await manager.broadcast(
@@ -1303,17 +1772,20 @@ async def scan_frequency_range(req: ScanRequest):
                         "elapsed_time": round(elapsed_time, 1),
                         "scan_rate": round(scan_count / elapsed_time, 1) if elapsed_time > 0 else 0,
                     },
-                }
+                },
+                topic="scan",
             )
 
             logger.info(f"Scan completed: {scan_count} frequencies in {elapsed_time:.1f}s, {active_count} active")
 
     except asyncio.CancelledError:
         logger.info("Scan cancelled")
+        # Deliver the points measured since the last flush (broadcast only queues, so this can't be interrupted)
+        await flush_batch()
         raise
     except Exception as e:
-        logger.error(f"Scan error: {e}")
-        await manager.broadcast({"type": "scan_error", "message": str(e)})
+        logger.exception(f"Scan error: {e}")
+        await manager.broadcast({"type": "scan_error", "message": str(e)}, topic="scan")
     finally:
         scan_active = False
 
@@ -1321,12 +1793,21 @@ async def scan_frequency_range(req: ScanRequest):
 # ── Setup Wizard Endpoints ───────────────────────────────────
 
 
+def _is_cp210x(port) -> bool:
+    """True for the Silicon Labs CP210x bridge the FT-991A's USB port enumerates as."""
+    return port.vid == CP210X_VID or "CP210" in (port.description or "") or "Silicon Labs" in (port.manufacturer or "")
+
+
 @app.get("/api/setup/ports")
 async def get_setup_ports():
     """List available serial ports for setup wizard."""
+    if _ports_cache["data"] is not None and time.monotonic() - _ports_cache["ts"] < PORTS_CACHE_TTL:
+        return {"success": True, "ports": _ports_cache["data"]}
+
     try:
         ports = []
-        for port in serial.tools.list_ports.comports():
+        # Enumeration walks sysfs/udev - keep it off the event loop
+        for port in await asyncio.to_thread(serial.tools.list_ports.comports):
             port_info = {
                 "device": port.device,
                 "description": port.description or "Unknown device",
@@ -1335,7 +1816,7 @@ async def get_setup_ports():
                 "pid": port.pid,
             }
             # Add helpful info for common devices
-            if "CP210" in port.description or "Silicon Labs" in (port.manufacturer or ""):
+            if _is_cp210x(port):
                 port_info["likely_ft991a"] = True
                 port_info["description"] += " (CP2105 - likely FT-991A)"
             else:
@@ -1343,38 +1824,82 @@ async def get_setup_ports():
 
             ports.append(port_info)
 
+        _ports_cache["data"] = ports
+        _ports_cache["ts"] = time.monotonic()
         return {"success": True, "ports": ports}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+def _close_test_connections():
+    """Close every cached setup-test connection."""
+    while _test_conn_cache:
+        _, (conn, _) = _test_conn_cache.popitem()
+        try:
+            conn.disconnect()
+        except Exception:
+            pass
+
+
+async def _reap_test_connections():
+    """Close cached setup-test connections once they sit idle past TEST_CONN_TTL."""
+    while _test_conn_cache:
+        await asyncio.sleep(TEST_CONN_TTL)
+        now = time.monotonic()
+        for key, (conn, last_used) in list(_test_conn_cache.items()):
+            if now - last_used >= TEST_CONN_TTL:
+                del _test_conn_cache[key]
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+
+
 @app.post("/api/setup/test")
 async def test_setup_connection(req: SetupTestRequest):
     """Test a port+baud combination for setup wizard."""
-    test_radio = None
-    try:
-        # Create temporary radio connection
-        test_radio = FT991A(req.port, req.baudrate)
+    global _test_conn_reaper
 
-        # Attempt connection
-        if test_radio.connect():
-            # Test basic CAT command
-            status = test_radio.get_status()
-
-            # Get radio identification if possible
-            radio_info = {
-                "model": "FT-991A",  # We know this from the CAT implementation
-                "frequency_a": status.frequency_a,
-                "mode": status.mode,
-                "connected": True,
-            }
+    # Testing the live connection's settings - ask the open radio instead of fighting it for the port
+    if radio_connected and radio and req.port == radio_config["port"] and req.baudrate == radio_config["baudrate"]:
+        try:
+            status = await radio_call(radio.get_status)
+        except Exception as e:
+            return {"success": False, "connected": False, "error": str(e)}
+        radio_info = {"model": "FT-991A", "frequency_a": status.frequency_a, "mode": status.mode, "connected": True}
+        return {"success": True, "connected": True, "radio_info": radio_info}
+
+    # Reuse a connection opened by a recent test of the same port+baud
+    key = (req.port, req.baudrate)
+    cached = _test_conn_cache.pop(key, None)
+    test_radio = cached[0] if cached else None
+    try:
+        if test_radio is None:
+            # Create temporary radio connection
+            test_radio = FT991A(req.port, req.baudrate)
 
-            test_radio.disconnect()
-            return {"success": True, "connected": True, "radio_info": radio_info}
-        else:
-            if test_radio:
+            # Attempt connection
+            if not await asyncio.to_thread(test_radio.connect):
                 test_radio.disconnect()
-            return {"success": False, "connected": False, "error": "No response from radio"}
+                return {"success": False, "connected": False, "error": "No response from radio"}
+
+        # Test basic CAT command (its own port, so not on cat_executor)
+        status = await asyncio.to_thread(test_radio.get_status)
+
+        # Get radio identification if possible
+        radio_info = {
+            "model": "FT-991A",  # We know this from the CAT implementation
+            "frequency_a": status.frequency_a,
+            "mode": status.mode,
+            "connected": True,
+        }
+
+        # Keep the port open briefly for repeat tests
+        _test_conn_cache[key] = (test_radio, time.monotonic())
+        if _test_conn_reaper is None or _test_conn_reaper.done():
+            _test_conn_reaper = asyncio.create_task(_reap_test_connections())
+
+        return {"success": True, "connected": True, "radio_info": radio_info}
 
     except Exception as e:
         if test_radio:
@@ -1385,6 +1910,57 @@ async def test_setup_connection(req: SetupTestRequest):
         return {"success": False, "connected": False, "error": str(e)}
 
 
+def _probe_port(port: str, baudrate: int) -> Optional[dict]:
+    """Try a single port and return radio info if an FT-991A answers."""
+    probe = FT991A(port, baudrate, timeout=1.0)
+    try:
+        if not probe.connect():
+            return None
+        status = probe.get_status()
+        return {"model": "FT-991A", "frequency_a": status.frequency_a, "mode": status.mode, "connected": True}
+    except Exception as e:
+        logger.debug(f"Autodetect probe failed on {port}: {e}")
+        return None
+    finally:
+        probe.disconnect()
+
+
+@app.post("/api/setup/autodetect")
+async def autodetect_setup_port():
+    """Find the FT-991A by probing CP210x ports first, then everything else."""
+    baudrate = radio_config["baudrate"]
+
+    # The live radio already answers on its configured port
+    if radio_connected and radio:
+        return {"success": True, "found": True, "port": radio_config["port"], "baudrate": baudrate, "probed": []}
+
+    try:
+        ports = await asyncio.to_thread(serial.tools.list_ports.comports)
+    except Exception as e:
+        return {"success": False, "found": False, "error": str(e)}
+
+    # Known VID first so junk ports (Bluetooth SPP etc.) are only probed as a last resort
+    candidates = [p.device for p in ports if p.vid == CP210X_VID]
+    candidates += [p.device for p in ports if p.vid != CP210X_VID]
+
+    probed = []
+    for device in candidates:
+        probed.append(device)
+        radio_info = await asyncio.to_thread(_probe_port, device, baudrate)
+        if radio_info:
+            logger.info(f"Autodetect found FT-991A on {device}")
+            return {
+                "success": True,
+                "found": True,
+                "port": device,
+                "baudrate": baudrate,
+                "radio_info": radio_info,
+                "probed": probed,
+            }
+
+    return {"success": True, "found": False, "probed": probed}
+
+
 @app.post("/api/setup/save")
 async def save_setup_config(req: SetupSaveRequest):
     """Save setup wizard configuration."""
@@ -1395,6 +1971,9 @@ async def save_setup_config(req: SetupSaveRequest):
         if radio_connected:
             await disconnect_radio()
 
+        # Release any port still held open by setup tests
+        _close_test_connections()
+
         # Update configuration
         radio_config["port"] = req.port
         radio_config["baudrate"] = req.baudrate
@@ -1419,33 +1998,29 @@ async def save_setup_config(req: SetupSaveRequest):
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates."""
     await manager.connect(websocket)
+    status_wakeup.set()
     try:
-        # Send initial status
+        # Send initial status, reusing the monitor's last frame while it is fresh
         if radio_connected and radio:
-            status = radio.get_status()
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "status",
-                        "timestamp": datetime.now().isoformat(),
-                        "data": {
-                            "frequency_a": status.frequency_a,
-                            "frequency_b": status.frequency_b,
-                            "mode": status.mode,
-                            "tx_active": status.tx_active,
-                            "squelch_open": status.squelch_open,
-                            "s_meter": status.s_meter,
-                            "power_output": status.power_output,
-                            "swr": status.swr,
-                            "tx_lockout": tx_lockout,
-                        },
-                    }
-                )
-            )
+            if _last_status["message"] and time.monotonic() - _last_status["ts"] < radio_config["poll_interval"]:
+                manager.send(websocket, _last_status["message"], text=_last_status["text"])
+            else:
+                status = await radio_call(radio.get_status)
+                message, text = _status_frame(_status_payload(status))
+                manager.send(websocket, message, text=text)
 
-        # Keep connection alive
+        # Keep connection alive; clients may narrow their topics with
+        # {"type": "subscribe", "topics": ["status", "scan"]}, as JSON text or in their negotiated encoding
         while True:
-            await websocket.receive_text()
+            try:
+                message = await manager.receive(websocket)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get("type") == "subscribe":
+                topics = message.get("topics")
+                if isinstance(topics, list):
+                    manager.subscribe(websocket, [t for t in topics if isinstance(t, str)])
+                    status_wakeup.set()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
@@ -1459,20 +2034,16 @@ async def audio_websocket_endpoint(websocket: WebSocket):
     await audio_manager.connect(websocket)
     try:
         # Send initial audio info
-        await websocket.send_text(
-            json.dumps(
-                {"type": "audio_info", "format": "S16_LE", "sample_rate": 48000, "channels": 1, "chunk_size": 4096}
-            )
-        )
+        await websocket.send_text(AUDIO_INFO_JSON)
 
         # Keep connection alive and handle client messages
         while True:
             try:
                 message = await websocket.receive_text()
                 # Handle client control messages if needed
-                data = json.loads(message)
+                data = loads_json(message)
                 if data.get("type") == "ping":
-                    await websocket.send_text(json.dumps({"type": "pong"}))
+                    await websocket.send_text(PONG_JSON)
             except Exception:
                 # Client disconnected or sent binary data
                 break
@@ -1490,44 +2061,28 @@ async def sdr_websocket_endpoint(websocket: WebSocket):
     await sdr_manager.connect(websocket)
     try:
         # Send initial SDR info
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "sdr_info",
-                    "driver": "sdrplay",
-                    "device": "RSP2pro",
-                    "serial": "1717050C11",
-                    "available": SOAPY_SDR_AVAILABLE,
-                    "bandwidth": sdr_manager.bandwidth,
-                    "fft_size": sdr_manager.fft_size,
-                }
-            )
-        )
+        await websocket.send_text(sdr_manager.hello_json())
 
         # Keep connection alive and handle client messages
         while True:
             try:
                 message = await websocket.receive_text()
-                data = json.loads(message)
+                data = loads_json(message)
 
                 if data.get("type") == "ping":
-                    await websocket.send_text(json.dumps({"type": "pong"}))
+                    await websocket.send_text(PONG_JSON)
                 elif data.get("type") == "set_bandwidth":
                     try:
                         await sdr_manager.set_bandwidth(data.get("bandwidth", 2000000))
-                        await websocket.send_text(
-                            json.dumps({"type": "bandwidth_changed", "bandwidth": sdr_manager.bandwidth})
-                        )
+                        await send_json(websocket, {"type": "bandwidth_changed", "bandwidth": sdr_manager.bandwidth})
                     except ValueError as e:
-                        await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+                        await send_json(websocket, {"type": "error", "message": str(e)})
                 elif data.get("type") == "set_fft_size":
                     try:
                         await sdr_manager.set_fft_size(data.get("fft_size", 1024))
-                        await websocket.send_text(
-                            json.dumps({"type": "fft_size_changed", "fft_size": sdr_manager.fft_size})
-                        )
+                        await send_json(websocket, {"type": "fft_size_changed", "fft_size": sdr_manager.fft_size})
                     except ValueError as e:
-                        await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+                        await send_json(websocket, {"type": "error", "message": str(e)})
 
             except Exception as e:
                 logger.error(f"SDR WebSocket message error: {e}")
@@ -1750,10 +2305,11 @@ async def monitor_loop(config: dict):
                         f.write(json.dumps(transcript) + "\n")
                     
                     # Send to WebSocket clients
-                    for websocket in list(monitor_websocket_clients):
-                        try:
-                            await websocket.send_text(json.dumps(transcript))
-                        except:
+                    frame = dumps_json(transcript)
+                    clients = list(monitor_websocket_clients)
+                    results = await asyncio.gather(*(ws.send_text(frame) for ws in clients), return_exceptions=True)
+                    for websocket, result in zip(clients, results):
+                        if isinstance(result, Exception):
                             monitor_websocket_clients.discard(websocket)
                     
                     logger.info(f"ES: {spanish_text}")
@@ -1906,6 +2462,9 @@ async def shutdown_event():
     # Stop SDR streaming
     await sdr_manager.stop_sdr_stream()
 
+    # Close setup-test connections
+    _close_test_connections()
+
     # Stop any active scan
     global scan_active, scan_task
     if scan_active and scan_task:
@@ -1929,8 +2488,8 @@ async def shutdown_event():
     # Disconnect radio safely
     if radio_connected and radio:
         try:
-            radio.ptt_off()  # Safety
-            radio.disconnect()
+            await radio_call(radio.ptt_off)  # Safety
+            await radio_call(radio.disconnect)
         except:
             pass
 
@@ -1949,6 +2508,7 @@ if __name__ == "__main__":
     parser.add_argument("--radio-port", default="/dev/ttyUSB0", help="Radio serial port")
     parser.add_argument("--baud", type=int, default=38400, help="Radio baud rate")
     parser.add_argument("--no-auto-connect", action="store_true", help="Don't auto-connect to radio")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Status poll interval in seconds")
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
     args = parser.parse_args()
 
@@ -1956,6 +2516,7 @@ if __name__ == "__main__":
     radio_config["port"] = args.radio_port
     radio_config["baudrate"] = args.baud
     radio_config["auto_reconnect"] = not args.no_auto_connect
+    radio_config["poll_interval"] = args.poll_interval
 
     # Set log level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
@@ -12,48 +12,63 @@ Test coverage:
 - Error handling for malformed packets
 """
 
-import os
-import sys
+import re
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ft991a.aprs import APRSClient, EmergencyKit
-from ft991a.cat import FT991A, Mode
+from ft991a.cat import Mode
+
+# Expected encoder output; coordinates allow for floating point variation in the last digit
+# (35.7796° → 35°46.78'N, -78.6382° → 078°38.29'W)
+_EXPECTED_POSITION_RE = re.compile(r"^KO4TUV>APRS,WIDE1-1,WIDE2-1:!3546\.7\dN/07838\.2\dW>OpenClaw Test Station$")
+_EXPECTED_HOUSE_RE = re.compile(r"^KO4TUV>APRS,WIDE1-1,WIDE2-1:!3546\.7\dN/07838\.2\dW-House$")
+_EXPECTED_MESSAGE_RE = re.compile(r"^KO4TUV>APRS[^:]*::N0CALL   :Hello World!\{001$")
+_EXPECTED_MESSAGE_NO_ID_RE = re.compile(r"^[^{]*::W1AW     :Test message$")
+
+
+class _StubRadio:
+    """Just the FT991A calls APRSClient makes (Mock(spec=FT991A) introspects the whole class)"""
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+    def __init__(self):
+        self.set_frequency_a = MagicMock(return_value=True)
+        self.set_mode = MagicMock(return_value=True)
+
+    def reset_mock(self, **kwargs):
+        self.set_frequency_a.reset_mock(**kwargs)
+        self.set_mode.reset_mock(**kwargs)
 
 
 class TestAPRSPacketEncoding(unittest.TestCase):
     """Test APRS packet encoding functionality"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_radio = Mock(spec=FT991A)
-        self.aprs_client = APRSClient(self.mock_radio, "KO4TUV")
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.mock_radio = _StubRadio()
+        cls.aprs_client = APRSClient(cls.mock_radio, "KO4TUV")
 
     def test_position_encoding_basic(self):
         """Test basic position packet encoding"""
         # Test coordinates: Raleigh, NC area
         packet = self.aprs_client.encode_aprs_position("KO4TUV", 35.7796, -78.6382, "OpenClaw Test Station")
 
-        # Should contain callsign, path, and position
-        self.assertIn("KO4TUV>APRS", packet)
-        self.assertIn("WIDE1-1,WIDE2-1", packet)
-        self.assertIn("!", packet)  # Position identifier
-        self.assertIn("OpenClaw Test Station", packet)
-
-        # Check approximate coordinate conversion (allow for floating point precision)
-        # 35.7796° → 35°46.78'N (slight precision variation expected)
-        self.assertTrue("3546.7" in packet and "N" in packet)
-        self.assertTrue("07838.2" in packet and "W" in packet)
+        # Callsign, path, position identifier, approximate coordinates and comment
+        self.assertRegex(packet, _EXPECTED_POSITION_RE)
 
     def test_position_encoding_symbols(self):
         """Test position encoding with different symbols"""
         packet = self.aprs_client.encode_aprs_position("KO4TUV", 35.7796, -78.6382, "House", symbol_code="-")
 
         # Should contain house symbol (format: lat/lon-symbol_code)
-        self.assertIn("W-House", packet)  # Symbol code after coordinates
+        self.assertRegex(packet, _EXPECTED_HOUSE_RE)
 
     def test_position_encoding_coordinates(self):
         """Test coordinate conversion accuracy"""
@@ -64,8 +79,11 @@ class TestAPRSPacketEncoding(unittest.TestCase):
             (-90.0, -180.0, "9000.00S", "18000.00W"),
         ]
 
-        for lat, lon, expected_lat, expected_lon in test_cases:
-            packet = self.aprs_client.encode_aprs_position("TEST", lat, lon, "")
+        lats = [case[0] for case in test_cases]
+        lons = [case[1] for case in test_cases]
+        packets = self.aprs_client.encode_aprs_positions(["TEST"] * len(test_cases), lats, lons, [""] * len(test_cases))
+
+        for packet, (lat, lon, expected_lat, expected_lon) in zip(packets, test_cases):
             self.assertIn(expected_lat, packet, f"Latitude conversion failed for {lat}")
             self.assertIn(expected_lon, packet, f"Longitude conversion failed for {lon}")
 
@@ -74,20 +92,34 @@ class TestAPRSPacketEncoding(unittest.TestCase):
         self.assertTrue("3507.4" in packet and "N" in packet, "Latitude precision test failed")
         self.assertTrue("07859.2" in packet and "W" in packet, "Longitude precision test failed")
 
+    def test_batch_position_encoding_matches_scalar(self):
+        """Test batch position encoding produces the same packets as the scalar encoder"""
+        calls = ["KO4TUV", "W1AW", "N0CALL"]
+        lats = [35.7796, -33.8688, 0.0]
+        lons = [-78.6382, 151.2093, 0.0]
+        comments = ["Station", "", "Null Island"]
+
+        packets = self.aprs_client.encode_aprs_positions(calls, lats, lons, comments, symbol_code="-")
+
+        expected = [
+            self.aprs_client.encode_aprs_position(call, lat, lon, comment, symbol_code="-")
+            for call, lat, lon, comment in zip(calls, lats, lons, comments)
+        ]
+        self.assertEqual(packets, expected)
+
     def test_message_encoding_basic(self):
         """Test basic message packet encoding"""
         packet = self.aprs_client.encode_aprs_message("KO4TUV", "N0CALL", "Hello World!", "001")
 
         # Should contain source, destination (padded), message, and ID
-        self.assertIn("KO4TUV>APRS", packet)
-        self.assertIn("::N0CALL   :Hello World!{001", packet)
+        self.assertRegex(packet, _EXPECTED_MESSAGE_RE)
 
     def test_message_encoding_no_id(self):
         """Test message encoding without message ID"""
         packet = self.aprs_client.encode_aprs_message("KO4TUV", "W1AW", "Test message")
 
-        self.assertIn("::W1AW     :Test message", packet)
-        self.assertNotIn("{", packet)  # No message ID
+        # No message ID anywhere in the packet
+        self.assertRegex(packet, _EXPECTED_MESSAGE_NO_ID_RE)
 
     def test_message_encoding_padding(self):
         """Test message addressee padding"""
@@ -100,10 +132,11 @@ class TestAPRSPacketEncoding(unittest.TestCase):
 class TestAPRSPacketDecoding(unittest.TestCase):
     """Test APRS packet decoding functionality"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_radio = Mock(spec=FT991A)
-        self.aprs_client = APRSClient(self.mock_radio, "KO4TUV")
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.mock_radio = _StubRadio()
+        cls.aprs_client = APRSClient(cls.mock_radio, "KO4TUV")
 
     def test_position_decoding_basic(self):
         """Test basic position packet decoding"""
@@ -169,79 +202,79 @@ class TestAPRSPacketDecoding(unittest.TestCase):
 class TestAPRSRoundtrip(unittest.TestCase):
     """Test APRS encode/decode roundtrip functionality"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_radio = Mock(spec=FT991A)
-        self.aprs_client = APRSClient(self.mock_radio, "KO4TUV")
+    # Original data for the shared roundtrip packets
+    POSITION = {"callsign": "KO4TUV", "lat": 35.7796, "lon": -78.6382, "comment": "Roundtrip Test", "symbol": ">"}
+    MESSAGE = {"source": "KO4TUV", "dest": "W1AW", "message": "Roundtrip message test", "msg_id": "123"}
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class, encoding the sample packets once"""
+        cls.mock_radio = _StubRadio()
+        cls.aprs_client = APRSClient(cls.mock_radio, "KO4TUV")
+
+        pos, msg = cls.POSITION, cls.MESSAGE
+        cls.sample_position_packet = cls.aprs_client.encode_aprs_position(
+            pos["callsign"], pos["lat"], pos["lon"], pos["comment"], symbol_code=pos["symbol"]
+        )
+        cls.sample_message_packet = cls.aprs_client.encode_aprs_message(
+            msg["source"], msg["dest"], msg["message"], msg["msg_id"]
+        )
 
     def test_position_roundtrip(self):
         """Test position encoding → decoding roundtrip"""
-        # Original data
-        callsign = "KO4TUV"
-        lat = 35.7796
-        lon = -78.6382
-        comment = "Roundtrip Test"
-        symbol = ">"
-
-        # Encode
-        packet = self.aprs_client.encode_aprs_position(callsign, lat, lon, comment, symbol_code=symbol)
+        pos = self.POSITION
 
-        # Decode
-        decoded = self.aprs_client.decode_aprs_packet(packet)
+        decoded = self.aprs_client.decode_aprs_packet(self.sample_position_packet)
 
         # Verify roundtrip accuracy
         self.assertIsNotNone(decoded)
-        self.assertEqual(decoded.source_call, callsign)
+        self.assertEqual(decoded.source_call, pos["callsign"])
         self.assertEqual(decoded.data["type"], "position")
 
         # Coordinates should be accurate to ~0.01 arcminutes (APRS precision)
-        self.assertAlmostEqual(decoded.data["latitude"], lat, places=3)
-        self.assertAlmostEqual(decoded.data["longitude"], lon, places=3)
-        self.assertEqual(decoded.data["comment"], comment)
-        self.assertEqual(decoded.data["symbol_code"], symbol)
+        self.assertAlmostEqual(decoded.data["latitude"], pos["lat"], places=3)
+        self.assertAlmostEqual(decoded.data["longitude"], pos["lon"], places=3)
+        self.assertEqual(decoded.data["comment"], pos["comment"])
+        self.assertEqual(decoded.data["symbol_code"], pos["symbol"])
 
     def test_message_roundtrip(self):
         """Test message encoding → decoding roundtrip"""
-        # Original data
-        source = "KO4TUV"
-        dest = "W1AW"
-        message = "Roundtrip message test"
-        msg_id = "123"
-
-        # Encode
-        packet = self.aprs_client.encode_aprs_message(source, dest, message, msg_id)
+        msg = self.MESSAGE
 
-        # Decode
-        decoded = self.aprs_client.decode_aprs_packet(packet)
+        decoded = self.aprs_client.decode_aprs_packet(self.sample_message_packet)
 
         # Verify roundtrip accuracy
         self.assertIsNotNone(decoded)
-        self.assertEqual(decoded.source_call, source)
+        self.assertEqual(decoded.source_call, msg["source"])
         self.assertEqual(decoded.data["type"], "message")
-        self.assertEqual(decoded.data["addressee"], dest)
-        self.assertEqual(decoded.data["message"], message)
-        self.assertEqual(decoded.data["message_id"], msg_id)
+        self.assertEqual(decoded.data["addressee"], msg["dest"])
+        self.assertEqual(decoded.data["message"], msg["message"])
+        self.assertEqual(decoded.data["message_id"], msg["msg_id"])
 
     def test_coordinate_precision(self):
         """Test coordinate precision through roundtrip"""
-        test_coordinates = [
-            (0.0, 0.0),
-            (35.123456, -78.987654),
-            (89.999, 179.999),
-            (-89.999, -179.999),
-        ]
-
-        for lat, lon in test_coordinates:
-            # Encode and decode
-            packet = self.aprs_client.encode_aprs_position("TEST", lat, lon, "")
-            decoded = self.aprs_client.decode_aprs_packet(packet)
-
-            # Verify precision (APRS uses 0.01 arcminute precision)
-            self.assertIsNotNone(decoded, f"Failed to decode coordinates {lat}, {lon}")
-            precision_minutes = 0.01 / 60  # 0.01 arcminute in degrees
-
-            self.assertAlmostEqual(decoded.data["latitude"], lat, delta=precision_minutes)
-            self.assertAlmostEqual(decoded.data["longitude"], lon, delta=precision_minutes)
+        lats = [0.0, 35.123456, 89.999, -89.999]
+        lons = [0.0, -78.987654, 179.999, -179.999]
+
+        # Encode the batch, then decode each packet
+        packets = self.aprs_client.encode_aprs_positions(["TEST"] * len(lats), lats, lons, [""] * len(lats))
+
+        decoded_lats, decoded_lons = [], []
+        for packet, lat, lon in zip(packets, lats, lons):
+            with self.subTest(lat=lat, lon=lon):
+                decoded = self.aprs_client.decode_aprs_packet(packet)
+                self.assertIsNotNone(decoded, f"Failed to decode coordinates {lat}, {lon}")
+                decoded_lats.append(decoded.data["latitude"])
+                decoded_lons.append(decoded.data["longitude"])
+
+        # Verify precision in one check per axis (APRS uses 0.01 arcminute precision)
+        precision_minutes = 0.01 / 60  # 0.01 arcminute in degrees
+        if np is not None:
+            np.testing.assert_allclose(np.array(decoded_lats), lats, rtol=0, atol=precision_minutes)
+            np.testing.assert_allclose(np.array(decoded_lons), lons, rtol=0, atol=precision_minutes)
+        else:
+            for decoded, expected in zip(decoded_lats + decoded_lons, lats + lons):
+                self.assertAlmostEqual(decoded, expected, delta=precision_minutes)
 
 
 class TestEmergencyKit(unittest.TestCase):
@@ -300,32 +333,16 @@ class TestEmergencyKit(unittest.TestCase):
 class TestAPRSClientSetup(unittest.TestCase):
     """Test APRS client setup and configuration"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_radio = Mock(spec=FT991A)
-        self.aprs_client = APRSClient(self.mock_radio, "KO4TUV")
-
-    def test_callsign_validation(self):
-        """Test callsign format validation"""
-        # Valid callsigns
-        valid_calls = ["KO4TUV", "W1AW", "N0CALL", "VE3ABC", "G0ABC-1", "JA1ABC-15"]
-
-        for callsign in valid_calls:
-            try:
-                client = APRSClient(self.mock_radio, callsign)
-                self.assertEqual(client.callsign, callsign.upper())
-            except ValueError:
-                self.fail(f"Valid callsign rejected: {callsign}")
-
-        # Invalid callsigns
-        invalid_calls = ["", "TOOLONG123", "1INVALID", "IN-VALID-", "AB-0", "AB-100"]
-
-        for callsign in invalid_calls:
-            with self.assertRaises(ValueError, msg=f"Invalid callsign accepted: {callsign}"):
-                APRSClient(self.mock_radio, callsign)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.mock_radio = _StubRadio()
+        cls.aprs_client = APRSClient(cls.mock_radio, "KO4TUV")
 
     def test_aprs_setup(self):
         """Test APRS radio configuration"""
+        self.mock_radio.reset_mock(return_value=True, side_effect=True)
+
         # Mock successful radio operations
         self.mock_radio.set_frequency_a.return_value = True
         self.mock_radio.set_mode.return_value = True
@@ -341,6 +358,8 @@ class TestAPRSClientSetup(unittest.TestCase):
 
     def test_aprs_setup_failure(self):
         """Test APRS setup failure handling"""
+        self.mock_radio.reset_mock(return_value=True, side_effect=True)
+
         # Mock radio failure
         self.mock_radio.set_frequency_a.side_effect = Exception("Radio error")
 
@@ -362,27 +381,36 @@ class TestAPRSClientSetup(unittest.TestCase):
         self.assertFalse(result)  # Expected to fail (no TNC implementation)
 
 
+@pytest.fixture(scope="module")
+def aprs_client():
+    """APRS client shared by the parametrized tests"""
+    return APRSClient(_StubRadio(), "KO4TUV")
+
+
+class TestCallsignValidation:
+    """Test callsign format validation, one case per callsign"""
+
+    @pytest.mark.parametrize("callsign", ["KO4TUV", "W1AW", "N0CALL", "VE3ABC", "G0ABC-1", "JA1ABC-15"])
+    def test_valid_callsign(self, callsign):
+        """Valid callsigns are accepted and normalized to upper case"""
+        client = APRSClient(_StubRadio(), callsign)
+        assert client.callsign == callsign.upper()
+
+    @pytest.mark.parametrize("callsign", ["", "TOOLONG123", "1INVALID", "IN-VALID-", "AB-0", "AB-16", "AB-100"])
+    def test_invalid_callsign(self, callsign):
+        """Invalid callsigns are rejected"""
+        with pytest.raises(ValueError):
+            APRSClient(_StubRadio(), callsign)
+
+
 class TestAPRSErrorHandling(unittest.TestCase):
     """Test APRS error handling and edge cases"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_radio = Mock(spec=FT991A)
-        self.aprs_client = APRSClient(self.mock_radio, "KO4TUV")
-
-    def test_encoding_edge_cases(self):
-        """Test encoding with edge case inputs"""
-        # Test coordinate boundaries
-        extreme_coords = [
-            (90.0, 180.0),  # North pole, International Date Line
-            (-90.0, -180.0),  # South pole, opposite side
-            (0.0, 0.0),  # Null Island
-        ]
-
-        for lat, lon in extreme_coords:
-            packet = self.aprs_client.encode_aprs_position("TEST", lat, lon, "")
-            self.assertIsInstance(packet, str)
-            self.assertIn("TEST>APRS", packet)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.mock_radio = _StubRadio()
+        cls.aprs_client = APRSClient(cls.mock_radio, "KO4TUV")
 
     def test_decoding_malformed_position(self):
         """Test decoding malformed position packets"""
@@ -409,6 +437,21 @@ class TestAPRSErrorHandling(unittest.TestCase):
         self.assertIsNotNone(decoded)
 
 
+@pytest.mark.parametrize(
+    "lat,lon",
+    [
+        (90.0, 180.0),  # North pole, International Date Line
+        (-90.0, -180.0),  # South pole, opposite side
+        (0.0, 0.0),  # Null Island
+    ],
+)
+def test_encoding_edge_cases(aprs_client, lat, lon):
+    """Test encoding at the coordinate boundaries"""
+    packet = aprs_client.encode_aprs_position("TEST", lat, lon, "")
+    assert isinstance(packet, str)
+    assert "TEST>APRS" in packet
+
+
 if __name__ == "__main__":
     # Run tests
     unittest.main(verbosity=2)
@@ -14,6 +14,7 @@ Tests cover:
 
 import os
 import tempfile
+import threading
 import wave
 from unittest.mock import Mock, patch
 
@@ -21,26 +22,75 @@ import pytest
 
 # Test imports - handle missing audio dependencies gracefully
 try:
-    from src.ft991a.broadcast import AudioDeviceError, Broadcaster, TTSError, cleanup_temp_files
-    from src.ft991a.cat import FT991A
+    from ft991a.broadcast import (
+        AudioDeviceError,
+        Broadcaster,
+        BroadcastError,
+        TTSError,
+        cleanup_temp_files,
+        invalidate_device_cache,
+        reset_tts_engine,
+    )
 except ImportError as e:
     pytest.skip(f"Could not import broadcast module: {e}", allow_module_level=True)
 
 
+# Device list every test starts from (tests override query_devices.return_value as needed)
+DEFAULT_DEVICES = [
+    {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
+]
+
+# 1 second of 16-bit mono silence at 48 kHz
+_SILENCE = bytes(96000)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_sd():
+    """Install one sounddevice mock for the whole module instead of patching it in every test."""
+    patcher = patch("ft991a.broadcast.sd")
+    mock = patcher.start()
+    # sounddevice is an optional extra; with it mocked the module should behave as if audio is available
+    with patch("ft991a.broadcast.AUDIO_ENABLED", True):
+        yield mock
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def mock_sd(_patched_sd):
+    """The module's sounddevice mock, reset to DEFAULT_DEVICES with an empty device cache for each test."""
+    _patched_sd.reset_mock(return_value=True, side_effect=True)
+    _patched_sd.query_devices.return_value = DEFAULT_DEVICES
+    _patched_sd.query_devices.side_effect = lambda kind=None: (
+        {"name": "Default Output", "index": 0} if kind == "output" else _patched_sd.query_devices.return_value
+    )
+    invalidate_device_cache()
+    reset_tts_engine()
+    yield _patched_sd
+    invalidate_device_cache()
+    reset_tts_engine()
+
+
+class _StubRadio:
+    """Stand-in for FT991A; Broadcaster only holds on to the radio (Mock(spec=FT991A) introspects the whole class)"""
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        return None
+
+
 class TestBroadcaster:
     """Test the Broadcaster class functionality."""
 
     @pytest.fixture
     def mock_radio(self):
-        """Mock FT991A radio instance."""
-        radio = Mock(spec=FT991A)
-        radio.connect.return_value = True
-        radio.disconnect.return_value = None
-        return radio
+        """Stand-in FT991A radio instance."""
+        return _StubRadio()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def temp_wav_file(self):
-        """Create a temporary WAV file for testing."""
+        """Create one temporary WAV file shared by every test that plays audio."""
         # Create a simple mono WAV file
         temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
         temp_path = temp_file.name
@@ -51,9 +101,7 @@ class TestBroadcaster:
             wf.setnchannels(1)  # Mono
             wf.setsampwidth(2)  # 16-bit
             wf.setframerate(48000)
-            # Write 1 second of silence
-            silence = b"\x00\x00" * 48000
-            wf.writeframes(silence)
+            wf.writeframes(_SILENCE)
 
         yield temp_path
 
@@ -61,212 +109,189 @@ class TestBroadcaster:
         if os.path.exists(temp_path):
             os.unlink(temp_path)
 
-    def test_broadcaster_initialization(self, mock_radio):
+    def test_broadcaster_initialization(self, mock_sd, mock_radio):
         """Test Broadcaster initialization."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {
-                    "name": "USB Audio CODEC",
-                    "max_output_channels": 2,
-                    "max_input_channels": 2,
-                    "default_samplerate": 48000,
-                }
-            ]
+        mock_sd.query_devices.return_value = [
+            {
+                "name": "USB Audio CODEC",
+                "max_output_channels": 2,
+                "max_input_channels": 2,
+                "default_samplerate": 48000,
+            }
+        ]
 
-            broadcaster = Broadcaster(mock_radio)
-            assert broadcaster.radio == mock_radio
-            assert broadcaster.sample_rate == 48000
-            assert broadcaster._audio_device_id == 0
+        broadcaster = Broadcaster(mock_radio)
+        assert broadcaster.radio == mock_radio
+        assert broadcaster.sample_rate == 48000
+        assert broadcaster._audio_device_id == 0
 
-    def test_audio_device_detection_pcm2903b(self, mock_radio):
+    def test_audio_device_detection_pcm2903b(self, mock_sd, mock_radio):
         """Test PCM2903B device detection."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {
-                    "name": "PCM2903B Audio CODEC",
-                    "max_output_channels": 2,
-                    "max_input_channels": 2,
-                    "default_samplerate": 48000,
-                },
-                {
-                    "name": "Built-in Audio",
-                    "max_output_channels": 2,
-                    "max_input_channels": 1,
-                    "default_samplerate": 44100,
-                },
-            ]
+        mock_sd.query_devices.return_value = [
+            {
+                "name": "PCM2903B Audio CODEC",
+                "max_output_channels": 2,
+                "max_input_channels": 2,
+                "default_samplerate": 48000,
+            },
+            {
+                "name": "Built-in Audio",
+                "max_output_channels": 2,
+                "max_input_channels": 1,
+                "default_samplerate": 44100,
+            },
+        ]
 
-            broadcaster = Broadcaster(mock_radio)
-            assert broadcaster._audio_device_id == 0  # Should pick PCM2903B
+        broadcaster = Broadcaster(mock_radio)
+        assert broadcaster._audio_device_id == 0  # Should pick PCM2903B
 
-    def test_audio_device_fallback(self, mock_radio):
+    def test_audio_device_fallback(self, mock_sd, mock_radio):
         """Test fallback to default device when PCM2903B not found."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {
-                    "name": "Built-in Audio",
-                    "max_output_channels": 2,
-                    "max_input_channels": 1,
-                    "default_samplerate": 44100,
-                }
-            ]
-            mock_sd.query_devices.side_effect = lambda kind=None: (
-                {"name": "Default Output", "index": 0} if kind == "output" else mock_sd.query_devices.return_value
-            )
+        mock_sd.query_devices.return_value = [
+            {
+                "name": "Built-in Audio",
+                "max_output_channels": 2,
+                "max_input_channels": 1,
+                "default_samplerate": 44100,
+            }
+        ]
 
-            broadcaster = Broadcaster(mock_radio)
-            assert broadcaster._audio_device_id == 0  # Should use default
+        broadcaster = Broadcaster(mock_radio)
+        assert broadcaster._audio_device_id == 0  # Should use default
 
-    @patch("src.ft991a.broadcast.pyttsx3")
+    @patch("ft991a.broadcast.pyttsx3")
     def test_tts_pyttsx3_initialization(self, mock_pyttsx3, mock_radio):
         """Test TTS initialization with pyttsx3."""
         mock_engine = Mock()
         mock_pyttsx3.init.return_value = mock_engine
 
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
+        broadcaster = Broadcaster(mock_radio)
+        second = Broadcaster(mock_radio)
 
-            mock_pyttsx3.init.assert_called_once()
-            mock_engine.setProperty.assert_any_call("rate", 150)
-            mock_engine.setProperty.assert_any_call("volume", 0.9)
+        # The engine is initialized and configured once, then shared
+        mock_pyttsx3.init.assert_called_once()
+        mock_engine.setProperty.assert_any_call("rate", 150)
+        mock_engine.setProperty.assert_any_call("volume", 0.9)
+        assert mock_engine.setProperty.call_count == 2
+        assert broadcaster._tts_engine is second._tts_engine is mock_engine
 
-    @patch("src.ft991a.broadcast.pyttsx3", None)  # Simulate pyttsx3 not available
+    @patch("ft991a.broadcast.pyttsx3", None)  # Simulate pyttsx3 not available
     def test_tts_espeak_fallback(self, mock_radio):
         """Test TTS fallback to espeak."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
-            assert broadcaster._tts_engine is None  # Should fall back to espeak
+        broadcaster = Broadcaster(mock_radio)
+        assert broadcaster._tts_engine is None  # Should fall back to espeak
 
-    @patch("src.ft991a.broadcast.pyttsx3")
+    @patch("ft991a.broadcast.pyttsx3")
     def test_text_to_audio_pyttsx3(self, mock_pyttsx3, mock_radio):
         """Test text-to-audio conversion using pyttsx3."""
         mock_engine = Mock()
         mock_pyttsx3.init.return_value = mock_engine
 
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
+        broadcaster = Broadcaster(mock_radio)
 
-            broadcaster = Broadcaster(mock_radio)
+        # Mock file creation
+        with (
+            patch("tempfile.NamedTemporaryFile") as mock_temp,
+            patch("os.path.exists", return_value=True),
+            patch("os.path.getsize", return_value=1000),
+        ):
+
+            mock_temp.return_value.name = "/tmp/test.wav"
+
+            result = broadcaster.text_to_audio("Hello world")
+
+            mock_engine.save_to_file.assert_called_once_with("Hello world", "/tmp/test.wav")
+            mock_engine.runAndWait.assert_called_once()
+            assert result == "/tmp/test.wav"
 
-            # Mock file creation
-            with (
-                patch("tempfile.NamedTemporaryFile") as mock_temp,
-                patch("os.path.exists", return_value=True),
-                patch("os.path.getsize", return_value=1000),
-            ):
+    @patch("ft991a.broadcast.pyttsx3")
+    def test_text_to_audio_pyttsx3_single_run_cycle(self, mock_pyttsx3, mock_radio):
+        """Test pyttsx3 synthesis is one save_to_file + runAndWait, with no engine.stop()."""
+        mock_engine = Mock()
+        mock_pyttsx3.init.return_value = mock_engine
 
-                mock_temp.return_value.__enter__.return_value.name = "/tmp/test.wav"
+        broadcaster = Broadcaster(mock_radio)
 
-                result = broadcaster.text_to_audio("Hello world")
+        with (
+            patch("tempfile.NamedTemporaryFile") as mock_temp,
+            patch("os.path.exists", return_value=True),
+            patch("os.path.getsize", return_value=1000),
+        ):
+            mock_temp.return_value.name = "/tmp/test.wav"
 
-                mock_engine.save_to_file.assert_called_once_with("Hello world", "/tmp/test.wav")
-                mock_engine.runAndWait.assert_called_once()
-                assert result == "/tmp/test.wav"
+            assert broadcaster.text_to_audio("Hello world") == "/tmp/test.wav"
 
-    @patch("src.ft991a.broadcast.pyttsx3", None)
-    @patch("src.ft991a.broadcast.subprocess.run")
+        mock_engine.save_to_file.assert_called_once_with("Hello world", "/tmp/test.wav")
+        mock_engine.runAndWait.assert_called_once()
+        assert mock_engine.stop.call_count == 0
+
+    @patch("ft991a.broadcast.pyttsx3", None)
+    @patch("ft991a.broadcast.subprocess.run")
     def test_text_to_audio_espeak(self, mock_subprocess, mock_radio):
         """Test text-to-audio conversion using espeak."""
         mock_subprocess.return_value.returncode = 0
 
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
+        broadcaster = Broadcaster(mock_radio)
 
-            # Mock file creation
-            with (
-                patch("tempfile.NamedTemporaryFile") as mock_temp,
-                patch("os.path.exists", return_value=True),
-                patch("os.path.getsize", return_value=1000),
-            ):
+        # Mock file creation
+        with (
+            patch("tempfile.NamedTemporaryFile") as mock_temp,
+            patch("os.path.exists", return_value=True),
+            patch("os.path.getsize", return_value=1000),
+        ):
 
-                mock_temp.return_value.__enter__.return_value.name = "/tmp/test.wav"
+            mock_temp.return_value.name = "/tmp/test.wav"
 
-                result = broadcaster.text_to_audio("Hello world")
+            result = broadcaster.text_to_audio("Hello world")
 
-                mock_subprocess.assert_called_once()
-                args = mock_subprocess.call_args[0][0]
-                assert "espeak" in args
-                assert "Hello world" in args
-                assert "/tmp/test.wav" in args
+            mock_subprocess.assert_called_once()
+            args = mock_subprocess.call_args[0][0]
+            assert "espeak" in args
+            assert "Hello world" in args
+            assert "/tmp/test.wav" in args
 
     def test_text_to_audio_empty_text(self, mock_radio):
         """Test text-to-audio with empty text raises error."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
+        broadcaster = Broadcaster(mock_radio)
 
-            with pytest.raises(TTSError, match="Empty text provided"):
-                broadcaster.text_to_audio("")
+        with pytest.raises(TTSError, match="Empty text provided"):
+            broadcaster.text_to_audio("")
 
     def test_play_to_radio_file_not_found(self, mock_radio):
         """Test play_to_radio with non-existent file."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
+        broadcaster = Broadcaster(mock_radio)
 
-            with pytest.raises(AudioDeviceError, match="WAV file not found"):
-                broadcaster.play_to_radio("/nonexistent/file.wav")
+        with pytest.raises(AudioDeviceError, match="WAV file not found"):
+            broadcaster.play_to_radio("/nonexistent/file.wav")
 
-    @patch("src.ft991a.broadcast.sd")
-    @patch("src.ft991a.broadcast.np")
-    def test_play_to_radio_success(self, mock_np, mock_sd, mock_radio, temp_wav_file):
+    def test_play_to_radio_success(self, mock_sd, mock_radio, temp_wav_file):
         """Test successful audio playback to radio."""
-        mock_sd.query_devices.return_value = [
-            {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-        ]
+        numpy = pytest.importorskip("numpy")
 
-        # Mock numpy operations
-        mock_audio_data = Mock()
-        mock_np.frombuffer.return_value = mock_audio_data
-        mock_audio_data.astype.return_value = mock_audio_data
-        mock_np.column_stack.return_value = mock_audio_data
-
-        broadcaster = Broadcaster(mock_radio)
+        with patch("ft991a.broadcast.np", numpy):
+            broadcaster = Broadcaster(mock_radio)
 
-        result = broadcaster.play_to_radio(temp_wav_file)
+            result = broadcaster.play_to_radio(temp_wav_file)
 
         assert result is True
         mock_sd.play.assert_called_once()
 
+        # Mono silence is played as a float32 stereo view over a single sample buffer
+        audio = mock_sd.play.call_args[0][0]
+        assert audio.shape == (48000, 2)
+        assert audio.dtype == numpy.float32
+        assert audio.strides[1] == 0
+        assert not audio.any()
+
     def test_broadcast_without_confirm(self, mock_radio):
         """Test broadcast raises error without confirmation."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-            ]
-
-            broadcaster = Broadcaster(mock_radio)
+        broadcaster = Broadcaster(mock_radio)
 
-            with pytest.raises(ValueError, match="confirm=True is required"):
-                broadcaster.broadcast("Hello world", confirm=False)
+        with pytest.raises(ValueError, match="confirm=True is required"):
+            broadcaster.broadcast("Hello world", confirm=False)
 
-    @patch("src.ft991a.broadcast.sd")
-    def test_broadcast_success(self, mock_sd, mock_radio):
+    def test_broadcast_success(self, mock_radio):
         """Test successful broadcast operation."""
-        mock_sd.query_devices.return_value = [
-            {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-        ]
-
         broadcaster = Broadcaster(mock_radio)
 
         with (
@@ -282,80 +307,193 @@ class TestBroadcaster:
             mock_play.assert_called_once_with("/tmp/test.wav")
             mock_unlink.assert_called_once_with("/tmp/test.wav")
 
-    @patch("src.ft991a.broadcast.sd")
-    def test_record_from_radio_invalid_duration(self, mock_sd, mock_radio):
-        """Test record with invalid duration."""
-        mock_sd.query_devices.return_value = [
-            {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
+    @patch("ft991a.broadcast.pyttsx3", None)
+    def test_broadcast_pipeline_overlap(self, mock_radio):
+        """Test the next sentence is synthesized while the previous one is still playing."""
+        broadcaster = Broadcaster(mock_radio)
+        paths = {"CQ CQ.": "/tmp/first.wav", "This is KO4TUV.": "/tmp/second.wav"}
+        second_synth_started = threading.Event()
+        events = []
+
+        def fake_tts(sentence, voice):
+            events.append(("synth", sentence))
+            if paths[sentence] == "/tmp/second.wav":
+                second_synth_started.set()
+            return paths[sentence]
+
+        def fake_play(wav_path):
+            if wav_path == "/tmp/first.wav":
+                second_synth_started.wait(timeout=2)
+            events.append(("played", wav_path))
+            return True
+
+        with (
+            patch.object(broadcaster, "text_to_audio", side_effect=fake_tts),
+            patch.object(broadcaster, "play_to_radio", side_effect=fake_play) as mock_play,
+            patch("os.unlink") as mock_unlink,
+        ):
+            assert broadcaster.broadcast("CQ CQ.  This is KO4TUV.", confirm=True) is True
+
+        assert events.index(("synth", "This is KO4TUV.")) < events.index(("played", "/tmp/first.wav"))
+        assert [c.args[0] for c in mock_play.call_args_list] == ["/tmp/first.wav", "/tmp/second.wav"]
+        assert mock_unlink.call_count == 2
+
+    @patch("ft991a.broadcast.pyttsx3")
+    def test_broadcast_pyttsx3_synthesizes_on_calling_thread(self, mock_pyttsx3, mock_radio):
+        """Test pyttsx3 renders on the calling thread, each sentence only after the previous one has played."""
+        mock_pyttsx3.init.return_value = Mock()
+        broadcaster = Broadcaster(mock_radio)
+        synth_threads = []
+        events = []
+
+        def fake_tts(sentence, voice):
+            synth_threads.append(threading.current_thread())
+            events.append(("synth", sentence))
+            return f"/tmp/{len(synth_threads)}.wav"
+
+        def fake_play(wav_path):
+            events.append(("played", wav_path))
+            return True
+
+        with (
+            patch.object(broadcaster, "text_to_audio", side_effect=fake_tts),
+            patch.object(broadcaster, "play_to_radio", side_effect=fake_play),
+            patch("os.unlink") as mock_unlink,
+        ):
+            assert broadcaster.broadcast("CQ CQ.  This is KO4TUV.", confirm=True) is True
+
+        assert synth_threads == [threading.current_thread()] * 2
+        assert events == [
+            ("synth", "CQ CQ."),
+            ("played", "/tmp/1.wav"),
+            ("synth", "This is KO4TUV."),
+            ("played", "/tmp/2.wav"),
         ]
+        assert mock_unlink.call_count == 2
 
+    @patch("ft991a.broadcast.pyttsx3")
+    def test_broadcast_pyttsx3_playback_failure_skips_rest(self, mock_pyttsx3, mock_radio):
+        """Test a failed playback on the pyttsx3 path stops before rendering the next sentence."""
+        mock_pyttsx3.init.return_value = Mock()
         broadcaster = Broadcaster(mock_radio)
 
-        with pytest.raises(ValueError, match="Duration must be between 0 and 300"):
-            broadcaster.record_from_radio(-1)
+        with (
+            patch.object(broadcaster, "text_to_audio", return_value="/tmp/1.wav") as mock_tts,
+            patch.object(broadcaster, "play_to_radio", side_effect=AudioDeviceError("unplugged")),
+            patch("os.unlink") as mock_unlink,
+        ):
+            with pytest.raises(BroadcastError, match="unplugged"):
+                broadcaster.broadcast("CQ CQ.  This is KO4TUV.", confirm=True)
+
+        mock_tts.assert_called_once_with("CQ CQ.", "default")
+        mock_unlink.assert_called_once_with("/tmp/1.wav")
+
+    @pytest.mark.parametrize("duration", [-1, 500])
+    def test_record_from_radio_invalid_duration(self, mock_radio, duration):
+        """Test record with invalid duration."""
+        broadcaster = Broadcaster(mock_radio)
 
         with pytest.raises(ValueError, match="Duration must be between 0 and 300"):
-            broadcaster.record_from_radio(500)
+            broadcaster.record_from_radio(duration)
 
-    @patch("src.ft991a.broadcast.sd")
-    @patch("src.ft991a.broadcast.np")
-    def test_record_from_radio_success(self, mock_np, mock_sd, mock_radio):
+    def test_record_from_radio_success(self, mock_sd, mock_radio):
         """Test successful recording from radio."""
-        mock_sd.query_devices.return_value = [
-            {"name": "Test Device", "max_output_channels": 2, "max_input_channels": 2, "default_samplerate": 48000}
-        ]
+        numpy = pytest.importorskip("numpy")
 
-        # Mock recording data
-        mock_recording = Mock()
-        mock_sd.rec.return_value = mock_recording
-        mock_recording_int16 = Mock()
-        mock_recording_int16.tobytes.return_value = b"\x00" * 1000
-        mock_recording.__mul__.return_value.astype.return_value = mock_recording_int16
+        def fake_rec(out, **kwargs):
+            out[:] = 0.5
+            return out
 
-        broadcaster = Broadcaster(mock_radio)
+        mock_sd.rec.side_effect = fake_rec
 
         with (
+            patch("ft991a.broadcast.np", numpy),
             patch("tempfile.NamedTemporaryFile") as mock_temp,
             patch("wave.open") as mock_wave,
             patch("os.path.exists", return_value=True),
             patch("os.path.getsize", return_value=1000),
         ):
 
-            mock_temp.return_value.__enter__.return_value.name = "/tmp/record.wav"
+            mock_temp.return_value.name = "/tmp/record.wav"
             mock_wf = Mock()
             mock_wave.return_value.__enter__.return_value = mock_wf
 
+            broadcaster = Broadcaster(mock_radio)
             result = broadcaster.record_from_radio(5.0)
 
             assert result == "/tmp/record.wav"
             mock_sd.rec.assert_called_once()
             mock_sd.wait.assert_called_once()
 
-    def test_get_audio_devices(self, mock_radio):
-        """Test audio device enumeration."""
-        with patch("src.ft991a.broadcast.sd") as mock_sd:
-            mock_sd.query_devices.return_value = [
-                {
-                    "name": "PCM2903B Audio",
-                    "max_input_channels": 2,
-                    "max_output_channels": 2,
-                    "default_samplerate": 48000,
-                },
-                {
-                    "name": "Built-in Audio",
-                    "max_input_channels": 1,
-                    "max_output_channels": 2,
-                    "default_samplerate": 44100,
-                },
-            ]
+        # 0.5 full scale -> int16 16383 for every sample of both channels
+        frames = mock_wf.writeframes.call_args[0][0]
+        assert len(frames) == 5 * 48000 * 2 * 2
+        assert set(numpy.frombuffer(frames, dtype=numpy.int16)) == {16383}
+
+    def test_record_from_radio_buffer_per_call(self, mock_sd, mock_radio, tmp_path):
+        """Test each recording captures into its own buffer, so concurrent recordings never share samples."""
+        numpy = pytest.importorskip("numpy")
+
+        def fake_rec(out, **kwargs):
+            out[:] = 0.0  # silence
+            return out
+
+        mock_sd.rec.side_effect = fake_rec
 
+        with patch("ft991a.broadcast.np", numpy):
             broadcaster = Broadcaster(mock_radio)
-            devices = broadcaster.get_audio_devices()
+            broadcaster.record_from_radio(1.0, str(tmp_path / "first.wav"))
+            first = mock_sd.rec.call_args.kwargs["out"]
+            broadcaster.record_from_radio(1.0, str(tmp_path / "second.wav"))
+            second = mock_sd.rec.call_args.kwargs["out"]
+
+        assert first.shape == second.shape == (48000, 2)
+        assert not numpy.shares_memory(first, second)
+
+    def test_device_enumeration_cached(self, mock_sd, mock_radio):
+        """Test repeated Broadcaster construction reuses the device enumeration."""
+        mock_sd.query_devices.return_value = [
+            {
+                "name": "USB Audio CODEC",
+                "max_output_channels": 2,
+                "max_input_channels": 2,
+                "default_samplerate": 48000,
+            }
+        ]
 
-            assert "current_device" in devices
-            assert "devices" in devices
-            assert len(devices["devices"]) == 2
-            assert devices["devices"][0]["name"] == "PCM2903B Audio"
+        Broadcaster(mock_radio)
+        Broadcaster(mock_radio)
+        assert mock_sd.query_devices.call_count == 1
+
+        # Hotplug invalidation forces a fresh scan
+        invalidate_device_cache()
+        Broadcaster(mock_radio)
+        assert mock_sd.query_devices.call_count == 2
+
+    def test_get_audio_devices(self, mock_sd, mock_radio):
+        """Test audio device enumeration."""
+        mock_sd.query_devices.return_value = [
+            {
+                "name": "PCM2903B Audio",
+                "max_input_channels": 2,
+                "max_output_channels": 2,
+                "default_samplerate": 48000,
+            },
+            {
+                "name": "Built-in Audio",
+                "max_input_channels": 1,
+                "max_output_channels": 2,
+                "default_samplerate": 44100,
+            },
+        ]
+
+        broadcaster = Broadcaster(mock_radio)
+        devices = broadcaster.get_audio_devices()
+
+        assert "current_device" in devices
+        assert "devices" in devices
+        assert len(devices["devices"]) == 2
+        assert devices["devices"][0]["name"] == "PCM2903B Audio"
 
 
 class TestCleanupFunctions:
@@ -363,31 +501,29 @@ class TestCleanupFunctions:
 
     def test_cleanup_temp_files(self):
         """Test cleanup of old temporary files."""
-        with (
-            patch("pathlib.Path.glob") as mock_glob,
-            patch("pathlib.Path.stat") as mock_stat,
-            patch("pathlib.Path.unlink") as mock_unlink,
-            patch("time.time", return_value=10000),
-        ):  # Current time
 
-            # Create mock old file
-            old_file = Mock()
-            mock_stat_result = Mock()
-            mock_stat_result.st_mtime = 5000  # Old file (1+ hour ago)
-            old_file.stat.return_value = mock_stat_result
+        def entry(name, mtime):
+            dir_entry = Mock()
+            dir_entry.name = name
+            dir_entry.path = f"/tmp/{name}"
+            dir_entry.stat.return_value.st_mtime = mtime
+            return dir_entry
 
-            # Create mock new file
-            new_file = Mock()
-            mock_stat_result2 = Mock()
-            mock_stat_result2.st_mtime = 9500  # Recent file
-            new_file.stat.return_value = mock_stat_result2
+        old_file = entry("tmpold.wav", 5000)  # Old file (1+ hour ago)
+        new_file = entry("tmpnew.wav", 9500)  # Recent file
+        other_file = entry("notes.wav", 5000)  # Not one of ours
 
-            mock_glob.return_value = [old_file, new_file]
+        with (
+            patch("os.scandir") as mock_scandir,
+            patch("os.unlink") as mock_unlink,
+            patch("time.time", return_value=10000),
+        ):  # Current time
+            mock_scandir.return_value.__enter__.return_value = iter([old_file, new_file, other_file])
 
             cleanup_temp_files()
 
-            old_file.unlink.assert_called_once()
-            new_file.unlink.assert_not_called()
+            mock_unlink.assert_called_once_with("/tmp/tmpold.wav")
+            other_file.stat.assert_not_called()
 
 
 if __name__ == "__main__":
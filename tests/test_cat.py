@@ -1,148 +1,228 @@
 #!/usr/bin/env python3
 """
 Unit tests for FT-991A CAT control library.
-Uses mocked serial interface — no physical radio needed.
+Uses a fake serial interface — no physical radio needed.
 """
 
-import os
-import sys
-from unittest.mock import Mock, patch
+from collections import deque
 
 import pytest
+from serial import SerialException
 
-from ft991a.cat import FT991A, Band, Mode, RadioStatus
+from ft991a.cat import CW_MESSAGE_MAX_CHARS, FT991A, Band, Mode, RadioStatus
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+class FakeSerial:
+    """Stand-in for serial.Serial: each read() returns one whole queued response, then b"" (timeout)."""
 
-def make_serial_response(*responses):
-    """Create a mock serial that returns byte-by-byte for read(1), cycling through responses."""
-    all_bytes = []
-    for resp in responses:
-        if isinstance(resp, str):
-            resp = resp.encode("ascii")
-        all_bytes.extend([bytes([b]) for b in resp])
-    # After all responses exhausted, return empty bytes (timeout)
-    all_bytes.extend([b""] * 100)
-    return iter(all_bytes)
+    def __init__(self):
+        self.responses = deque()
+        self.writes = []
+        self.reads = []
+        self.in_waiting = 0
+        self.is_open = False
+        self.open_count = 0
+
+    def open(self, *args, **kwargs):
+        """Replacement for the serial.Serial constructor."""
+        self.open_count += 1
+        self.is_open = True
+        return self
+
+    def queue(self, *responses):
+        self.responses.extend(resp.encode("ascii") for resp in responses)
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return len(data)
+
+    def read(self, size=1):
+        self.reads.append(size)
+        return self.responses.popleft() if self.responses else b""
+
+    def close(self):
+        self.is_open = False
 
 
 class TestFT991A:
 
     @pytest.fixture
-    def mock_serial(self):
-        with patch("ft991a.cat.serial.Serial") as mock_cls:
-            mock_conn = Mock()
-            mock_cls.return_value = mock_conn
-            mock_conn.is_open = True
-            # Default: connect() calls get_frequency_a which sends "FA;" and expects "FA014074000;"
-            mock_conn.read.side_effect = make_serial_response("FA014074000;")
-            yield mock_conn, mock_cls
+    def fake_serial(self, monkeypatch):
+        fake = FakeSerial()
+        # Default: connect() calls get_frequency_a which sends "FA;" and expects "FA014074000;"
+        fake.queue("FA014074000;")
+        monkeypatch.setattr("ft991a.cat.serial.Serial", fake.open)
+        return fake
 
     @pytest.fixture
-    def radio(self, mock_serial):
-        mock_conn, mock_cls = mock_serial
+    def radio(self, fake_serial):
         radio = FT991A(port="/dev/mock", baudrate=38400)
         radio.connect()
         return radio
 
-    def _reset_serial(self, mock_conn, *responses):
-        """Reset mock serial to return new responses."""
-        mock_conn.read.side_effect = make_serial_response(*responses)
+    def _reset_serial(self, fake, *responses):
+        """Replace the queued responses."""
+        fake.responses.clear()
+        fake.queue(*responses)
 
     # --- Init & Connect ---
 
-    def test_initialization(self, mock_serial):
-        mock_conn, mock_cls = mock_serial
+    def test_initialization(self, fake_serial):
         radio = FT991A(port="/dev/ttyUSB0", baudrate=38400)
         assert radio.port == "/dev/ttyUSB0"
         assert radio.baudrate == 38400
 
-    def test_connect_success(self, mock_serial):
-        mock_conn, mock_cls = mock_serial
+    def test_connect_success(self, fake_serial):
         radio = FT991A(port="/dev/mock", baudrate=38400)
         result = radio.connect()
         assert result is True
-        mock_cls.assert_called_once()
+        assert fake_serial.open_count == 1
 
-    def test_connect_failure(self):
-        with patch("ft991a.cat.serial.Serial") as mock_cls:
-            from serial import SerialException
+    def test_connect_failure(self, monkeypatch):
+        def refuse(*args, **kwargs):
+            raise SerialException("Port not found")
 
-            mock_cls.side_effect = SerialException("Port not found")
-            radio = FT991A(port="/dev/nonexistent")
-            result = radio.connect()
-            assert result is False
+        monkeypatch.setattr("ft991a.cat.serial.Serial", refuse)
+        radio = FT991A(port="/dev/nonexistent")
+        result = radio.connect()
+        assert result is False
 
     # --- Frequency ---
 
-    def test_get_frequency(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "FA007074000;")
+    def test_get_frequency(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "FA007074000;")
         freq = radio.get_frequency_a()
         assert freq == 7074000
 
-    def test_set_frequency(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "FA014074000;")
+    def test_set_frequency(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "FA014074000;")
         radio.set_frequency_a(14074000)
-        # Verify write was called with FA command
-        calls = [c for c in mock_conn.write.call_args_list if b"FA" in c[0][0]]
-        assert len(calls) > 0
+        # Verify the FA command was written
+        assert [w for w in fake_serial.writes if b"FA" in w]
+        assert fake_serial.writes[-1] == b"FA014074000;"
+
+    def test_response_read_in_bulk(self, radio, fake_serial):
+        fake_serial.reads.clear()
+        fake_serial.in_waiting = 12
+        self._reset_serial(fake_serial, "FA007074000;")
+        assert radio.get_frequency_a() == 7074000
+        assert fake_serial.reads == [12]
 
     # --- Mode ---
 
-    def test_get_mode(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "MD02;")
+    def test_get_mode(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "MD02;")
         mode = radio.get_mode()
         assert mode is not None
 
-    def test_set_mode(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "MD0C;")
+    def test_set_mode(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "MD0C;")
         radio.set_mode(Mode.USB)
-        calls = [c for c in mock_conn.write.call_args_list if b"MD" in c[0][0]]
-        assert len(calls) > 0
+        assert [w for w in fake_serial.writes if b"MD" in w]
 
     # --- Power ---
 
-    def test_set_tx_power(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "PC050;")
+    def test_set_tx_power(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "PC050;")
         radio.set_power_level(50)
-        mock_conn.write.assert_called()
+        assert fake_serial.writes[-1] == b"PC050;"
 
     # --- S-Meter ---
 
-    def test_get_smeter(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "SM0120;")
+    def test_get_smeter(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "SM0120;")
         level = radio.get_s_meter()
         assert isinstance(level, int)
 
+    def test_tune_and_read_smeter(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "SM0087;")
+        assert radio.tune_and_read_s_meter(14074000) == 87
+        assert fake_serial.writes[-1] == b"FA014074000;SM0;"
+
+    def test_read_smeter_and_tune(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "SM0042;")
+        assert radio.read_s_meter_and_tune(14079000) == 42
+        assert fake_serial.writes[-1] == b"SM0;FA014079000;"
+
+        self._reset_serial(fake_serial, "SM0017;")
+        assert radio.read_s_meter_and_tune() == 17
+        assert fake_serial.writes[-1] == b"SM0;"
+
+    # --- CW Keyer ---
+
+    def test_set_key_speed(self, radio, fake_serial):
+        self._reset_serial(fake_serial)
+        radio.set_key_speed(25)
+        assert fake_serial.writes[-1] == b"KS025;"
+
+        # Clamped to the keyer's 4-60 WPM range
+        radio.set_key_speed(2)
+        assert fake_serial.writes[-1] == b"KS004;"
+        radio.set_key_speed(99)
+        assert fake_serial.writes[-1] == b"KS060;"
+
+    def test_send_cw_message(self, radio, fake_serial):
+        self._reset_serial(fake_serial)
+        radio.send_cw_message("CQ CQ DE KO4TUV")
+        # Loaded into text keyer memory 1, then played with KY6 in the same write
+        assert fake_serial.writes[-1] == b"KM1CQ CQ DE KO4TUV;KY6;"
+
+        radio.send_cw_message("TEST", channel=5)
+        assert fake_serial.writes[-1] == b"KM5TEST;KYA;"
+
+    def test_send_cw_message_rejects_bad_input(self, radio, fake_serial):
+        fake_serial.writes.clear()
+        with pytest.raises(ValueError):
+            radio.send_cw_message("E" * (CW_MESSAGE_MAX_CHARS + 1))
+        with pytest.raises(ValueError):
+            radio.send_cw_message("TEST", channel=6)
+        assert fake_serial.writes == []
+
+    # --- Status ---
+
+    def test_get_status_single_exchange(self, radio, fake_serial):
+        fake_serial.writes.clear()
+        info = "IF001014074000+0000" + "00C0" + "1" + "000;"  # Squelch flag at index 23
+        self._reset_serial(fake_serial, "FA014074000;FB007074000;MD0C;TX0;" + info + "SM0045;PC050;RM2012;")
+        status = radio.get_status()
+        assert fake_serial.writes == [b"FA;FB;MD0;TX;IF;SM0;PC;RM2;"]
+        assert status == RadioStatus(
+            frequency_a=14074000,
+            frequency_b=7074000,
+            mode="DATA_USB",
+            tx_active=False,
+            squelch_open=True,
+            s_meter=45,
+            power_output=50,
+            swr=12,
+        )
+
+    def test_get_status_missing_answers(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "FA014074000;FB0070")  # Radio stops answering mid-batch
+        status = radio.get_status()
+        assert status.frequency_a == 14074000
+        assert status.frequency_b == 0
+        assert status.mode == "UNKNOWN"
+        assert status.s_meter == 0
+
     # --- PTT ---
 
-    def test_ptt_on(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "TX1;")
+    def test_ptt_on(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "TX1;")
         radio.ptt_on()
-        calls = mock_conn.write.call_args_list
-        written = b"".join(c[0][0] for c in calls)
+        written = b"".join(fake_serial.writes)
         assert b"TX" in written
 
-    def test_ptt_off(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
-        self._reset_serial(mock_conn, "TX0;")
+    def test_ptt_off(self, radio, fake_serial):
+        self._reset_serial(fake_serial, "TX0;")
         radio.ptt_off()
-        mock_conn.write.assert_called()
+        assert fake_serial.writes[-1] == b"TX0;"
 
     # --- Disconnect ---
 
-    def test_disconnect(self, radio, mock_serial):
-        mock_conn, _ = mock_serial
+    def test_disconnect(self, radio, fake_serial):
         radio.disconnect()
-        mock_conn.close.assert_called()
+        assert fake_serial.is_open is False
 
     # --- Enums ---
 
@@ -157,6 +237,11 @@ class TestFT991A:
     def test_band_enum_values(self):
         assert len(Band) > 0
 
+    def test_enum_members_compare_to_values(self):
+        assert Mode.USB == "2"
+        assert Mode("C") is Mode.DATA_USB
+        assert Band.HF_20M == 14_000_000
+
 
 class TestRadioStatus:
     def test_radio_status_creation(self):
@@ -5,27 +5,25 @@ Tests for CW (Morse Code) Module
 Comprehensive testing of CW encoding, decoding, and keying functionality.
 """
 
-import os
-import sys
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
+from ft991a.cat import FT991A
 from ft991a.cw import (
     MORSE_TABLE,
     REVERSE_MORSE_TABLE,
     CWDecoder,
     CWKeyer,
     CWTiming,
+    _keying_schedule,
     decode_morse_to_text,
     encode_text_to_morse,
     morse_to_text,
     text_to_morse,
 )
 
-# Add the src directory to the path for importing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
 class TestMorseEncoding:
     """Test Morse code encoding functionality"""
@@ -53,6 +51,7 @@ class TestMorseEncoding:
         assert text_to_morse("<SK>") == "...-.-"
         assert text_to_morse("<KA>") == "-.-.-"
         assert text_to_morse("<SN>") == "...-."
+        assert text_to_morse("tu <sk> <KA>k") == "- ..-  ...-.-  -.-.- -.-"
 
     def test_word_separation(self):
         """Test proper word separation in Morse"""
@@ -80,6 +79,15 @@ class TestMorseEncoding:
         assert ".-" in result  # A should be encoded
         assert "-..." in result  # B should be encoded
 
+    def test_encoding_is_memoized(self):
+        """Test repeated messages are served from the encode cache"""
+        text_to_morse.cache_clear()
+        for _ in range(3):
+            assert text_to_morse("CQ CQ DE W1ABC") == "-.-. --.-  -.-. --.-  -.. .  .-- .---- .- -... -.-."
+        info = text_to_morse.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestMorseDecoding:
     """Test Morse code decoding functionality"""
@@ -164,6 +172,12 @@ class TestCWTiming:
         timing_40 = CWTiming.from_wpm(40)
         assert timing_40.dit_ms == 30.0  # 1200/40 = 30ms
 
+    def test_timing_is_cached(self):
+        """Test each WPM maps to one shared, immutable timing object"""
+        assert CWTiming.from_wpm(18) is CWTiming.from_wpm(18)
+        with pytest.raises(AttributeError):
+            CWTiming.from_wpm(18).dit_ms = 1.0
+
     def test_wpm_validation(self):
         """Test WPM range validation"""
         with pytest.raises(ValueError, match="WPM must be between 5 and 40"):
@@ -178,14 +192,23 @@ class TestCWTiming:
         CWTiming.from_wpm(20)  # Middle
 
 
+@pytest.fixture(scope="class")
+def shared_radio():
+    """One spec'd mock radio shared by every keyer test in a class"""
+    radio = Mock(spec=FT991A)
+    radio.ptt_on.return_value = True
+    radio.ptt_off.return_value = True
+    return radio
+
+
 class TestCWKeyer:
     """Test CW keyer functionality"""
 
-    def setup_method(self):
-        """Set up mock radio for each test"""
-        self.mock_radio = Mock()
-        self.mock_radio.ptt_on.return_value = True
-        self.mock_radio.ptt_off.return_value = True
+    @pytest.fixture(autouse=True)
+    def _radio(self, shared_radio):
+        """Hand each test the shared radio with its call history cleared"""
+        shared_radio.reset_mock()
+        self.mock_radio = shared_radio
 
     def test_keyer_initialization(self):
         """Test keyer initialization"""
@@ -237,6 +260,38 @@ class TestCWKeyer:
         self.mock_radio.ptt_on.assert_called_once()
         self.mock_radio.ptt_off.assert_called_once()
 
+    @patch("time.sleep")
+    @patch("time.monotonic")
+    def test_element_deadlines_absorb_overshoot(self, mock_monotonic, mock_sleep):
+        """Test a late element start is taken out of the next element, not added to the message"""
+        keyer = CWKeyer(self.mock_radio, wpm=20)  # 60ms dit and element gap
+        mock_monotonic.side_effect = [100.0, 100.070, 100.500]  # Dit woke 10ms late, then a 380ms stall
+
+        keyer._send_dit()
+        keyer._element_gap()
+        keyer._send_dit()
+
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        assert sleeps[0] == 0.060
+        assert sleeps[1] == pytest.approx(0.050)  # Ends on the 120ms deadline
+        assert sleeps[2] == 0.060  # Too far behind to catch up: full-length dit
+
+    def test_keying_schedule(self):
+        """Test a message flattens into key-down/key-up steps with the right durations"""
+        timing = CWTiming.from_wpm(20)  # 60ms dit
+
+        schedule = _keying_schedule(".- -  -", timing)
+        assert schedule == (
+            (True, 60.0),  # dit
+            (False, 60.0),  # element gap
+            (True, 180.0),  # dah
+            (False, 180.0),  # letter gap
+            (True, 180.0),  # dah
+            (False, 240.0),  # word gap on top of the letter gap
+            (True, 180.0),  # dah
+        )
+        assert _keying_schedule(".- -  -", timing) is schedule
+
     @patch("time.sleep")
     def test_morse_code_transmission(self, mock_sleep):
         """Test transmission of simple Morse code"""
@@ -275,6 +330,52 @@ class TestCWKeyer:
         assert not keyer._is_keying
         self.mock_radio.ptt_off.assert_called()
 
+    def test_emergency_stop_always_unkeys(self):
+        """Test emergency stop sends TX0 even when the keyer believes it is idle"""
+        keyer = CWKeyer(self.mock_radio, wpm=20)
+
+        keyer.emergency_stop()
+        self.mock_radio.ptt_off.assert_called_once()
+        assert not keyer._is_keying
+
+    @patch("time.sleep")
+    def test_emergency_stop_aborts_keying(self, mock_sleep):
+        """Test emergency stop from another thread abandons the message being keyed"""
+        keyer = CWKeyer(self.mock_radio, wpm=20)
+        keyed = threading.Event()
+        release = threading.Event()
+
+        def slow_sleep(seconds):
+            keyed.set()
+            release.wait(1)
+
+        mock_sleep.side_effect = slow_sleep
+
+        keyer.send_morse_code("... --- ...", wait=False)
+        assert keyed.wait(1)  # Worker is holding the first dit
+        keyer.emergency_stop()
+        release.set()
+        keyer.send_morse_code("")  # Returns once the worker has dropped the aborted message
+
+        assert self.mock_radio.ptt_on.call_count == 1
+        assert not keyer._is_keying
+
+    def test_buffered_text_uses_internal_keyer(self):
+        """Test buffered text goes out as keyer-memory chunks without per-element PTT"""
+        keyer = CWKeyer(self.mock_radio, wpm=20)
+
+        assert keyer.send_text_buffered("cq  cq de ko4tuv") == 1
+        self.mock_radio.set_key_speed.assert_called_once_with(20)
+        self.mock_radio.send_cw_message.assert_called_once_with("CQ CQ DE KO4TUV")
+        self.mock_radio.ptt_on.assert_not_called()
+
+        self.mock_radio.send_cw_message.reset_mock()
+        keyer.send_text("TEST " * 20, batched=True)
+        chunks = [c.args[0] for c in self.mock_radio.send_cw_message.call_args_list]
+        assert len(chunks) == 2
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert " ".join(chunks) == ("TEST " * 20).strip()
+
     @patch("time.sleep")
     def test_exception_handling(self, mock_sleep):
         """Test that exceptions during keying result in unkeyed state"""
@@ -291,7 +392,7 @@ class TestCWKeyer:
 
 
 class TestCWDecoder:
-    """Test CW decoder (placeholder functionality)"""
+    """Test CW decoder"""
 
     def test_decoder_initialization(self):
         """Test decoder initialization"""
@@ -311,13 +412,50 @@ class TestCWDecoder:
         assert not decoder._enabled
 
     def test_audio_buffer_processing(self):
-        """Test audio buffer processing (placeholder)"""
+        """Test audio buffer processing of a buffer too short to hold CW"""
         decoder = CWDecoder()
 
-        # Should return None for placeholder implementation
+        # Shorter than one detection block
         result = decoder.decode_audio_buffer([0.1, 0.2, 0.3, 0.4])
         assert result is None
 
+    @staticmethod
+    def _keyed_tone(morse, wpm=20, sample_rate=8000, tone_freq=600):
+        """Synthesize keyed audio for a Morse string with 100 ms of silence either side"""
+        np = pytest.importorskip("numpy")
+        timing = CWTiming.from_wpm(wpm)
+        lead = np.zeros(sample_rate // 10)
+        pieces = [lead]
+        for i, symbol in enumerate(morse):
+            if symbol == " ":
+                if i and morse[i - 1] == " ":
+                    gap_ms = timing.word_gap_ms - timing.letter_gap_ms
+                else:
+                    gap_ms = timing.letter_gap_ms - timing.element_gap_ms
+                pieces.append(np.zeros(int(sample_rate * gap_ms / 1000)))
+                continue
+            mark_ms = timing.dah_ms if symbol == "-" else timing.dit_ms
+            t = np.arange(int(sample_rate * mark_ms / 1000)) / sample_rate
+            pieces.append(0.5 * np.sin(2 * np.pi * tone_freq * t))
+            pieces.append(np.zeros(int(sample_rate * timing.element_gap_ms / 1000)))
+        pieces.append(lead)
+        return np.concatenate(pieces)
+
+    @pytest.mark.parametrize("text", ["SOS", "CQ DE KO4TUV", "O"])
+    def test_decode_keyed_tone(self, text):
+        """Test Goertzel decoding of a synthesized keyed tone"""
+        morse = text_to_morse(text)
+        decoder = CWDecoder(sample_rate=8000, tone_freq=600)
+
+        decoded = decoder.decode_audio_buffer_fast(self._keyed_tone(morse))
+        assert decoded == morse
+        assert morse_to_text(decoded) == text
+
+    def test_decode_ignores_off_frequency_tone(self):
+        """Test a tone far from tone_freq is not decoded"""
+        decoder = CWDecoder(sample_rate=8000, tone_freq=600)
+        assert decoder.decode_audio_buffer_fast(self._keyed_tone("... --- ...", tone_freq=1500)) is None
+
     def test_decoder_stats(self):
         """Test decoder statistics"""
         decoder = CWDecoder(sample_rate=12000, tone_freq=800)
@@ -371,6 +509,11 @@ class TestMorseTable:
                 assert morse in REVERSE_MORSE_TABLE
                 assert REVERSE_MORSE_TABLE[morse] == char
 
+    def test_reverse_table_is_read_only(self):
+        """Test the reverse table can't be mutated behind the decode cache"""
+        with pytest.raises(TypeError):
+            REVERSE_MORSE_TABLE["........"] = "#"
+
     def test_no_duplicate_morse_codes(self):
         """Test that no two characters have the same Morse code"""
         morse_codes = []
@@ -4,8 +4,6 @@ Unit tests for FT-991A Digital Modes module.
 Tests digital mode configuration, audio device detection, and WSJT-X config generation.
 """
 
-import os
-import sys
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -14,8 +12,6 @@ import pytest
 from ft991a.cat import Mode, RadioStatus
 from ft991a.digital import DigitalModes
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
 class TestDigitalModes:
 
@@ -144,19 +140,18 @@ class TestDigitalModes:
         """Test audio device detection via /proc/asound/cards"""
         mock_data = " 0 [CODEC   ]: USB Audio CODEC - C-Media USB Audio Device\n"
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.read_text", return_value=mock_data):
-                device = digital_modes.get_audio_device()
+        with patch("ft991a.digital._read_asound_cards", return_value=mock_data):
+            device = digital_modes.get_audio_device()
 
-                assert device is not None
-                assert device["card"] == "0"
-                assert device["device"] == "0"
-                assert "USB Audio CODEC" in device["name"]
-                assert device["alsa_name"] == "plughw:0,0"
+            assert device is not None
+            assert device["card"] == "0"
+            assert device["device"] == "0"
+            assert "USB Audio CODEC" in device["name"]
+            assert device["alsa_name"] == "plughw:0,0"
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_get_audio_device_arecord(self, mock_exists, mock_run, digital_modes):
+    @patch("ft991a.digital._read_asound_cards", return_value="")
+    def test_get_audio_device_arecord(self, mock_cards, mock_run, digital_modes):
         """Test audio device detection via arecord command"""
         # Mock arecord output
         mock_run.return_value.returncode = 0
@@ -170,8 +165,8 @@ class TestDigitalModes:
         assert "USB Audio CODEC" in device["name"]
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_get_audio_device_pulseaudio(self, mock_exists, mock_run, digital_modes):
+    @patch("ft991a.digital._read_asound_cards", return_value="")
+    def test_get_audio_device_pulseaudio(self, mock_cards, mock_run, digital_modes):
         """Test audio device detection via PulseAudio"""
         # Mock failed arecord, successful pactl
         mock_run.side_effect = [
@@ -186,8 +181,8 @@ class TestDigitalModes:
         assert device["pulse_name"] == "alsa_input.usb-C-Media_Electronics_Inc._USB_Audio_Device-00.analog-stereo"
 
     @patch("subprocess.run")
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_get_audio_device_not_found(self, mock_exists, mock_run, digital_modes):
+    @patch("ft991a.digital._read_asound_cards", return_value="")
+    def test_get_audio_device_not_found(self, mock_cards, mock_run, digital_modes):
         """Test when no audio device is found"""
         # Mock all detection methods failing
         mock_run.return_value.returncode = 1
@@ -195,6 +190,24 @@ class TestDigitalModes:
         device = digital_modes.get_audio_device()
         assert device is None
 
+    @patch("subprocess.run")
+    @patch("ft991a.digital._read_asound_cards", return_value="")
+    def test_get_audio_device_cached(self, mock_cards, mock_run, digital_modes):
+        """Test audio device detection runs once until refreshed or invalidated"""
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "card 1: CODEC [USB Audio CODEC], device 0: USB Audio [USB Audio]"
+
+        first = digital_modes.get_audio_device()
+        assert digital_modes.get_audio_device() is first
+        assert mock_run.call_count == 1
+
+        digital_modes.get_audio_device(refresh=True)
+        assert mock_run.call_count == 2
+
+        digital_modes.invalidate_audio_device()
+        digital_modes.get_audio_device()
+        assert mock_run.call_count == 3
+
     @patch("pathlib.Path.mkdir")
     def test_create_wsjtx_config(self, mock_mkdir, digital_modes, mock_radio):
         """Test WSJT-X configuration file generation"""
@@ -208,6 +221,13 @@ class TestDigitalModes:
                 # Verify file was opened for writing
                 mock_file.assert_called_once()
 
+                # Whole config goes out in one write
+                mock_file().write.assert_called_once()
+                written = mock_file().write.call_args.args[0]
+                assert written.startswith("[Configuration]\n")
+                assert "MyCall=KO4TUV\n" in written
+                assert "MyGrid=EM75\n" in written
+
                 # Verify config directory creation
                 mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
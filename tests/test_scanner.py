@@ -1,65 +1,105 @@
 #!/usr/bin/env python3
 """
 Unit tests for FT-991A Band Scanner module.
-Uses mocked radio interface — no physical radio needed.
+Uses a fake radio interface — no physical radio needed.
 """
 
-import os
-import sys
 import time
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from ft991a.cat import FT991A
+from ft991a.cat import FT991A, Mode
 from ft991a.scanner import ActivityResult, BandScanner, ScanResult
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+class FakeRadio:
+    """Stand-in for the FT991A methods the scanner uses; records calls and replays scripted S-meter readings."""
+
+    def __init__(self, frequency_a=14074000, mode="DATA_USB", s_meter=25):
+        self.frequency_a = frequency_a  # Default FT8 frequency
+        self.mode = mode
+        self.s_meter = s_meter  # Default S-meter reading
+        self.s_meter_script = []  # Scan-step readings to return first, in order
+        self.calls = []
+
+    def called(self, name):
+        """Argument tuples of every call to `name`, in order."""
+        return [tuple(args) for method, *args in self.calls if method == name]
+
+    def get_frequency_a(self):
+        self.calls.append(("get_frequency_a",))
+        return self.frequency_a
+
+    def set_frequency_a(self, freq_hz):
+        self.calls.append(("set_frequency_a", freq_hz))
+        self.frequency_a = freq_hz
+
+    def get_mode(self):
+        self.calls.append(("get_mode",))
+        return self.mode
+
+    def set_mode(self, mode):
+        self.calls.append(("set_mode", mode))
+        self.mode = mode.name
+
+    def get_s_meter(self):
+        self.calls.append(("get_s_meter",))
+        return self.s_meter
+
+    def tune_and_read_s_meter(self, freq_hz):
+        self.calls.append(("tune_and_read_s_meter", freq_hz))
+        self.frequency_a = freq_hz
+        return self.s_meter
+
+    def read_s_meter_and_tune(self, next_freq_hz=None):
+        self.calls.append(("read_s_meter_and_tune", next_freq_hz))
+        reading = self.s_meter_script.pop(0) if self.s_meter_script else self.s_meter
+        if next_freq_hz is not None:
+            self.frequency_a = next_freq_hz
+        return reading
 
 
 class TestBandScanner:
 
     @pytest.fixture
     def mock_radio(self):
-        """Create a mocked radio for testing."""
-        radio = Mock(spec=FT991A)
-        radio.get_frequency_a.return_value = 14074000  # Default FT8 frequency
-        radio.get_mode.return_value = "DATA_USB"
-        radio.get_s_meter.return_value = 25  # Default S-meter reading
-        return radio
+        """Create a fake radio for testing."""
+        return FakeRadio()
 
     @pytest.fixture
     def scanner(self, mock_radio):
-        """Create scanner with mocked radio."""
+        """Create scanner with fake radio."""
         return BandScanner(mock_radio)
 
     def test_init(self, mock_radio):
         """Test scanner initialization."""
         scanner = BandScanner(mock_radio)
-        assert scanner.radio == mock_radio
+        assert scanner.radio is mock_radio
         assert scanner._original_frequency is None
         assert scanner._original_mode is None
 
     def test_save_restore_radio_state(self, scanner, mock_radio):
         """Test radio state save/restore functionality."""
-        mock_radio.get_frequency_a.return_value = 14074000
-        mock_radio.get_mode.return_value = "DATA_USB"
-
         scanner._save_radio_state()
         assert scanner._original_frequency == 14074000
         assert scanner._original_mode == "DATA_USB"
 
+        mock_radio.frequency_a = 7074000
+        mock_radio.mode = "LSB"
+
         # Restore should set frequency and mode back
         scanner._restore_radio_state()
-        mock_radio.set_frequency_a.assert_called_with(14074000)
-        # Mode restoration requires enum conversion - just check it was called
-        assert mock_radio.set_mode.called
+        assert mock_radio.frequency_a == 14074000
+        # Mode name is converted back to the enum
+        assert mock_radio.called("set_mode") == [(Mode.DATA_USB,)]
+        assert mock_radio.mode == "DATA_USB"
 
     @patch("time.sleep")  # Mock sleep to speed up tests
     def test_scan_band_basic(self, mock_sleep, scanner, mock_radio):
         """Test basic band scanning functionality."""
         # Set up mock S-meter readings that vary
-        mock_radio.get_s_meter.side_effect = [10, 25, 45, 30, 15]
+        mock_radio.s_meter_script = [10, 25, 45, 30, 15]
 
         results = scanner.scan_band(14000000, 14020000, 5000, dwell_ms=100)
 
@@ -73,9 +113,10 @@ class TestBandScanner:
             assert freq == expected_freqs[i]
             assert s_meter == expected_s_meters[i]
 
-        # Verify radio was tuned to each frequency
-        expected_calls = [call(freq) for freq in expected_freqs]
-        mock_radio.set_frequency_a.assert_has_calls(expected_calls)
+        # Verify radio was tuned to each frequency: the first directly, the rest with the previous reading
+        assert mock_radio.called("tune_and_read_s_meter") == [(14000000,)]
+        expected_calls = [(freq,) for freq in expected_freqs[1:]] + [(None,)]
+        assert mock_radio.called("read_s_meter_and_tune") == expected_calls
 
         # Verify sleep was called with correct dwell time
         assert mock_sleep.call_count == 5
@@ -86,6 +127,13 @@ class TestBandScanner:
         results = scanner.scan_band(14010000, 14005000, 5000)  # end < start
         assert len(results) == 0
 
+    @pytest.mark.parametrize("step_hz", [0, -5000])
+    def test_scan_band_rejects_non_positive_step(self, scanner, mock_radio, step_hz):
+        """Test a zero or negative step is refused instead of sweeping forever"""
+        with pytest.raises(ValueError, match="step_hz"):
+            scanner.scan_band(14000000, 14020000, step_hz)
+        assert mock_radio.calls == []
+
     @patch("ft991a.scanner.BandScanner.scan_band")
     def test_find_activity(self, mock_scan_band, scanner):
         """Test activity detection functionality."""
@@ -111,6 +159,7 @@ class TestBandScanner:
         assert active[1].s_meter == 70
         assert active[2].frequency_hz == 3600000
         assert active[2].s_meter == 80
+        assert [result.s_level_text for result in active] == ["S2", "S2", "S2"]
 
         # Check frequency MHz conversion
         assert abs(active[0].frequency_mhz - 1.8) < 0.001
@@ -156,6 +205,39 @@ class TestBandScanner:
         assert activity[0].frequency_hz == 1800000
         assert activity[1].frequency_hz == 1850000
 
+    @patch("time.sleep")
+    def test_scan_all_hf_restores_state_once(self, mock_sleep, scanner, mock_radio):
+        """Test a multi-band sweep saves and restores the VFO/mode once, not per band"""
+        scanner.scan_all_hf()
+
+        assert len(mock_radio.called("get_mode")) == 1
+        assert mock_radio.called("set_mode") == [(Mode.DATA_USB,)]
+        assert mock_radio.calls[-2:] == [("set_frequency_a", 14074000), ("set_mode", Mode.DATA_USB)]  # Back home
+
+    def test_plan_hf_sweep(self, scanner, mock_radio):
+        """Test the sweep plan counts steps per band without using the radio"""
+        plan = scanner.plan_hf_sweep(step_hz=10000, dwell_ms=150)
+
+        assert list(plan) == list(scanner.HF_BAND_NAMES)
+        assert plan["20m"] == (36, pytest.approx(5.4))  # 14.000-14.350 MHz in 10 kHz steps
+        assert sum(steps for steps, _ in plan.values()) == scanner._total_scan_steps(10000)
+        assert mock_radio.calls == []
+
+    @patch("time.sleep")
+    def test_scanner_uses_only_ft991a_api(self, mock_sleep):
+        """Test a full sweep against a spec'd FT991A mock, so only real radio methods are used"""
+        radio = Mock(spec=FT991A)
+        radio.get_frequency_a.return_value = 14074000
+        radio.get_mode.return_value = "DATA_USB"
+        radio.tune_and_read_s_meter.return_value = 25
+        radio.read_s_meter_and_tune.return_value = 25
+        scanner = BandScanner(radio)
+
+        activity = scanner.scan_all_hf()
+
+        assert len(activity) == scanner._total_scan_steps(10000)
+        radio.set_mode.assert_called_once_with(Mode.DATA_USB)
+
     def test_format_scan_results_empty(self, scanner):
         """Test formatting empty scan results."""
         result = scanner.format_scan_results([], "Test Results")
@@ -201,6 +283,9 @@ class TestBandScanner:
         assert scanner._s_meter_to_units(56) == 2  # 56 // 28 = 2
         assert scanner._s_meter_to_units(84) == 3  # 84 // 28 = 3
         assert scanner._s_meter_to_units(255) == 9  # S9 maximum
+        assert scanner._s_meter_to_units(-5) == 0  # Out-of-range readings clamp
+        assert scanner._s_meter_to_units(300) == 9
+        assert [scanner._s_meter_to_units(raw) for raw in range(256)] == [min(9, raw // 28) for raw in range(256)]
 
     def test_hf_voice_bands_constant(self, scanner):
         """Test that HF_VOICE_BANDS constant is properly defined."""
@@ -220,12 +305,15 @@ class TestBandScanner:
         assert (14_000_000, 14_350_000) in bands  # 20m
         assert (28_000_000, 29_700_000) in bands  # 10m
 
+        assert len(scanner.HF_BAND_NAMES) == len(bands)
+        assert scanner._total_scan_steps(10000) == sum((end - start) // 10000 + 1 for start, end in bands)
+
     @patch("time.sleep")
     def test_keyboard_interrupt_handling(self, mock_sleep, scanner, mock_radio):
         """Test that KeyboardInterrupt is handled gracefully during scanning."""
         # Make sleep raise KeyboardInterrupt after first call
         mock_sleep.side_effect = [None, KeyboardInterrupt()]
-        mock_radio.get_s_meter.side_effect = [25, 30]
+        mock_radio.s_meter_script = [25, 30]
 
         results = scanner.scan_band(14000000, 14010000, 5000)
 